@@ -0,0 +1,98 @@
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from advent.parallel import TaskResult
+from advent.runner import PARTS, load_day, parse, quiet, solve
+
+Line = dict[str, Any]
+
+
+def input_files(directory: Path) -> list[Path]:
+    """Files of the directory, hidden ones excluded."""
+    return sorted(
+        p for p in directory.iterdir() if p.is_file() and not p.name.startswith(".")
+    )
+
+
+def solve_parts(day_num: int, text: str) -> list[TaskResult]:
+    """Both parts on a single parse of the text, the parse time counts in the first part."""
+    day_module = load_day(day_num)
+    start_t = time.perf_counter()
+    with quiet():
+        try:
+            parsed = parse(day_module, text)
+        except Exception as e:
+            elapsed = time.perf_counter() - start_t
+            return [TaskResult(day_num, part, None, elapsed, repr(e)) for part in PARTS]
+
+        results = []
+        for part in PARTS:
+            try:
+                answer = solve(day_module, part, parsed)
+            except Exception as e:
+                elapsed = time.perf_counter() - start_t
+                results.append(TaskResult(day_num, part, None, elapsed, repr(e)))
+            else:
+                elapsed = time.perf_counter() - start_t
+                results.append(TaskResult(day_num, part, answer, elapsed))
+            start_t = time.perf_counter()
+    return results
+
+
+def solve_file(
+    day_num: int, path: Path, timeout: Optional[float], max_mem: Optional[int]
+) -> Line:
+    """Both parts of a day on one input file, as a JSON-able line."""
+    line: Line = {"input": str(path), "day": day_num}
+    try:
+        text = path.read_text()
+    except (OSError, UnicodeDecodeError) as e:
+        results = [TaskResult(day_num, part, None, 0.0, repr(e)) for part in PARTS]
+    else:
+        if timeout is None and max_mem is None:
+            results = solve_parts(day_num, text)
+        else:
+            from advent.supervisor import run_supervised
+
+            results = [
+                run_supervised(day_num, part, text, timeout, max_mem) for part in PARTS
+            ]
+
+    for result in results:
+        d = result.to_dict()
+        line[result.part] = {k: d[k] for k in ("answer", "elapsed", "error")}
+    return line
+
+
+def run_batch(
+    day_num: int,
+    paths: list[Path],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> Iterator[Line]:
+    """Solve every input on a process pool, yielding their lines as they complete.
+
+    With a timeout or a memory limit, like run_all, each part gets its own supervised
+    process instead.
+    """
+    pool: Executor
+    if timeout is None and max_mem is None:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+    else:
+        pool = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+
+    with pool:
+        futures = [
+            pool.submit(solve_file, day_num, path, timeout, max_mem) for path in paths
+        ]
+        for future in as_completed(futures):
+            yield future.result()
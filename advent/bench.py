@@ -0,0 +1,122 @@
+import math
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from advent import metrics
+from advent.memory import format_bytes, measure_part
+from advent.runner import Part, input_hash, load_day, quiet, run_part
+
+
+def percentile(times: list[float], pct: float) -> float:
+    """Nearest-rank percentile, pct in [0, 100]."""
+    ordered = sorted(times)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    mean = statistics.fmean(times)
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "p95": percentile(times, 95),
+        "mean": mean,
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ops_per_sec": 1 / mean if mean > 0 else math.inf,
+    }
+
+
+def interpreter() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+@dataclass
+class BenchResult:
+    day: int
+    part: Part
+    answer: Any
+    input_hash: str
+    runs: int
+    warmup: int
+    times: list[float] = field(repr=False)
+    interpreter: str = field(default_factory=interpreter)
+    # peak_traced, max_rss and top allocation sites, see advent.memory
+    memory: Optional[dict[str, Any]] = None
+    # Counters recorded by the part during the first warmup run, see advent.metrics
+    metrics: Optional[dict[str, Any]] = None
+
+    @property
+    def stats(self) -> dict[str, float]:
+        return summarize(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        d = asdict(self)
+        # Keep the JSON valid for answers that aren't plain numbers
+        if not isinstance(self.answer, (int, float)):
+            d["answer"] = str(self.answer)
+        d["stats"] = self.stats
+        return d
+
+
+def bench_part(
+    day_num: int, part: Part, text: str, runs: int = 10, warmup: int = 1
+) -> BenchResult:
+    """Run a part `warmup` times untimed, then `runs` times timed.
+
+    The first warmup run also collects the metrics of the part, not to slow down the
+    timed ones.
+    """
+    assert runs > 0
+
+    day_module = load_day(day_num)
+    answer = None
+    recorded = None
+    times = []
+    with quiet():
+        for i in range(warmup):
+            if i == 0:
+                with metrics.collecting() as recorded:
+                    answer = run_part(day_module, part, text)
+            else:
+                answer = run_part(day_module, part, text)
+
+        for _ in range(runs):
+            start_t = time.perf_counter()
+            answer = run_part(day_module, part, text)
+            times.append(time.perf_counter() - start_t)
+
+    return BenchResult(
+        day_num, part, answer, input_hash(text), runs, warmup, times, metrics=recorded
+    )
+
+
+def add_memory(result: BenchResult, text: str) -> None:
+    """Measure the memory of the part in its own process, that's one more run."""
+    report = measure_part(result.day, result.part, text)
+    result.memory = {
+        "peak_traced": report.peak_traced,
+        "max_rss": report.max_rss,
+        "top": report.top,
+    }
+
+
+def format_result(result: BenchResult) -> str:
+    s = result.stats
+    out = (
+        f"day{result.day:02} {result.part:<6} {str(result.answer):>16}  "
+        f"min={s['min']:.4f}s median={s['median']:.4f}s p95={s['p95']:.4f}s "
+        f"stddev={s['stddev']:.4f}s ops/s={s['ops_per_sec']:.2f}"
+    )
+    if result.memory is not None:
+        out += (
+            f" peak={format_bytes(result.memory['peak_traced'])}"
+            f" rss={format_bytes(result.memory['max_rss'])}"
+        )
+    if result.metrics:
+        formatted = metrics.format_metrics(result.metrics)
+        if formatted:
+            out += "\n" + formatted
+    return out
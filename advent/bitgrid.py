@@ -0,0 +1,174 @@
+"""
+Grid of booleans packed in a single int, for the days with binary grids.
+
+Cell (row, col) is bit row * width + col, so whole-grid operations are a few big-int
+operations instead of a Python loop over the cells:
+
+    plots = BitGrid.from_string(text, ".")
+    frontier = frontier.dilate() & plots & ~seen
+    frontier.popcount()
+"""
+
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Sequence
+
+from advent.matrix import Coord
+
+
+@lru_cache(maxsize=32)
+def column_mask(width: int, height: int, start: int, end: int) -> int:
+    """Bits of the columns [start, end) in every row."""
+    if end <= start:
+        return 0
+    # Multiplying by 1 + 2**width + 2**(2 * width)... copies the row pattern to every row
+    every_row = sum(1 << (row * width) for row in range(height))
+    return ((1 << end) - (1 << start)) * every_row
+
+
+class BitGrid:
+    bits: int
+    width: int
+    height: int
+
+    def __init__(self, bits: int, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.bits = bits & self.full_mask
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << (self.width * self.height)) - 1
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[int], width: int) -> "BitGrid":
+        """Bit col of rows[row] is the cell (row, col)."""
+        bits = 0
+        for row, value in enumerate(rows):
+            bits |= value << (row * width)
+        return cls(bits, width, len(rows))
+
+    @classmethod
+    def from_string(cls, data: str, one: str = "#") -> "BitGrid":
+        """Cells equal to `one` are set."""
+        lines = data.splitlines()
+        width = len(lines[0])
+        table = {ord(c): "0" for c in set(data) - {one, "\n"}}
+        table[ord(one)] = "1"
+        # Reversed, the first column is the lowest bit
+        return cls.from_rows(
+            [int(line.translate(table)[::-1], 2) for line in lines], width
+        )
+
+    @classmethod
+    def from_cells(
+        cls, cells: Iterable, width: int, height: int, is_set: Callable = bool
+    ) -> "BitGrid":
+        """From the flat cells of a Matrix, row by row."""
+        bits = 0
+        for i, v in enumerate(cells):
+            if is_set(v):
+                bits |= 1 << i
+        return cls(bits, width, height)
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[Coord], width: int, height: int) -> "BitGrid":
+        bits = 0
+        for row, col in coords:
+            bits |= 1 << (row * width + col)
+        return cls(bits, width, height)
+
+    def with_bits(self, bits: int) -> "BitGrid":
+        return BitGrid(bits, self.width, self.height)
+
+    def is_valid_coord(self, coord: Coord) -> bool:
+        return 0 <= coord[0] < self.height and 0 <= coord[1] < self.width
+
+    def __getitem__(self, coord: Coord) -> bool:
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        return bool(self.bits >> (coord[0] * self.width + coord[1]) & 1)
+
+    def __setitem__(self, coord: Coord, value: bool) -> None:
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        bit = 1 << (coord[0] * self.width + coord[1])
+        self.bits = self.bits | bit if value else self.bits & ~bit
+
+    def row(self, row: int) -> int:
+        return (self.bits >> (row * self.width)) & ((1 << self.width) - 1)
+
+    def rows(self) -> list[int]:
+        return [self.row(row) for row in range(self.height)]
+
+    def cols(self) -> list[int]:
+        return self.transpose().rows()
+
+    def transpose(self) -> "BitGrid":
+        bits = 0
+        for row, col in self.coords():
+            bits |= 1 << (col * self.height + row)
+        return BitGrid(bits, self.height, self.width)
+
+    def coords(self) -> Iterator[Coord]:
+        """The set cells, in row order."""
+        for row in range(self.height):
+            bits = self.row(row)
+            while bits:
+                low = bits & -bits
+                yield row, low.bit_length() - 1
+                bits ^= low
+
+    def popcount(self) -> int:
+        return self.bits.bit_count()
+
+    def shift(self, d_row: int, d_col: int) -> "BitGrid":
+        """Move every cell by (d_row, d_col), what goes out of the grid is dropped."""
+        w, h = self.width, self.height
+        # Drop the columns that would wrap to the next/previous row
+        if d_col >= 0:
+            bits = self.bits & column_mask(w, h, 0, w - d_col)
+        else:
+            bits = self.bits & column_mask(w, h, -d_col, w)
+
+        offset = d_row * w + d_col
+        return self.with_bits(bits << offset if offset >= 0 else bits >> -offset)
+
+    def dilate(self, include_diagonals: bool = False) -> "BitGrid":
+        """The cells plus their neighbors, one BFS step without walls."""
+        vertical = self | self.shift(-1, 0) | self.shift(1, 0)
+        if include_diagonals:
+            return vertical | vertical.shift(0, -1) | vertical.shift(0, 1)
+        return vertical | self.shift(0, -1) | self.shift(0, 1)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits & other.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits | other.bits)
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        return self.with_bits(self.bits ^ other.bits)
+
+    def __invert__(self) -> "BitGrid":
+        return self.with_bits(~self.bits)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def key(self) -> tuple[int, int, int]:
+        return self.bits, self.width, self.height
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BitGrid) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "".join(
+                "#" if self.bits >> (r * self.width + c) & 1 else "."
+                for c in range(self.width)
+            )
+            for r in range(self.height)
+        )
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from advent.runner import STATE_DIR, Part
+
+CACHE_DIR = STATE_DIR / "cache"
+
+# Answers are tiny, this is mostly for pickled parse results
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+def source_files(day_module: ModuleType) -> list[Path]:
+    """The day module and the advent modules it uses, directly or not.
+
+    The parse results pickle Matrix, Garden, BitGrid... objects, a change in those
+    modules has to invalidate them too. Dependencies are found through the module
+    globals: imported modules, and the classes and functions imported from them.
+    """
+    package = __name__.split(".")[0]
+    found = {day_module.__name__: day_module}
+    stack = [day_module]
+    while stack:
+        for value in vars(stack.pop()).values():
+            if isinstance(value, ModuleType):
+                dep: Optional[ModuleType] = value
+            else:
+                dep = sys.modules.get(getattr(value, "__module__", None) or "")
+            if dep is None or dep.__name__ in found:
+                continue
+            if dep.__name__.split(".")[0] == package and getattr(dep, "__file__", None):
+                found[dep.__name__] = dep
+                stack.append(dep)
+    return [Path(found[name].__file__) for name in sorted(found)]
+
+
+def source_hash(day_module: ModuleType) -> str:
+    h = hashlib.sha256()
+    for path in source_files(day_module):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class Cache:
+    """Answers and parse results on disk, least recently used entries are evicted past max_size bytes.
+
+    Entries are keyed on the day, the input and the source of the day module and of the
+    advent modules it uses, so editing a solution or a helper invalidates its entries.
+    """
+
+    directory: Path
+    max_size: int
+
+    def __init__(self, directory: Path = CACHE_DIR, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def key(day_num: int, name: str, input_hash: str, source_hash: str) -> str:
+        digest = hashlib.sha256(f"{input_hash}:{source_hash}".encode()).hexdigest()
+        return f"day{day_num:02}.{name}.{digest[:32]}"
+
+    def answer_key(
+        self, day_num: int, part: Part, input_hash: str, source_hash: str
+    ) -> str:
+        return self.key(day_num, part, input_hash, source_hash)
+
+    def parsed_key(self, day_num: int, input_hash: str, source_hash: str) -> str:
+        return self.key(day_num, "parsed", input_hash, source_hash)
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, value)."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Corrupted, or pickled from code that doesn't exist anymore
+            path.unlink(missing_ok=True)
+            return False, None
+
+        # The mtime is what the LRU eviction goes by
+        os.utime(path)
+        return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees half an entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path(key))
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob("*.pickle"))
+
+    def evict(self, max_size: Optional[int] = None) -> None:
+        max_size = self.max_size if max_size is None else max_size
+
+        entries = []
+        for p in self.directory.glob("*.pickle"):
+            st = p.stat()
+            entries.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries):
+            if total <= max_size:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
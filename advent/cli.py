@@ -2,45 +2,576 @@
 Command line interface for advent of code 2021.
 """
 
-import importlib
 import time
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
 
+from .runner import PARTS, available_days, input_hash, load_day, parse, solve
 from .utils import get_input_filename_for_day
 
-from .new_day import new_day as new_day_fn
+if TYPE_CHECKING:
+    from .cache import Cache
 
 
-@click.command()
+class AdventGroup(click.Group):
+    """`advent DAY` is a shortcut for `advent day DAY`."""
+
+    def resolve_command(self, ctx, args):
+        if args and args[0].isdigit():
+            args = ["day", *args]
+        return super().resolve_command(ctx, args)
+
+
+class DayOrAll(click.ParamType):
+    """A day number, or "all" (None) for every day in advent/days/."""
+
+    name = "day"
+
+    def convert(self, value, param, ctx) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return value
+        if value == "all":
+            return None
+        return click.IntRange(min=1, max=25).convert(value, param, ctx)
+
+
+class Duration(click.ParamType):
+    """30s, 2m, 500ms... converted to seconds."""
+
+    name = "duration"
+
+    def convert(self, value, param, ctx) -> float:
+        if isinstance(value, (int, float)):
+            return float(value)
+        from .supervisor import parse_duration
+
+        try:
+            return parse_duration(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
+class ByteSize(click.ParamType):
+    """512M, 2G... converted to bytes."""
+
+    name = "size"
+
+    def convert(self, value, param, ctx) -> int:
+        if isinstance(value, int):
+            return value
+        from .supervisor import parse_size
+
+        try:
+            return parse_size(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
+def print_import_profile(ctx: click.Context, param: click.Parameter, value: bool):
+    if not value or ctx.resilient_parsing:
+        return
+    from .importtime import format_import_times, measure_imports
+
+    modules = ["advent.cli"] + [f"advent.days.day{d:02}" for d in available_days()]
+    click.echo(format_import_times(measure_imports(modules)))
+    ctx.exit()
+
+
+@click.group(cls=AdventGroup)
+@click.option(
+    "--import-profile",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=print_import_profile,
+    help="Report how long importing the CLI and every day module takes, and exit.",
+)
+def cli() -> None:
+    """Advent of Code 2023 solutions."""
+
+
+@cli.command()
 @click.argument("day_num", type=click.IntRange(min=1, max=25))
-def day(day_num: int) -> None:
-    """Run the first() and second() methods for a given day."""
+@click.option("--no-cache", is_flag=True, help="Don't read nor write cached answers.")
+@click.option("--refresh", is_flag=True, help="Recompute the cached answers.")
+@click.option("--cache-parsed", is_flag=True, help="Also cache the parsed input.")
+@click.option(
+    "--profile", is_flag=True, help="Profile each part, bypasses the answer cache."
+)
+@click.option(
+    "--profile-top", default=15, show_default=True, help="Functions in the report."
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Where to write the .prof and collapsed stacks [default: .advent/profiles].",
+)
+@click.option(
+    "--mem", is_flag=True, help="Measure the memory of each part in its own process."
+)
+@click.option(
+    "--timeout", type=Duration(), help="Stop a part running longer than this (30s, 2m)."
+)
+@click.option(
+    "--max-mem", type=ByteSize(), help="Stop a part using more memory than this (2G)."
+)
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="Input file, '-' for stdin [default: data/dayXX.txt].",
+)
+@click.option(
+    "--inputs",
+    "inputs_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Solve every file of this directory, one JSON line per file.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="Worker processes for --inputs [default: cpus].",
+)
+@click.option(
+    "-v",
+    "--verbose",
+    count=True,
+    help="Debug output on stderr, -vv for every step. Bypasses the answer cache.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    help="Show the work done by each part (see advent.metrics), bypasses the answer cache.",
+)
+def day(
+    day_num: int,
+    no_cache: bool,
+    refresh: bool,
+    cache_parsed: bool,
+    profile: bool,
+    profile_top: int,
+    profile_dir: Optional[Path],
+    mem: bool,
+    timeout: Optional[float],
+    max_mem: Optional[int],
+    input_file,
+    inputs_dir: Optional[Path],
+    jobs: Optional[int],
+    verbose: int,
+    stats: bool,
+) -> None:
+    """Run the first() and second() methods for a given day.
+
+    With --timeout or --max-mem each part runs in its own process, which is stopped
+    when it goes over.
+
+    With --inputs, every file of the directory is solved on a process pool. Each one
+    gets a JSON line as soon as it's done, with the answer, time and error of both parts.
+    """
+    supervised = timeout is not None or max_mem is not None
+    if supervised and (profile or mem or stats):
+        raise click.UsageError(
+            "--timeout and --max-mem don't go with --profile, --mem nor --stats"
+        )
+
+    if stats and profile:
+        raise click.UsageError("--stats doesn't go with --profile")
+
+    if inputs_dir is not None:
+        if input_file is not None or profile or mem or stats:
+            raise click.UsageError(
+                "--inputs doesn't go with --input, --profile, --mem nor --stats"
+            )
+        import json
+
+        from .batch import input_files, run_batch
+
+        paths = input_files(inputs_dir)
+        for line in run_batch(day_num, paths, jobs, timeout, max_mem):
+            click.echo(json.dumps(line))
+        return
 
     click.echo(f"🎄 Running Advent of Code for day {day_num} 🎄\n")
 
-    day_module = importlib.import_module(f"advent.days.day{day_num:02}")
+    if verbose:
+        from .debug import set_verbosity
+
+        set_verbosity(verbose)
+
+    day_module = load_day(day_num)
 
-    input_filename = get_input_filename_for_day(day_num)
+    if input_file is None:
+        input_file = open(get_input_filename_for_day(day_num))
 
     start_t = time.perf_counter()
-    with open(input_filename) as reader:
-        first_result = day_module.first(reader)
-    first_t = time.perf_counter()
-    click.echo(f"First: {first_result} ({first_t - start_t:.2f}s)")
+    with input_file:
+        text = input_file.read()
+
+    if mem:
+        from .memory import format_report, measure_part
+
+        for part in PARTS:
+            click.echo(format_report(measure_part(day_num, part, text)))
+        click.echo(f"\n✨ Done ({time.perf_counter() - start_t:.2f}s) ✨")
+        return
+
+    cache = None
+    answers = {}
+    if not no_cache and not profile and not verbose and not stats:
+        from .cache import Cache, source_hash
+
+        cache = Cache()
+        i_hash, s_hash = input_hash(text), source_hash(day_module)
+        for part in PARTS:
+            if refresh:
+                break
+            found, answer = cache.get(cache.answer_key(day_num, part, i_hash, s_hash))
+            if found:
+                answers[part] = answer
+
+    parsed = None
+    if len(answers) < len(PARTS) and not supervised:
+        parsed = cached_parse(day_module, day_num, text, cache, cache_parsed, refresh)
+
+    prev_t = time.perf_counter()
+    for part in PARTS:
+        if part in answers:
+            click.echo(f"{part.capitalize()}: {answers[part]} (cached)")
+            continue
+
+        if supervised:
+            from .supervisor import run_supervised
+
+            task = run_supervised(day_num, part, text, timeout, max_mem)
+            if task.error is not None:
+                click.echo(
+                    f"{part.capitalize()}: 💥 {task.error} ({task.elapsed:.2f}s)"
+                )
+                prev_t = time.perf_counter()
+                continue
+            result = task.answer
+        elif profile:
+            from .profiling import PROFILE_DIR, profile_part, report, write_profile
+
+            result, profile_stats = profile_part(day_module, part, parsed)
+        elif stats:
+            from .metrics import collecting
+
+            with collecting() as recorded:
+                result = solve(day_module, part, parsed)
+        else:
+            result = solve(day_module, part, parsed)
+        part_t = time.perf_counter()
+        click.echo(f"{part.capitalize()}: {result} ({part_t - prev_t:.2f}s)")
+
+        if stats:
+            from .metrics import format_metrics
+
+            click.echo(format_metrics(recorded) or "  (no metrics recorded)")
+
+        if profile:
+            click.echo(report(profile_stats, profile_top))
+            paths = write_profile(
+                profile_stats, profile_dir or PROFILE_DIR, f"day{day_num:02}.{part}"
+            )
+            click.echo(f"Profile written to {', '.join(str(p) for p in paths)}\n")
+        prev_t = time.perf_counter()
+
+        if cache is not None:
+            cache.set(cache.answer_key(day_num, part, i_hash, s_hash), result)
+
+    click.echo(f"\n✨ Done ({time.perf_counter() - start_t:.2f}s) ✨")
+
+
+def cached_parse(
+    day_module: ModuleType,
+    day_num: int,
+    text: str,
+    cache: Optional["Cache"],
+    cache_parsed: bool,
+    refresh: bool,
+) -> Any:
+    """parse() the input, going through the cache if asked to."""
+    start_t = time.perf_counter()
+    if not hasattr(day_module, "parse"):
+        return parse(day_module, text)
+
+    if cache is None or not cache_parsed:
+        parsed = parse(day_module, text)
+        click.echo(f"Parse ({time.perf_counter() - start_t:.2f}s)")
+        return parsed
+
+    from .cache import source_hash
+
+    key = cache.parsed_key(day_num, input_hash(text), source_hash(day_module))
+    found, parsed = cache.get(key)
+    if found and not refresh:
+        click.echo(f"Parse (cached, {time.perf_counter() - start_t:.2f}s)")
+        return parsed
+
+    parsed = parse(day_module, text)
+    click.echo(f"Parse ({time.perf_counter() - start_t:.2f}s)")
+    cache.set(key, parsed)
+    return parsed
+
+
+@cli.command()
+@click.argument("day_num", type=DayOrAll())
+@click.argument("part", type=click.Choice(PARTS), required=False)
+@click.option("-n", "--runs", default=10, show_default=True, help="Timed runs.")
+@click.option("-w", "--warmup", default=1, show_default=True, help="Untimed runs.")
+@click.option(
+    "--json",
+    "json_path",
+    type=click.Path(dir_okay=False, path_type=Path, allow_dash=True),
+    help="Write the results as JSON to this file ('-' for stdout).",
+)
+@click.option(
+    "--mem/--no-mem",
+    default=True,
+    show_default=True,
+    help="Also measure memory, in a separate run.",
+)
+def bench(
+    day_num: Optional[int],
+    part: Optional[str],
+    runs: int,
+    warmup: int,
+    json_path: Optional[Path],
+    mem: bool,
+) -> None:
+    """Benchmark a day (or "all" of them), optionally a single part."""
+    import json
+
+    from .bench import add_memory, bench_part, format_result, interpreter
+
+    days = [day_num] if day_num is not None else available_days()
+    parts = [part] if part else PARTS
+
+    results = []
+    for d in days:
+        with open(get_input_filename_for_day(d)) as reader:
+            text = reader.read()
+        for p in parts:
+            result = bench_part(d, p, text, runs, warmup)
+            if mem:
+                add_memory(result, text)
+            results.append(result)
+            click.echo(format_result(result), err=json_path == Path("-"))
+
+    if json_path is not None:
+        doc = {
+            "interpreter": interpreter(),
+            "timestamp": time.time(),
+            "results": [r.to_dict() for r in results],
+        }
+        if json_path == Path("-"):
+            click.echo(json.dumps(doc, indent=2))
+        else:
+            json_path.write_text(json.dumps(doc, indent=2))
+
+
+@cli.command("all")
+@click.option(
+    "-j", "--jobs", type=click.IntRange(min=1), help="Worker processes [default: cpus]."
+)
+@click.option("--timeout", type=Duration(), help="Stop parts running longer than this.")
+@click.option(
+    "--max-mem", type=ByteSize(), help="Stop parts using more memory than this."
+)
+def all_days(
+    jobs: Optional[int], timeout: Optional[float], max_mem: Optional[int]
+) -> None:
+    """Run both parts of every day in parallel."""
+    from .parallel import run_all
+
+    click.echo(f"🎄 Running Advent of Code for all days 🎄\n")
+
+    start_t = time.perf_counter()
+    for result in run_all(jobs, timeout=timeout, max_mem=max_mem):
+        outcome = result.answer if result.error is None else f"💥 {result.error}"
+        click.echo(
+            f"Day {result.day:02} {result.part.capitalize()}: {outcome} ({result.elapsed:.2f}s)"
+        )
+
+    click.echo(f"\n✨ Done ({time.perf_counter() - start_t:.2f}s) ✨")
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.argument("size", type=click.IntRange(min=1))
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the input [default: stdout].",
+)
+def gen(day_num: int, size: int, seed: int, output) -> None:
+    """Generate an input for a day, what SIZE means depends on the day."""
+    from .gen import generate
+
+    try:
+        text = generate(day_num, size, seed)
+    except ModuleNotFoundError as e:
+        if e.name != f"advent.gen.day{day_num:02}":
+            raise
+        raise click.ClickException(f"No generator for day {day_num}")
+    output.write(text)
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.argument("part", type=click.Choice(PARTS), required=False)
+@click.option(
+    "--start", type=click.IntRange(min=1), help="First size [default: per day]."
+)
+@click.option(
+    "--max-time",
+    default=10.0,
+    show_default=True,
+    help="Don't try a size expected to take longer than this, in seconds.",
+)
+@click.option("--factor", default=2, type=click.IntRange(min=2), show_default=True)
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+@click.option(
+    "--mem/--no-mem",
+    default=True,
+    show_default=True,
+    help="Also measure memory, in a separate run.",
+)
+def scale(
+    day_num: int,
+    part: Optional[str],
+    start: Optional[int],
+    max_time: float,
+    factor: int,
+    seed: int,
+    mem: bool,
+) -> None:
+    """Fit how a day's time and memory grow with the size of its input."""
+    from .scale import (
+        TABLE_HEADER,
+        format_exponent,
+        format_point,
+        memory_exponent,
+        scale_part,
+        size_meaning,
+        time_exponent,
+    )
+
+    click.echo(f"Day {day_num}, size: {size_meaning(day_num)}")
+    for p in [part] if part else PARTS:
+        click.echo(f"\n{p.capitalize()}:\n{TABLE_HEADER}")
+        points = []
+        try:
+            for point in scale_part(day_num, p, start, max_time, factor, seed, mem):
+                click.echo(format_point(point, points[-1] if points else None))
+                points.append(point)
+        except Exception as e:
+            click.echo(f"💥 {e!r}")
+
+        click.echo(
+            f"Time ~ n^{format_exponent(time_exponent(points))}, "
+            f"memory ~ n^{format_exponent(memory_exponent(points))}"
+        )
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on [default: .advent/advent.sock].",
+)
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Worker processes, as many parts run at once [default: cpus].",
+)
+@click.option("--timeout", type=Duration(), help="Stop parts running longer than this.")
+@click.option("--max-mem", type=ByteSize(), help="Memory limit of each worker.")
+def serve(
+    socket_path: Optional[Path],
+    workers: Optional[int],
+    timeout: Optional[float],
+    max_mem: Optional[int],
+) -> None:
+    """Solve jobs sent over a Unix socket, with every day already imported."""
+    from .client import SOCKET_PATH
+    from .server import serve as serve_forever
+
+    path = socket_path or SOCKET_PATH
+    click.echo(f"🎄 Serving Advent of Code on {path} 🎄")
+    try:
+        serve_forever(path, workers, timeout, max_mem)
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.argument("day_num", type=click.IntRange(min=1, max=25))
+@click.argument("part", type=click.Choice(PARTS), required=False)
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="Input file, '-' for stdin [default: data/dayXX.txt].",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket of the server [default: .advent/advent.sock].",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the raw JSON results.")
+def client(
+    day_num: int,
+    part: Optional[str],
+    input_file,
+    socket_path: Optional[Path],
+    as_json: bool,
+) -> None:
+    """Solve a day on a running `advent serve`."""
+    import json
+
+    from .client import SOCKET_PATH, submit
 
-    with open(input_filename) as reader:
-        second_result = day_module.second(reader)
-    second_t = time.perf_counter()
-    click.echo(f"Second: {second_result} ({second_t - first_t:.2f}s)")
+    if input_file is None:
+        input_file = open(get_input_filename_for_day(day_num))
+    with input_file:
+        text = input_file.read()
 
-    click.echo(f"\n✨ Done ({second_t - start_t:.2f}s) ✨")
+    path = socket_path or SOCKET_PATH
+    try:
+        for result in submit(path, day_num, text, part):
+            if as_json:
+                click.echo(json.dumps(result))
+            elif result["error"] is not None:
+                click.echo(
+                    f"{result['part'].capitalize()}: 💥 {result['error']} "
+                    f"({result['elapsed']:.2f}s)"
+                )
+            else:
+                click.echo(
+                    f"{result['part'].capitalize()}: {result['answer']} "
+                    f"({result['elapsed']:.2f}s)"
+                )
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise click.ClickException(f"No server on {path}, start one with advent serve")
 
 
 @click.command()
 @click.argument("day_num", type=click.IntRange(min=1, max=25))
 def new_day(day_num: int) -> None:
     """Create a new day's files."""
+    from .new_day import new_day as new_day_fn
 
     click.echo(f"🎄 Creating new files for day {day_num} 🎄\n")
     new_day_fn(day_num)
@@ -0,0 +1,31 @@
+"""
+Client for `advent serve`, kept to the standard library so it starts fast.
+"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from advent.runner import STATE_DIR
+
+SOCKET_PATH = STATE_DIR / "advent.sock"
+
+
+def submit(
+    path: Path,
+    day_num: int,
+    text: str,
+    part: Optional[str] = None,
+    job_id: Any = None,
+) -> Iterator[dict]:
+    """Send one job to the server, and yield the result of each part as it comes."""
+    request = {"id": job_id, "day": day_num, "part": part, "input": text}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        # Nothing else to send, the server answers and closes the connection
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as responses:
+            for line in responses:
+                yield json.loads(line)
@@ -6,7 +6,7 @@ from advent.utils import prod
 
 
 class Engine(Matrix[str]):
-    pass
+    __slots__ = ()
 
 
 SYMBOLS = {"#", "$", "%", "&", "*", "+", "-", "/", "=", "@"}
@@ -25,59 +25,64 @@ def is_digit(c: str):
     return re.match(r"^\d$", c)
 
 
-def expand_part(engine: Engine, coord: Coord) -> Part:
-    row, col = coord
-    snum = engine[coord]
-    curr = (row, col - 1)
-    min_col = col
-    while engine.is_valid_coord(curr) and is_digit(engine[curr]):
-        snum = engine[curr] + snum
-        min_col = curr[1]
-        curr = (row, curr[1] - 1)
-    curr = (row, col + 1)
-    while engine.is_valid_coord(curr) and is_digit(engine[curr]):
-        snum = snum + engine[curr]
-        curr = (row, curr[1] + 1)
+def expand_part(engine: Engine, i: int) -> Part:
+    """i is the flat index of one of the digits, the engine is padded with "." so the
+    number always ends before the edge."""
+    data = engine.data
+    start = end = i
+    while is_digit(data[start - 1]):
+        start -= 1
+    while is_digit(data[end + 1]):
+        end += 1
 
-    return int(snum), (row, min_col)
+    return int("".join(data[start : end + 1])), engine.coord(start)
 
 
-def find_adjacent_parts(engine: Engine, coord: Coord) -> set[Part]:
+def find_adjacent_parts(engine: Engine, i: int) -> set[Part]:
+    """i is the flat index of the symbol."""
     parts = set()
-    for nc in engine.nbc8(coord):
-        if is_digit(engine[nc]):
-            parts.add(expand_part(engine, nc))
+    for ni in engine.nb8_idx(i):
+        if is_digit(engine.at(ni)):
+            parts.add(expand_part(engine, ni))
 
     return parts
 
 
-def first(input: TextIO) -> int:
-    engine = Matrix.from_string(input.read())
+def parse(text: str) -> Engine:
+    return Engine.from_string(text, pad=1, pad_value=".")
+
+
+def first_parsed(engine: Engine) -> int:
     parts: set[Part] = set()
 
-    for coord in engine.all_coords():
-        c = engine[coord]
+    for i, c in enumerate(engine.data):
         if not is_symbol(c):
             continue
 
-        parts |= find_adjacent_parts(engine, coord)
+        parts |= find_adjacent_parts(engine, i)
 
     return sum(n for n, _ in parts)
 
 
-def second(input: TextIO) -> int:
-    engine = Matrix.from_string(input.read())
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(engine: Engine) -> int:
     total = 0
 
-    for coord in engine.all_coords():
-        c = engine[coord]
+    for i, c in enumerate(engine.data):
         if not is_gear(c):
             continue
 
-        parts = find_adjacent_parts(engine, coord)
+        parts = find_adjacent_parts(engine, i)
         if len(parts) != 2:
             continue
 
         total += prod(n for n, _ in parts)
 
     return total
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
@@ -124,8 +124,15 @@ def process_map2(ranges: list[Range], amap: AlmanacMap) -> list[Range]:
     return new_ranges
 
 
-def first(input: TextIO) -> int:
-    current, maps = parse_all(input.read())
+Almanac = tuple[list[int], list[AlmanacMap]]
+
+
+def parse(text: str) -> Almanac:
+    return parse_all(text)
+
+
+def first_parsed(almanac: Almanac) -> int:
+    current, maps = almanac
 
     for map in maps:
         current = process_map(current, map)
@@ -133,12 +140,15 @@ def first(input: TextIO) -> int:
     return sorted(current)[0]
 
 
-def second(input: TextIO) -> int:
-    current, maps = parse_all(input.read())
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(almanac: Almanac) -> int:
+    current, maps = almanac
     current = chunk(tuple(current), 2)
     current = [(r[0], r[0] + r[1] - 1) for r in current]
 
-    print("")
     for map in maps:
         # sm = [
         #     f"{e.source},{e.source+e.range-1}->{e.destination},{e.destination + e.range-1}"
@@ -148,3 +158,7 @@ def second(input: TextIO) -> int:
         current = process_map2(current, map)
 
     return sorted(current)[0][0]
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
@@ -1,8 +1,8 @@
 import itertools as it
-from collections import deque
 from typing import Literal, Optional, TextIO
 
-from advent.matrix import Coord, Matrix
+from advent.debug import debug
+from advent.matrix import Components, Coord, Matrix
 
 Dir = Literal["top", "right", "bottom", "left"]
 Pipe = Literal["|", "F", "7", "J", "L", "-"]
@@ -154,43 +154,43 @@ def find_loop(sketch: Sketch) -> list[Coord]:
     return path
 
 
-def explore(sketch: Sketch, loops: set[Coord], start: Coord) -> set[Coord]:
-    seen = set()
-    to_visit = deque([start])
-    while to_visit:
-        curr = to_visit.pop()
-        if curr in seen:
-            # Already visited, we're skipping
-            continue
-
-        seen.add(curr)
-        to_visit.extend(set(sketch.neighbor_coords(curr)) - loops - seen)
-
-    return seen
+def open_components(sketch: Sketch, loops: set[Coord]) -> Components:
+    """The regions left between the pipes of the loop."""
+    open_cells = Matrix(
+        [c not in loops for c in sketch.all_coords()], sketch.width, sketch.height
+    )
+    return open_cells.label_components(bool)
 
 
 def explore_candidates(
-    sketch: Sketch, loops: set[Coord], curr: Coord, dir: Dir
-) -> set[Coord]:
-    seen = set()
+    sketch: Sketch, components: Components, curr: Coord, dir: Dir
+) -> set[int]:
+    """Regions on the inside of the pipe at curr."""
+    found = set()
     pipe = sketch[curr]
     if pipe == "S":
         pipe = replace_start_with_pipe(sketch, curr)
     for delta in INSIDE_CW[pipe][dir]:
         inside_candidate = (curr[0] + delta[0], curr[1] + delta[1])
-        if (
-            not sketch.is_valid_coord(inside_candidate)
-            or inside_candidate in seen
-            or inside_candidate in loops
-        ):
+        if not sketch.is_valid_coord(inside_candidate):
             continue
-        seen |= explore(sketch, loops, inside_candidate)
-    return seen
+        label = components.labels[sketch.idx(*inside_candidate)]
+        # -1 is the loop itself
+        if label >= 0:
+            found.add(label)
+    return found
 
 
 def find_inside(sketch: Sketch, loop: list[Coord], inverse: bool = False) -> set[Coord]:
-    loops = set(loop)
-    seen = set()
+    components = open_components(sketch, set(loop))
+    found: set[int] = set()
+
+    def inside() -> set[Coord]:
+        return {
+            sketch.coord(i)
+            for i, label in enumerate(components.labels)
+            if label in found
+        }
 
     # Navigate the loop, this time looking for inside points
     curr, dir = find_start(sketch, inverse)
@@ -199,17 +199,18 @@ def find_inside(sketch: Sketch, loop: list[Coord], inverse: bool = False) -> set
         curr, dir = move_next(sketch, curr, dir)
         path.append(curr)
 
-        pprint(sketch, seen, curr)
-        # We found a point inside, expand from here
-        seen |= explore_candidates(sketch, loops, curr, dir)
+        debug(lambda: render(sketch, inside(), curr), level=2)
+        # We found a point inside, the whole region is inside
+        found |= explore_candidates(sketch, components, curr, dir)
 
-    inside = seen
+    return inside()
 
-    return inside
 
+def parse(text: str) -> Sketch:
+    return Sketch.from_string(text.strip())
 
-def first(input: TextIO) -> int:
-    sketch = Sketch.from_string(input.read().strip())
+
+def first_parsed(sketch: Sketch) -> int:
     path = find_loop(sketch)
 
     # It should be an even number (odd number of pipes, + S), that's the full loop ending with the starting point
@@ -218,7 +219,11 @@ def first(input: TextIO) -> int:
     return len(path) // 2
 
 
-def pprint(sketch: Sketch, inside: set[Coord], mark: Optional[Coord] = None) -> None:
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def render(sketch: Sketch, inside: set[Coord], mark: Optional[Coord] = None) -> str:
     sketch = Sketch(sketch.data, sketch.width, sketch.height)
     loop = find_loop(sketch)
     sc, _ = find_start(sketch)
@@ -235,10 +240,9 @@ def pprint(sketch: Sketch, inside: set[Coord], mark: Optional[Coord] = None) ->
         else:
             sketch[c] = "."
 
-    print(sketch)
     # print(f"new_s={new_s}")
     # print(len(inside))
-    print()
+    return f"{sketch}\n"
 
 
 def is_clockwise(loop: list[Coord]) -> bool:
@@ -246,15 +250,14 @@ def is_clockwise(loop: list[Coord]) -> bool:
     return sum((b[1] - a[1]) * (b[0] - a[0]) for a, b in it.pairwise(loop)) > 0
 
 
-def second(input: TextIO) -> int:
-    sketch = Sketch.from_string(input.read().strip())
+def second_parsed(sketch: Sketch) -> int:
     loop = find_loop(sketch)
 
-    print(f"is_clockwise={is_clockwise(loop)}")
+    debug(lambda: f"is_clockwise={is_clockwise(loop)}")
 
     # Find points outside loop
     inside = find_inside(sketch, loop, True)
-    pprint(sketch, inside)
+    debug(lambda: render(sketch, inside))
 
     is_inverted = any(
         c[0] == 0 or c[0] == sketch.height - 1 or c[1] == 0 or c[1] == sketch.width - 1
@@ -264,7 +267,11 @@ def second(input: TextIO) -> int:
         _, original_dir = find_start(sketch)
         _, new_dir = find_start(sketch, True)
         inside = find_inside(sketch, loop, True)
-        print(f"-> Is inverted, tried {original_dir} now trying {new_dir}")
-        pprint(sketch, inside)
+        debug("-> Is inverted, tried %s now trying %s", original_dir, new_dir)
+        debug(lambda: render(sketch, inside))
 
     return len(inside)
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
@@ -2,6 +2,8 @@ from functools import cache
 from typing import Deque, Iterable, Sequence, TextIO
 from collections import deque
 
+from advent import metrics
+from advent.debug import debug
 
 Row = str
 Counts = tuple[int]
@@ -126,15 +128,14 @@ def solve_rec(row: Row, counts: Counts) -> int:
     return 1
 
 
-solved = 0
-
-
 def solve(row: Row, counts: Counts) -> list[str]:
     found = []
     candidates = deque([(row, counts, "")])
 
+    expanded = 0
     while candidates:
         c = candidates.pop()
+        expanded += 1
         new_candidates = get_candidates(c)
 
         for new_c in new_candidates:
@@ -144,9 +145,9 @@ def solve(row: Row, counts: Counts) -> list[str]:
             else:
                 candidates.append(new_c)
 
-    global solved
-    solved += 1
-    print(solved)
+    metrics.incr("day12.rows_solved")
+    metrics.incr("day12.candidates_expanded", expanded)
+    debug("row=%s arrangements=%d", row, len(found), level=2)
     return found
 
 
@@ -169,7 +170,14 @@ def first(input: TextIO) -> int:
 
 def second(input: TextIO) -> int:
     lines = [parse_line2(l) for l in input.read().strip().splitlines()]
-    return sum(solve_rec(row, counts) for row, counts in lines)
+    before = solve_rec.cache_info()
+    total = sum(solve_rec(row, counts) for row, counts in lines)
+
+    after = solve_rec.cache_info()
+    metrics.incr("day12.solve_rec.hits", after.hits - before.hits)
+    metrics.incr("day12.solve_rec.misses", after.misses - before.misses)
+    metrics.gauge("day12.solve_rec.cache_size", after.currsize)
+    return total
 
 
 """
@@ -1,6 +1,6 @@
 from typing import Optional, TextIO
 
-from advent.utils import binseq_to_int
+from advent.bitgrid import BitGrid
 
 Rows = list[int]
 Cols = list[int]
@@ -8,10 +8,8 @@ Pattern = tuple[Rows, Cols]
 
 
 def parse_pattern(s: str) -> Pattern:
-    rows = [list(map(lambda x: 0 if x == "." else 1, r)) for r in s.splitlines()]
-    cols = zip(*rows)
-
-    return [binseq_to_int(r) for r in rows], [binseq_to_int(c) for c in cols]
+    grid = BitGrid.from_string(s)
+    return grid.rows(), grid.cols()
 
 
 def has_one_bit_different(a: int, b: int) -> bool:
@@ -53,11 +51,21 @@ def find_reflection_summary(p: Pattern, smudge: bool = False) -> int:
     raise Exception(f"Reflection not found in pattern={p}")
 
 
-def first(input: TextIO) -> int:
-    patterns = [parse_pattern(s) for s in input.read().strip().split("\n\n")]
+def parse(text: str) -> list[Pattern]:
+    return [parse_pattern(s) for s in text.strip().split("\n\n")]
+
+
+def first_parsed(patterns: list[Pattern]) -> int:
     return sum(find_reflection_summary(p) for p in patterns)
 
 
-def second(input: TextIO) -> int:
-    patterns = [parse_pattern(s) for s in input.read().strip().split("\n\n")]
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(patterns: list[Pattern]) -> int:
     return sum(find_reflection_summary(p, True) for p in patterns)
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
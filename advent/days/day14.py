@@ -1,26 +1,36 @@
-from typing import Iterator, Optional, Sequence, TextIO
+from typing import TextIO
 
-from advent.matrix import Coord, Matrix
+from advent.debug import debug
+from advent.matrix import Matrix, MatrixView
+
+
+def tilt_line(line: list[str]) -> list[str]:
+    """Roll the rounded rocks to the start of the line, up to the next cube rock."""
+    return list(
+        "#".join(
+            # "O" sorts after "."
+            "".join(sorted(part, reverse=True))
+            for part in "".join(line).split("#")
+        )
+    )
 
 
 class Reflector(Matrix[str]):
-    def get_col_c(self, col: int) -> Iterator[Coord]:
-        for row in range(self.height):
-            yield (row, col)
+    __slots__ = ()
 
-    def get_row_c(self, row: int) -> Iterator[Coord]:
-        for col in range(self.width):
-            yield (row, col)
+    def tilt_left(self, view: MatrixView[str]) -> None:
+        for row in range(view.height):
+            view.set_line(row, tilt_line(view.line(row)))
 
     def tilt_north(self):
-        for col in range(self.width):
-            self.tilt_sequence_left(list(self.get_col_c(col)))
+        self.tilt_left(self.transpose())
 
     def spin_cycle(self, count=1):
-        north = [list(self.get_col_c(col)) for col in range(self.width)]
-        west = [list(self.get_row_c(row)) for row in range(self.height)]
-        south = [list(reversed(cc)) for cc in north]
-        east = [list(reversed(rr)) for rr in west]
+        # Tilting each view to the left tilts the reflector north, west, south and east
+        north = self.transpose()
+        west = self.view()
+        south = north.flip_cols()
+        east = west.flip_cols()
 
         # Find the cycle length and offset, for instance if cycle starts at 151, and length 193-151
         cycle_length = 193 - 151
@@ -28,40 +38,19 @@ class Reflector(Matrix[str]):
 
         mem = []
 
-        for i in range(cycle_offset + cycle_length):
+        for i in range(min(count, cycle_offset + cycle_length)):
             if cycle_offset <= i < cycle_offset + cycle_length:
                 mem.append(self.data[:])
             # if i % (count // 100) == 0:
             #     print(f"{i // (count // 100)}%")
-            print(f"i={i} load={self.load()}")
+            debug(lambda: f"i={i} load={self.load()}", level=2)
             for direction in [north, west, south, east]:
-                for seq_coords in direction:
-                    self.tilt_sequence_left(seq_coords)
+                self.tilt_left(direction)
 
         # TODO check that the math works
         if count >= cycle_offset + cycle_length:
             self.data = mem[(count - cycle_offset) % cycle_length]
 
-    def tilt_sequence_left(self, coords: Sequence[Coord]) -> None:
-        swappable: Optional[int] = None
-        for i, c in enumerate(coords):
-            val = self[c]
-            if val == "#":
-                swappable = None
-            elif val == ".":
-                if swappable is None:
-                    swappable = i
-                # Otherwise we keep the old one
-            elif val == "O":
-                if swappable is not None:
-                    # We should be swapping with a .
-                    assert self[coords[swappable]] == "."
-                    self[coords[swappable]] = val
-                    self[c] = "."
-                    swappable += 1
-            else:
-                raise Exception(f"Unknown val={val}")
-
     def load(self) -> int:
         total = 0
         for c in self.all_coords():
@@ -70,15 +59,28 @@ class Reflector(Matrix[str]):
         return total
 
 
-def first(input: TextIO) -> int:
-    reflector = Reflector.from_string(input.read().strip())
+def parse(text: str) -> Reflector:
+    return Reflector.from_string(text.strip())
+
+
+def first_parsed(reflector: Reflector) -> int:
+    # Tilting moves the rocks in place, keep the parsed reflector intact for the other part
+    reflector = reflector.copy()
     reflector.tilt_north()
 
     return reflector.load()
 
 
-def second(input: TextIO, count: int = 1000000000) -> int:
-    reflector = Reflector.from_string(input.read().strip())
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(reflector: Reflector, count: int = 1000000000) -> int:
+    reflector = reflector.copy()
     reflector.spin_cycle(count)
 
     return reflector.load()
+
+
+def second(input: TextIO, count: int = 1000000000) -> int:
+    return second_parsed(parse(input.read()), count)
@@ -1,6 +1,7 @@
 from collections import defaultdict, deque
 from typing import Callable, Iterable, Literal, Optional, TextIO, DefaultDict
 
+from advent import metrics
 from advent.matrix import Coord, Matrix
 from advent.utils import tadd
 
@@ -11,16 +12,37 @@ Direction = Literal["up", "down", "left", "right"]
 
 Beam = tuple[Coord, Direction]
 
+# Padding around the contraption, beams stop when they reach it
+EDGE = "X"
+
+DELTAS: dict[Direction, tuple[int, int]] = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
 
 class Contraption(Matrix[str]):
-    row_mirrors: DefaultDict[int, list[str]] = defaultdict(list)
-    col_mirrors: DefaultDict[int, list[str]] = defaultdict(list)
+    __slots__ = ("row_mirrors", "col_mirrors")
+
+    row_mirrors: DefaultDict[int, list[str]]
+    col_mirrors: DefaultDict[int, list[str]]
+
+    def __init__(self, data: list[str], width: int, height: int, pad: int = 0):
+        super().__init__(data, width, height, pad)
+        self.row_mirrors = defaultdict(list)
+        self.col_mirrors = defaultdict(list)
 
     @classmethod
     def from_string(
-        cls, data: str, fn: Optional[Callable[[str], str]] = None
+        cls,
+        data: str,
+        fn: Optional[Callable[[str], str]] = None,
+        pad: int = 1,
+        pad_value: Optional[str] = EDGE,
     ) -> "Contraption":
-        inst = super().from_string(data, fn)
+        inst = super().from_string(data, fn, pad, pad_value)
 
         for row, col in inst.all_coords():
             val = inst[row, col]
@@ -33,14 +55,7 @@ class Contraption(Matrix[str]):
     def get_next_in_direction(
         self, coord: Coord, direction: Direction
     ) -> tuple[Coord, str]:
-        deltas: dict[Direction, tuple[int, int]] = {
-            "up": (-1, 0),
-            "down": (1, 0),
-            "left": (0, -1),
-            "right": (0, 1),
-        }
-
-        delta = deltas[direction]
+        delta = DELTAS[direction]
         curr = coord
         while True:
             # curr = (curr[0] + delta[0], curr[1] + delta[1])
@@ -97,34 +112,51 @@ class Contraption(Matrix[str]):
             if self[start_coord] not in MIRRORS_AND_SPLITTERS
             else {(start_coord, start_direction)}
         )
-        energized: set[Coord] = {start_coord}
+        # Same as get_next_in_direction on flat indexes, until the padding
+        data = self.data
+        steps = {d: self.delta_idx(*delta) for d, delta in DELTAS.items()}
+        energized: set[int] = {self.idx(*start_coord)}
 
         to_see = deque(start_beams)
+        processed = 0
         while to_see:
             curr = to_see.pop()
             if curr in seen:
                 continue
 
             seen.add(curr)
+            processed += 1
             coord, direction = curr
 
-            for coord, value in self.get_next_in_direction(*curr):
-                energized.add(coord)
+            i = self.idx(*coord)
+            step = steps[direction]
+            i += step
+            while (value := data[i]) != EDGE:
+                energized.add(i)
                 if value in MIRRORS_AND_SPLITTERS:
-                    to_see.extend(self.process_mirror(coord, direction))
+                    to_see.extend(self.process_mirror(self.coord(i), direction))
                     break
+                i += step
 
+        metrics.incr("day16.beams_processed", processed)
+        metrics.observe("day16.energized", len(energized))
         return len(energized)
 
 
-def first(input: TextIO) -> int:
-    contraption = Contraption.from_string(input.read().strip())
+def parse(text: str) -> Contraption:
+    return Contraption.from_string(text.strip())
+
+
+def first_parsed(contraption: Contraption) -> int:
     return contraption.beam()
 
 
-def second(input: TextIO) -> int:
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(contraption: Contraption) -> int:
     all_start_beams: list[Beam] = []
-    contraption = Contraption.from_string(input.read().strip())
     for row in range(contraption.height):
         all_start_beams.append(((row, 0), "right"))
         all_start_beams.append(((row, contraption.width - 1), "left"))
@@ -135,3 +167,7 @@ def second(input: TextIO) -> int:
     return max(
         contraption.beam(coord, direction) for coord, direction in all_start_beams
     )
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
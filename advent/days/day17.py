@@ -1,154 +1,83 @@
-import heapq
-from typing import Literal, Optional, TextIO
+from typing import TextIO
 
-from advent.matrix import Coord, Matrix
-from advent.utils import tadd
-
-Direction = Literal["up", "down", "left", "right"]
-
-
-def backwards(d1: Optional[Direction], d2: Optional[Direction]) -> bool:
-    if d1 is None or d2 is None:
-        return False
-
-    d = (d1, d2) if d1 < d2 else (d2, d1)
-    return d in [("left", "right"), ("down", "up")]
+from advent import metrics
+from advent.matrix import Matrix
+from advent.search import dial
 
 
 class CityMap(Matrix[int]):
-    def nb(
-        self, coord: Coord, direction: Optional[Direction], is_ultra: bool = False
-    ) -> list[tuple[Coord, Direction, int]]:
-        if is_ultra:
-            return self.nb_ultra(coord, direction)
-
-        row, col = coord
-        neighbors: list[tuple[Coord, Direction]] = [
-            ((row, col - 1), "left"),
-            ((row - 1, col), "up"),
-            ((row, col + 1), "right"),
-            ((row + 1, col), "down"),
-        ]
-        return [
-            (c, n_direction, 1)
-            for c, n_direction in neighbors
-            if self.is_valid_coord(c) and not backwards(direction, n_direction)
-        ]
-
-    def nb_ultra(
-        self, coord: Coord, direction: Optional[Direction]
-    ) -> list[tuple[Coord, Direction, int]]:
-        row, col = coord
-        deltas: list[tuple[Coord, Direction]] = [
-            ((0, -1), "left"),
-            ((-1, 0), "up"),
-            ((0, 1), "right"),
-            ((1, 0), "down"),
-        ]
-
-        nn = []
-        for i in range(4, 10 + 1):
-            for delta, delta_dir in deltas:
-                if backwards(direction, delta_dir):
-                    continue
-                c = row + delta[0] * i, col + delta[1] * i
-                if not self.is_valid_coord(c):
-                    continue
-                nn.append((c, delta_dir, i))
-        return nn
-
-    def compute_heatloss(self, start: Coord, end: Coord) -> int:
-        """Do not include the start, but include the end."""
-        r1, c1 = start
-        r2, c2 = end
-
-        total_heatloss = 0
-
-        if r1 == r2:
-            delta = (0, 1) if c1 < c2 else (0, -1)
-        else:
-            delta = (1, 0) if r1 < r2 else (-1, 0)
-
-        curr = start
-        while True:
-            curr = tadd(curr, delta)
-            total_heatloss += self[curr]
-            if curr == end:
-                return total_heatloss
-
-
-# movements done, direction
-LineCheck = tuple[int, Optional[Direction]]
-# Items are ordered by heat loss
-Item = tuple[int, Coord, LineCheck]
-
-
-def min_heat_loss(cm: CityMap, is_ultra: bool = False) -> int:
-    destination = (cm.height - 1, cm.width - 1)
-
-    max_distance = 10 if is_ultra else 3
-
-    # Djikstra
-    coord = (0, 0)
-    # Doesn't matter initially
-    line_check: LineCheck = (0, None)
-    heap: list[Item] = []
-    item = (0, coord, line_check)
-    heapq.heappush(heap, item)
-
-    # Prevent visiting the same again, technically we only need to prevent visiting
-    # the same coord with a >= line check for that direction
-    # TODO optimize instead of dummy set
-    seen = set()
-
-    count = 0
-    while heap:
-        count += 1
-        # if count > 10_000:
-        #     raise Exception("Bork")
+    __slots__ = ()
 
-        item = heapq.heappop(heap)
 
-        if item[1:] in seen:
-            continue
-        seen.add(item[1:])
+# Every move goes straight for a few blocks then turns, so a state of the search only
+# needs the cell and whether the last move was horizontal (0) or vertical (1):
+# flat index * 2 + axis
+AXIS_STEPS: list[list[tuple[int, int]]] = [
+    # After a horizontal move, go up or down
+    [(-1, 0), (1, 0)],
+    # After a vertical move, go left or right
+    [(0, -1), (0, 1)],
+]
 
-        heat_loss, coord, line_check = item
-        # print(f"heat_loss={heat_loss}, coord={coord}, line_check={line_check}")
-        if coord == destination:
-            return heat_loss
 
-        for n_coord, direction, distance in cm.nb(coord, line_check[1], is_ultra):
-            new_line_check = (
-                (distance, direction)
-                if direction != line_check[1]
-                else (line_check[0] + distance, direction)
-            )
-
-            # Do the line check, if we've already moved 3/10 blocks in one direction, this is not a valid neighbor
-            if new_line_check[0] > max_distance:
-                continue
-
-            # Add the neighbor to the heap
-            next_item = (
-                heat_loss + cm.compute_heatloss(coord, n_coord),
-                n_coord,
-                new_line_check,
-            )
-
-            if next_item[1:] not in seen:
-                heapq.heappush(heap, next_item)
-
-    raise Exception("Destination not found")
+def min_heat_loss(cm: CityMap, is_ultra: bool = False) -> int:
+    width, height = cm.width, cm.height
+    data = cm.data
+    min_distance, max_distance = (4, 10) if is_ultra else (1, 3)
+    destination = cm.idx(height - 1, width - 1)
+
+    def neighbors(state: int) -> list[tuple[int, int]]:
+        i, axis = divmod(state, 2)
+        row, col = divmod(i, width)
+        new_axis = 1 - axis
+        out = []
+        for d_row, d_col in AXIS_STEPS[axis]:
+            # How far we can go before the edge
+            if d_row:
+                room = row if d_row < 0 else height - 1 - row
+            else:
+                room = col if d_col < 0 else width - 1 - col
+            step = d_row * width + d_col
+            heat_loss = 0
+            n = i
+            for distance in range(1, min(max_distance, room) + 1):
+                n += step
+                heat_loss += data[n]
+                if distance >= min_distance:
+                    out.append((n * 2 + new_axis, heat_loss))
+        return out
+
+    start = cm.idx(0, 0)
+    result = dial(
+        # Both ways are open from the start
+        [start * 2, start * 2 + 1],
+        neighbors,
+        max_weight=9 * max_distance,
+        is_goal=lambda state: state >> 1 == destination,
+        size=width * height * 2,
+    )
+    metrics.incr("day17.nodes_expanded", result.expanded)
+    metrics.incr("day17.queue_pushes", result.pushed)
+    if result.goal is None:
+        raise Exception("Destination not found")
+    return int(result.cost)
+
+
+def parse(text: str) -> CityMap:
+    return CityMap.from_string(text.strip(), storage="digits")
+
+
+def first_parsed(city_map: CityMap) -> int:
+    return min_heat_loss(city_map)
 
 
 def first(input: TextIO) -> int:
-    city_map: CityMap = CityMap.from_string(input.read().strip(), lambda v: int(v))
+    return first_parsed(parse(input.read()))
 
-    return min_heat_loss(city_map)
 
+def second_parsed(city_map: CityMap) -> int:
+    return min_heat_loss(city_map, is_ultra=True)
 
-def second(input: TextIO) -> int:
-    city_map: CityMap = CityMap.from_string(input.read().strip(), lambda v: int(v))
 
-    return min_heat_loss(city_map, is_ultra=True)
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
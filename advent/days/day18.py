@@ -2,12 +2,11 @@ import itertools as it
 import re
 from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import DefaultDict, Deque, TextIO
-
-from termcolor import cprint
+from typing import DefaultDict, Deque, Optional, TextIO
 
+from advent.debug import debug
 from advent.intervals import Interval
-from advent.matrix import Coord, Direction, get_delta_dir
+from advent.matrix import ChunkedGrid, Coord, Direction, get_delta_dir
 from advent.utils import tadd
 
 
@@ -20,7 +19,8 @@ class Instruction:
 
 DigPlan = list[Instruction]
 
-Trench = DefaultDict[Coord, list[Direction]]
+# Directions dug through each cell, None where nothing was dug
+Trench = ChunkedGrid[Optional[list[Direction]]]
 Vertices = dict[Coord, list[Direction]]
 Segment = tuple[Coord, Coord]
 
@@ -107,14 +107,20 @@ def instruction_to_vertices(
 
 def dig_trench(dig_plan: DigPlan) -> Trench:
     start = (0, 0)
-    trench = defaultdict(list)
+    trench: Trench = ChunkedGrid(None)
+
+    def dig(c: Coord, direction: Direction) -> None:
+        directions = trench[c]
+        if directions is None:
+            trench[c] = directions = []
+        directions.append(direction)
 
     curr = start
     for instruction in dig_plan:
-        trench[curr].append(instruction.direction)
+        dig(curr, instruction.direction)
         for _ in range(instruction.count):
             curr = tadd(curr, get_delta_dir(instruction.direction))
-            trench[curr].append(instruction.direction)
+            dig(curr, instruction.direction)
 
     # Flip the start
     trench[0, 0] = list(reversed(trench[0, 0]))
@@ -123,20 +129,15 @@ def dig_trench(dig_plan: DigPlan) -> Trench:
 
 
 def dig_interior(dig_plan: DigPlan, trench: Trench) -> set[Coord]:
-    min_row, min_col = next(iter(trench.keys()))
-    max_row, max_col = min_row, min_col
-
-    # Find the min/max row and column, these are all the cubes we're considering for digging
-    for row, col in trench:
-        min_row, max_row = min(min_row, row), max(max_row, row)
-        min_col, max_col = min(min_col, col), max(max_col, col)
+    # These are all the cubes we're considering for digging
+    (min_row, min_col), (max_row, max_col) = trench.bounds()
 
     inside: set[Coord] = set()
 
     # Not super efficient, we're looking at every point to figure out if it's inside using "ray tracing"
     # odd number of intersections => inside
     for c in it.product(range(min_row, max_row + 1), range(min_col, max_col + 1)):
-        if c in trench:
+        if trench[c] is not None:
             # It's already dug out, not inside nor outside
             continue
 
@@ -146,7 +147,7 @@ def dig_interior(dig_plan: DigPlan, trench: Trench) -> set[Coord]:
         for i_col in range(col + 1, max_col + 1):
             curr = (row, i_col)
             # Ignore horizontal rows in the count, but we do count corners
-            if curr in trench and (
+            if trench[curr] is not None and (
                 trench[curr]
                 not in (
                     ["left"],
@@ -166,25 +167,20 @@ def dig_interior(dig_plan: DigPlan, trench: Trench) -> set[Coord]:
     return inside
 
 
-def debug(trench: Trench, interior: set[Coord]) -> None:
-    min_row, min_col = next(iter(trench.keys()))
-    max_row, max_col = min_row, min_col
-
-    # Find the min/max row and column, these are all the cubes we're considering for digging
-    for row, col in trench:
-        min_row, max_row = min(min_row, row), max(max_row, row)
-        min_col, max_col = min(min_col, col), max(max_col, col)
+def render(trench: Trench, interior: set[Coord]) -> str:
+    from termcolor import colored
 
-    print()
+    (min_row, min_col), (max_row, max_col) = trench.bounds()
 
-    print_color = lambda x, color: cprint(x, color, end="")
+    out = ["\n"]
+    print_color = lambda x, color: out.append(colored(x, color))
 
     for row in range(min_row, max_row + 1):
-        print()
+        out.append("\n")
         for col in range(min_col, max_col + 1):
             c = (row, col)
             to_print = "."
-            if c in trench:
+            if trench[c] is not None:
                 to_print = "#"
             if c in interior:
                 to_print = "*"
@@ -192,7 +188,7 @@ def debug(trench: Trench, interior: set[Coord]) -> None:
                 print_color(to_print, "yellow")
             elif to_print == "#":
                 if c == (0, 0):
-                    print("X", end="")
+                    out.append("X")
                     continue
                 if len(trench[c]) == 2:
                     if trench[c] in (
@@ -205,10 +201,10 @@ def debug(trench: Trench, interior: set[Coord]) -> None:
                     else:
                         print_color(to_print, "green")
                 else:
-                    print(to_print, end="")
+                    out.append(to_print)
             else:
-                print(to_print, end="")
-    print()
+                out.append(to_print)
+    return "".join(out)
 
 
 def overlap(i1: Interval, i2: Interval) -> bool:
@@ -347,7 +343,13 @@ def count(hsegs: H_Segments) -> int:
         transition_intervals = union_intervals(old_intervals, intervals)
         transition_surface = sum(1 + end - start for start, end in transition_intervals)
 
-        print(f"last_row={last_row} new_row={new_row} new_surface={new_surface}")
+        debug(
+            "last_row=%s new_row=%s new_surface=%s",
+            last_row,
+            new_row,
+            new_surface,
+            level=2,
+        )
         total += new_surface + transition_surface
 
         last_row = new_row
@@ -360,8 +362,8 @@ def first_unoptimized(input: TextIO) -> int:
     dig_plan = parse_input(input)
     trench = dig_trench(dig_plan)
     interior = dig_interior(dig_plan, trench)
-    debug(trench, interior)
-    return len(trench) + len(interior)
+    debug(lambda: render(trench, interior), level=2)
+    return sum(1 for _ in trench.items()) + len(interior)
 
 
 def first(input: TextIO) -> int:
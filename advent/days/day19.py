@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Callable, Literal, Optional, TextIO, Union
 import re
 
+from advent.debug import debug
 from advent.intervals import Interval
 from advent.utils import prod
 
@@ -93,8 +94,11 @@ def parse_part(s: str) -> Part:
     return Part(int(x), int(m), int(a), int(s))
 
 
-def parse_input(input: TextIO) -> tuple[Workflows, list[Part]]:
-    s_wf, s_parts = input.read().strip().split("\n\n")
+System = tuple[Workflows, list[Part]]
+
+
+def parse(text: str) -> System:
+    s_wf, s_parts = text.strip().split("\n\n")
     workflow_list = [parse_workflow(wf) for wf in s_wf.splitlines()]
     parts = [parse_part(p) for p in s_parts.splitlines()]
     return {wf.name: wf for wf in workflow_list}, parts
@@ -169,9 +173,10 @@ def comb_accepted_by_wf(
             "s": (1, 4000),
         }
 
-    print(
-        stack * "\t"
-        + f"{wf_name} x={unknowns['x']},m={unknowns['m']},a={unknowns['a']},s={unknowns['s']}  total={total(unknowns)}"
+    debug(
+        lambda: stack * "\t"
+        + f"{wf_name} x={unknowns['x']},m={unknowns['m']},a={unknowns['a']},s={unknowns['s']}  total={total(unknowns)}",
+        level=2,
     )
 
     wf = wfs[wf_name]
@@ -186,9 +191,10 @@ def comb_accepted_by_wf(
         if passed:
             if r.result == "A":
                 # print(f"{wf} {r} A:{passed}")
-                print(
-                    (stack + 1) * "\t"
-                    + f"{wf_name} {r} x={passed['x']},m={passed['m']},a={passed['a']},s={passed['s']}"
+                debug(
+                    lambda: (stack + 1) * "\t"
+                    + f"{wf_name} {r} x={passed['x']},m={passed['m']},a={passed['a']},s={passed['s']}",
+                    level=2,
                 )
                 accepted += total(passed)
             elif r.result == "R":
@@ -206,9 +212,10 @@ def comb_accepted_by_wf(
         # print(f"{wf} default {wf.default}={unknowns}")
         if wf.default == "A":
             # print(f"{wf} default A:{unknowns}")
-            print(
-                (stack + 1) * "\t"
-                + f"{wf_name} def A x={unknowns['x']},m={unknowns['m']},a={unknowns['a']},s={unknowns['s']}"
+            debug(
+                lambda: (stack + 1) * "\t"
+                + f"{wf_name} def A x={unknowns['x']},m={unknowns['m']},a={unknowns['a']},s={unknowns['s']}",
+                level=2,
             )
             accepted += total(unknowns)
         elif wf.default == "R":
@@ -218,15 +225,23 @@ def comb_accepted_by_wf(
             # Follow with the other workflows
             accepted += comb_accepted_by_wf(wf.default, wfs, unknowns, stack + 1)
 
-    print(stack * "\t" + f"{wf.name} -> {accepted}")
+    debug(lambda: stack * "\t" + f"{wf.name} -> {accepted}", level=2)
     return accepted
 
 
-def first(input: TextIO) -> int:
-    wfs, parts = parse_input(input)
+def first_parsed(system: System) -> int:
+    wfs, parts = system
     return sum(p.rating() for p in parts if process(p, wfs) == "A")
 
 
-def second(input: TextIO) -> int:
-    wfs, _ = parse_input(input)
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def second_parsed(system: System) -> int:
+    wfs, _ = system
     return comb_accepted_by_wf("in", wfs)
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
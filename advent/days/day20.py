@@ -1,9 +1,10 @@
-import io
+import copy
 import re
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Deque, Literal, Optional, TextIO, cast
 
+from advent.debug import debug
 from advent.utils import prod
 
 Pulse = Literal[0, 1]
@@ -100,8 +101,8 @@ def parse_module(smod: str) -> Module:
     return clz(name, dests)
 
 
-def parse_input(input: TextIO) -> Modules:
-    lines = input.read().strip().splitlines()
+def parse(text: str) -> Modules:
+    lines = text.strip().splitlines()
     modules: Modules = {}
     for line in lines:
         m = parse_module(line)
@@ -117,6 +118,10 @@ def parse_input(input: TextIO) -> Modules:
     return modules
 
 
+def parse_input(input: TextIO) -> Modules:
+    return parse(input.read())
+
+
 # source, dest, pulse
 PulseToHandle = tuple[str, str, Pulse]
 PulseQueue = Deque[PulseToHandle]
@@ -161,8 +166,9 @@ def press(modules: Modules, stop_on: Optional[str] = None) -> tuple[int, int]:
     return low_count, high_count
 
 
-def first(input: TextIO) -> int:
-    modules = parse_input(input)
+def first_parsed(modules: Modules) -> int:
+    # Modules keep their state between presses, don't touch the parsed ones
+    modules = copy.deepcopy(modules)
     counts = [0, 0]
     for _ in range(1000):
         low, high = press(modules)
@@ -171,8 +177,12 @@ def first(input: TextIO) -> int:
     return counts[0] * counts[1]
 
 
-def counts_for_zero(input: TextIO, stop_on: str) -> int:
-    modules = parse_input(input)
+def first(input: TextIO) -> int:
+    return first_parsed(parse(input.read()))
+
+
+def counts_for_zero(modules: Modules, stop_on: str) -> int:
+    modules = copy.deepcopy(modules)
     low, high = 0, 0
     count = 0
     while True:
@@ -190,12 +200,15 @@ def counts_for_zero(input: TextIO, stop_on: str) -> int:
     return count
 
 
-def second(input: TextIO) -> int:
-    s = input.read()
-    js = counts_for_zero(io.StringIO(s), "js")
-    qs = counts_for_zero(io.StringIO(s), "qs")
-    dt = counts_for_zero(io.StringIO(s), "dt")
-    ts = counts_for_zero(io.StringIO(s), "ts")
+def second_parsed(modules: Modules) -> int:
+    js = counts_for_zero(modules, "js")
+    qs = counts_for_zero(modules, "qs")
+    dt = counts_for_zero(modules, "dt")
+    ts = counts_for_zero(modules, "ts")
 
-    print(js, qs, dt, ts)
+    debug("js=%d qs=%d dt=%d ts=%d", js, qs, dt, ts)
     return js * qs * dt * ts
+
+
+def second(input: TextIO) -> int:
+    return second_parsed(parse(input.read()))
@@ -3,19 +3,31 @@ from typing import Callable, List, Literal, Optional, TextIO
 import itertools as it
 
 
-from advent.matrix import Coord, Matrix, T
+from advent import metrics
+from advent.bitgrid import BitGrid
+from advent.debug import debug
+from advent.matrix import ChunkedGrid, Coord, Matrix, T
+from advent.search import bfs_layers
 
 TOTAL_STEPS = 26501365
 
 
 class Garden(Matrix[str]):
+    __slots__ = ("start", "unlimited", "__hash", "_plots", "_tiled")
+
     start: Coord
-    unlimited: bool = False
+    unlimited: bool
     __hash: int
+    # Built on first use, see plots and tiled
+    _plots: Optional[BitGrid]
+    _tiled: Optional[ChunkedGrid[str]]
 
     def __init__(self, data: List[T], width: int, height: int):
         super().__init__(data, width, height)
+        self.unlimited = False
         self.__hash = hash("".join(data))
+        self._plots = None
+        self._tiled = None
 
         for c, v in self.items():
             if v == "S":
@@ -33,24 +45,23 @@ class Garden(Matrix[str]):
         return cls(data_as_array, width, height)
 
     def __getitem__(self, coord: Coord) -> str:
+        if self.unlimited:
+            return self.tiled[coord]
         return self.data[self.__get_index(coord)]
 
     def __get_index(self, coord: Coord):
-        if not self.unlimited:
-            row, col = coord
-            if not self.is_valid_coord(coord):
-                raise IndexError(f"Coord out of range {coord}")
-            return row * self.width + col
-
         row, col = coord
-
-        col = (self.width + col) % self.width if col < 0 else col % self.width
-
-        # TODO
-        row = (self.height + row) % self.height if row < 0 else row % self.height
-
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
         return row * self.width + col
 
+    @property
+    def tiled(self) -> ChunkedGrid[str]:
+        """The garden repeated in every direction."""
+        if self._tiled is None:
+            self._tiled = ChunkedGrid.repeat(self)
+        return self._tiled
+
     def is_valid_coord(self, coord: Coord) -> bool:
         if self.unlimited:
             return True
@@ -59,6 +70,17 @@ class Garden(Matrix[str]):
     def __hash__(self):
         return self.__hash
 
+    def plot_neighbors(self, coord: Coord) -> list[Coord]:
+        return [nc for nc in self.nbc4(coord) if self[nc] == "."]
+
+    @property
+    def plots(self) -> BitGrid:
+        if self._plots is None:
+            self._plots = BitGrid.from_cells(
+                self.data, self.width, self.height, lambda v: v == "."
+            )
+        return self._plots
+
 
 MEMO: dict[(int, Coord):int] = {}
 
@@ -83,26 +105,47 @@ def count_reachable(garden: Garden, steps: int, start: Optional[Coord] = None) -
     if steps == 1:
         return len({nc for nc in garden.nbc4(sc) if garden[nc] == "."})
 
-    reachable: list[set[Coord]] = [set() for _ in range(steps + 1)]
-    reachable[0] = {sc}
-    seen = {sc}
+    if not garden.unlimited:
+        return count_reachable_bounded(garden, steps, sc)
 
-    for i in range(1, steps + 1):
-        if len(reachable[i - 1]) == 0:
-            break
-        for c in reachable[i - 1]:
-            new_c = {
-                nc for nc in garden.nbc4(c) if garden[nc] == "." and nc not in seen
-            }
-            seen |= new_c
-            reachable[i] |= new_c
-
-    val = sum(len(tiles) for tiles in reachable[steps % 2 :: 2])
+    # Plots reachable in exactly `steps` are the ones first reached with the same parity
+    val = 0
+    expanded = 0
+    for i, layer in enumerate(bfs_layers([sc], garden.plot_neighbors, steps)):
+        metrics.observe("day21.frontier", len(layer))
+        expanded += len(layer)
+        if i % 2 == steps % 2:
+            val += len(layer)
+
+    metrics.incr("day21.plots_expanded", expanded)
     # MEMO[cache_key] = val
     # print(f"steps={steps} entry={sc} count={val}")
     return val
 
 
+def count_reachable_bounded(garden: Garden, steps: int, start: Coord) -> int:
+    """count_reachable for a garden that doesn't repeat, each step of the BFS moves the
+    whole frontier at once."""
+    plots = garden.plots
+    frontier = BitGrid.from_coords([start], garden.width, garden.height)
+    seen = frontier
+    # Plots reachable in exactly `steps` are the ones first reached with the same parity
+    val = 1 if steps % 2 == 0 else 0
+
+    for i in range(1, steps + 1):
+        if not frontier:
+            break
+        if metrics.enabled:
+            metrics.observe("day21.frontier", frontier.popcount())
+        frontier = frontier.dilate() & plots & ~seen
+        seen = seen | frontier
+        if i % 2 == steps % 2:
+            val += frontier.popcount()
+
+    metrics.incr("day21.plots_expanded", seen.popcount())
+    return val
+
+
 Corner = Literal["NW", "NE", "SW", "SE"]
 Midpoint = Literal["W", "N", "E", "S"]
 Start = Literal["O"]
@@ -208,7 +251,7 @@ def total_visitable_old(garden: Garden, total_steps: int = TOTAL_STEPS) -> int:
             if used > total_steps:
                 break
 
-            print(f"gx={gx} gy={gy} entry={entry} left={left}")
+            debug("gx=%d gy=%d entry=%s left=%d", gx, gy, entry, left, level=2)
             if stopper == 5:
                 return -1
 
@@ -243,7 +286,7 @@ def total_visitable(garden: Garden, total_steps: int = TOTAL_STEPS) -> int:
     if total_steps % 2 == 1:
         odd, even = even, odd
 
-    print(f"odd={odd} even={even}")
+    debug("odd=%d even=%d", odd, even)
 
     count = 0
 
@@ -279,48 +322,31 @@ def total_visitable(garden: Garden, total_steps: int = TOTAL_STEPS) -> int:
     return count
 
 
-def first(input: TextIO, steps: int = 64) -> int:
-    garden = Garden.from_string(input.read().strip())
+def parse(text: str) -> Garden:
+    return Garden.from_string(text.strip())
+
 
+def first_parsed(garden: Garden, steps: int = 64) -> int:
     return count_reachable(garden, steps)
 
 
-def second(input: TextIO, steps: int = TOTAL_STEPS) -> int:
-    garden = Garden.from_string(input.read().strip())
+def first(input: TextIO, steps: int = 64) -> int:
+    return first_parsed(parse(input.read()), steps)
+
 
+def second_parsed(garden: Garden, steps: int = TOTAL_STEPS) -> int:
     return total_visitable(garden, steps)
 
 
+def second(input: TextIO, steps: int = TOTAL_STEPS) -> int:
+    return second_parsed(parse(input.read()), steps)
+
+
 # HELP METHODS
 def how_many_steps_to_visit_all_from_entry(garden: Garden, entry: Coord) -> int:
-    unvisited = {c for c, v in garden.items() if v != "#"}
-    steps = 0
-    unvisited.remove(entry)
-
-    to_visit = {entry}
-    while to_visit:
-        steps += 1
-        new_to_visit = set()
-        for plot in to_visit:
-            new_to_visit |= {
-                nc for nc in garden.nbc4(plot) if garden[nc] == "." and nc in unvisited
-            }
-            unvisited -= new_to_visit
-        to_visit = new_to_visit
-    return steps
+    return sum(1 for _ in bfs_layers([entry], garden.plot_neighbors))
 
 
 def how_many_visitable(garden: Garden) -> int:
     """This is a debug method that tells the max number of visitable squares for a given garden"""
-    start = (0, 0)
-    seen = {start}
-    to_visit = [start]
-    while to_visit:
-        new_to_visit = set()
-        for plot in to_visit:
-            new_to_visit |= {
-                nc for nc in garden.nbc4(plot) if garden[nc] == "." and nc not in seen
-            }
-            seen |= new_to_visit
-        to_visit = new_to_visit
-    return len(seen)
+    return sum(garden.flood_fill(garden.start, lambda v: v == ".").sizes)
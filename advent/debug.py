@@ -0,0 +1,37 @@
+"""
+Debug output of the day modules, off unless the CLI is run with -v (1) or -vv (2).
+
+Nothing is formatted nor rendered while disabled, so it can stay in hot loops:
+
+    debug("row=%d count=%d", row, count, level=2)
+    debug(lambda: render(grid))
+    if enabled(2):
+        ...
+"""
+
+import sys
+from typing import Any, Callable, Union
+
+# 0: quiet, 1: what the solutions found, 2: what they do at every step
+verbosity = 0
+
+
+def set_verbosity(level: int) -> None:
+    global verbosity
+    verbosity = level
+
+
+def enabled(level: int = 1) -> bool:
+    return verbosity >= level
+
+
+def debug(message: Union[str, Callable[[], str]], *args: Any, level: int = 1) -> None:
+    """Write to stderr if verbose enough. The message is %-formatted with args, or
+    called if it's a function, only then."""
+    if verbosity < level:
+        return
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
+    print(message, file=sys.stderr)
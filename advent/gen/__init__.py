@@ -0,0 +1,18 @@
+"""
+Synthetic input generators, to run the days on inputs much bigger than the real ones.
+
+There is one module per day, advent/gen/dayXX.py, with a `generate(size, seed)` function
+returning the input as a string. What `size` means depends on the day (number of lines,
+grid side...), see each module. The same size and seed always give the same input.
+"""
+
+import importlib
+from types import ModuleType
+
+
+def load_generator(day_num: int) -> ModuleType:
+    return importlib.import_module(f"{__name__}.day{day_num:02}")
+
+
+def generate(day_num: int, size: int, seed: int = 0) -> str:
+    return load_generator(day_num).generate(size, seed)
@@ -0,0 +1,28 @@
+import random
+import string
+
+from advent.days.day01 import NUMBERS
+
+MAX_TOKENS = 8
+
+
+def line(rng: random.Random) -> str:
+    tokens = [rng.choice(string.digits[1:])]
+    for _ in range(rng.randint(0, MAX_TOKENS)):
+        kind = rng.random()
+        if kind < 0.3:
+            tokens.append(rng.choice(string.digits[1:]))
+        elif kind < 0.6:
+            tokens.append(rng.choice(list(NUMBERS)))
+        else:
+            tokens.append(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5)))
+            )
+    rng.shuffle(tokens)
+    return "".join(tokens)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` lines, each with at least one digit."""
+    rng = random.Random(seed)
+    return "".join(line(rng) + "\n" for _ in range(size))
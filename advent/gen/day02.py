@@ -0,0 +1,18 @@
+import random
+
+COLORS = ["red", "green", "blue"]
+
+
+def hand(rng: random.Random) -> str:
+    colors = rng.sample(COLORS, rng.randint(1, len(COLORS)))
+    return ", ".join(f"{rng.randint(1, 20)} {c}" for c in colors)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` games of 1 to 6 hands."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(1, size + 1):
+        hands = "; ".join(hand(rng) for _ in range(rng.randint(1, 6)))
+        lines.append(f"Game {i}: {hands}\n")
+    return "".join(lines)
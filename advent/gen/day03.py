@@ -0,0 +1,28 @@
+import random
+
+from advent.days.day03 import SYMBOLS
+from advent.gen.utils import grid_to_string
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` schematic, numbers are never next to each other on a row."""
+    rng = random.Random(seed)
+    symbols = sorted(SYMBOLS)
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            r = rng.random()
+            length = rng.randint(1, 3)
+            if r < 0.15 and len(row) + length <= size:
+                # Leading zeros would be read back as a different number
+                row.append(str(rng.randint(1, 9)))
+                row += [str(rng.randint(0, 9)) for _ in range(length - 1)]
+                if len(row) < size:
+                    row.append(".")
+            elif r < 0.2:
+                row.append(rng.choice(symbols))
+            else:
+                row.append(".")
+        rows.append(row)
+    return grid_to_string(rows)
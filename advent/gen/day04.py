@@ -0,0 +1,21 @@
+import random
+
+WINNING = 10
+NUMBERS = 25
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` cards, the cards won are always within the table."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(1, size + 1):
+        left = size - i
+        winning = rng.sample(range(1, 100), WINNING)
+        matches = min(rng.choice([0, 0, 0, 1, 1, 2, 3, 5, 10]), left)
+        others = rng.sample([n for n in range(1, 100) if n not in winning], NUMBERS)
+        numbers = rng.sample(winning, matches) + others[matches:]
+        rng.shuffle(numbers)
+        s_winning = " ".join(f"{n:>2}" for n in winning)
+        s_numbers = " ".join(f"{n:>2}" for n in numbers)
+        lines.append(f"Card {i:>3}: {s_winning} | {s_numbers}\n")
+    return "".join(lines)
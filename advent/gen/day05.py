@@ -0,0 +1,53 @@
+import random
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+# Numbers stay in [1, SPAN), day05.process_map stops on a 0
+SPAN = 2**32
+SEED_RANGES = 10
+
+
+def almanac_map(rng: random.Random, size: int) -> list[tuple[int, int, int]]:
+    """`size` (destination, source, length) entries, shuffling contiguous ranges.
+
+    The ranges are moved around within the span they cover, so the map is one to one,
+    like in the real input. Numbers outside of that span map to themselves.
+    """
+    cuts = sorted(rng.sample(range(1, SPAN), size + 1))
+    sources = list(zip(cuts, cuts[1:]))
+    destinations = sources[:]
+    rng.shuffle(destinations)
+
+    entries = []
+    dest = cuts[0]
+    for start, end in destinations:
+        entries.append((dest, start, end - start))
+        dest += end - start
+    rng.shuffle(entries)
+    return entries
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """7 maps of `size` entries each, and 10 seed ranges."""
+    rng = random.Random(seed)
+
+    seeds = []
+    for _ in range(SEED_RANGES):
+        start = rng.randrange(1, SPAN // 2)
+        seeds += [start, rng.randrange(1, SPAN // 2 // SEED_RANGES)]
+
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for source, dest in zip(CATEGORIES, CATEGORIES[1:]):
+        entries = almanac_map(rng, size)
+        lines = [f"{d} {s} {n}" for d, s, n in entries]
+        blocks.append(f"{source}-to-{dest} map:\n" + "\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
@@ -0,0 +1,20 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` races that can all be won, the concatenated race of part 2 too.
+
+    Every time has 2 digits and every record 4, the concatenated race is then dominated by
+    the first one, which can be won. Past 4 races the concatenated numbers are too big
+    for the float math of day06.how_many_ways to be exact.
+    """
+    rng = random.Random(seed)
+    times, distances = [], []
+    for _ in range(size):
+        t = rng.randint(70, 99)
+        times.append(t)
+        distances.append(rng.randint(1000, t * t // 4 - 50))
+    return (
+        "Time:     " + " ".join(f"{t:>5}" for t in times) + "\n"
+        "Distance: " + " ".join(f"{d:>5}" for d in distances) + "\n"
+    )
@@ -0,0 +1,19 @@
+import random
+
+from advent.days.day07 import CARDS
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` hands, all different as long as there are enough possible hands."""
+    rng = random.Random(seed)
+    unique = size <= len(CARDS) ** 5 // 2
+    seen = set()
+    lines = []
+    while len(lines) < size:
+        hand = "".join(rng.choices(CARDS, k=5))
+        if unique:
+            if hand in seen:
+                continue
+            seen.add(hand)
+        lines.append(f"{hand} {rng.randint(1, 1000)}\n")
+    return "".join(lines)
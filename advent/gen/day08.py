@@ -0,0 +1,48 @@
+import random
+import string
+
+from advent.gen.utils import unique_names
+
+GHOSTS = 6
+# Each ghost loops over its ring in a multiple of the instructions length
+FACTORS = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+ALPHABET = string.ascii_uppercase + string.digits
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` instructions, and 6 ghosts going round a loop of `size` x a prime nodes.
+
+    AAA -> ZZZ is one of the loops. Like in the real input, a ghost reaches its Z node
+    for the first time after a full loop, and then every loop.
+    """
+    rng = random.Random(seed)
+    instructions = "".join(rng.choices("LR", k=size))
+    factors = rng.sample(FACTORS, GHOSTS)
+    loops = [size * f for f in factors]
+
+    # Node names are a prefix, and A/Z or another letter at the end
+    others = unique_names(rng, GHOSTS - 1 + sum(loops), 2, ALPHABET, ["AA", "ZZ"])
+    prefixes = ["ZZ"] + others
+    names = iter(prefixes[GHOSTS:])
+    letters = ALPHABET.replace("A", "").replace("Z", "")
+
+    nodes = {}
+    for g, length in enumerate(loops):
+        start, end = (
+            ("AAA", "ZZZ") if g == 0 else (prefixes[g] + "A", prefixes[g] + "Z")
+        )
+        # end is at position 0 of the loop, start is only used to enter it
+        ring = [end] + [next(names) + rng.choice(letters) for _ in range(length - 1)]
+        decoy = next(names) + rng.choice(letters)
+        nodes[decoy] = (decoy, decoy)
+
+        for i, node in enumerate(ring):
+            following = ring[(i + 1) % length]
+            left = instructions[i % size] == "L"
+            nodes[node] = (following, decoy) if left else (decoy, following)
+        nodes[start] = nodes[end]
+
+    items = list(nodes.items())
+    rng.shuffle(items)
+    network = "\n".join(f"{n} = ({l}, {r})" for n, (l, r) in items)
+    return f"{instructions}\n\n{network}\n"
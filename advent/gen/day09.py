@@ -0,0 +1,17 @@
+import random
+from math import comb
+
+LENGTH = 21
+
+
+def sequence(rng: random.Random) -> list[int]:
+    """The values of a random polynomial, built from its forward differences."""
+    degree = rng.randint(0, LENGTH - 3)
+    diffs = [rng.randint(-5, 5) for _ in range(degree + 1)]
+    return [sum(d * comb(n, k) for k, d in enumerate(diffs)) for n in range(LENGTH)]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` sequences of 21 values, each extrapolates before running out of values."""
+    rng = random.Random(seed)
+    return "".join(" ".join(map(str, sequence(rng))) + "\n" for _ in range(size))
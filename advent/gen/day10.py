@@ -0,0 +1,135 @@
+import random
+
+from advent.gen.utils import grid_to_string
+from advent.matrix import Coord
+
+UP, RIGHT, DOWN, LEFT = (-1, 0), (0, 1), (1, 0), (0, -1)
+PIPES = {
+    frozenset([UP, DOWN]): "|",
+    frozenset([LEFT, RIGHT]): "-",
+    frozenset([UP, RIGHT]): "L",
+    frozenset([UP, LEFT]): "J",
+    frozenset([DOWN, LEFT]): "7",
+    frozenset([DOWN, RIGHT]): "F",
+}
+# Ends of each pipe
+CONNECTS = {pipe: ends for ends, pipe in PIPES.items()}
+
+# Fraction of the blob cells grown, see grow_loop
+BLOB_FILL = 0.5
+
+# 8 neighbors of a cell, in order around it
+RING = [(-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1)]
+
+
+def delta(a: Coord, b: Coord) -> Coord:
+    return b[0] - a[0], b[1] - a[1]
+
+
+def can_add(blob: set[Coord], cell: Coord) -> bool:
+    """Whether the blob stays in one piece, without holes and without two cells touching
+    by a corner only, so that its outline is a simple loop."""
+    around = [(cell[0] + dr, cell[1] + dc) in blob for dr, dc in RING]
+    # Edge neighbors are the odd ones, corners the even ones
+    if not any(around[1::2]):
+        return False
+    # A corner needs one of the edges next to it
+    if any(
+        around[k] and not around[k - 1] and not around[(k + 1) % 8]
+        for k in (0, 2, 4, 6)
+    ):
+        return False
+    # One run of cells around, otherwise the blob would close on an empty area
+    return sum(around[k] and not around[k - 1] for k in range(8)) == 1
+
+
+def grow_loop(rng: random.Random, size: int) -> dict[Coord, Coord]:
+    """A random simple loop with tiles inside, as a tile -> next tile mapping.
+
+    Grow a random blob of cells on a grid half the size, cell (r, c) is tile
+    (2r + 1, 2c + 1) and the loop goes around the blob, through the even rows and
+    columns. Everything in the blob that isn't the loop is inside.
+    """
+    cells = (size - 1) // 2
+    blob = {(cells // 2, cells // 2)}
+    grown = list(blob)
+    target = max(1, int(BLOB_FILL * cells * cells))
+    for _ in range(8 * cells * cells):
+        if len(grown) >= target:
+            break
+        r, c = rng.choice(grown)
+        dr, dc = rng.choice([UP, RIGHT, DOWN, LEFT])
+        cell = (r + dr, c + dc)
+        if cell in blob or not (0 <= cell[0] < cells and 0 <= cell[1] < cells):
+            continue
+        if can_add(blob, cell):
+            blob.add(cell)
+            grown.append(cell)
+
+    # Sides of the cells that have no cell on the other side, and their ends
+    loop: set[Coord] = set()
+    for r, c in blob:
+        for dr, dc in [UP, RIGHT, DOWN, LEFT]:
+            if (r + dr, c + dc) in blob:
+                continue
+            side = (2 * r + 1 + dr, 2 * c + 1 + dc)
+            loop.add(side)
+            # The corners at both ends of the side
+            loop.add((side[0] + dc, side[1] + dr))
+            loop.add((side[0] - dc, side[1] - dr))
+
+    # Every tile of the loop has exactly two neighbors in it, walk them
+    start = min(loop)
+    following: dict[Coord, Coord] = {}
+    previous, curr = None, start
+    while not following or curr != start:
+        nxt = next(
+            n
+            for d in [UP, RIGHT, DOWN, LEFT]
+            if (n := (curr[0] + d[0], curr[1] + d[1])) in loop and n != previous
+        )
+        following[curr] = nxt
+        previous, curr = curr, nxt
+    assert len(following) == len(loop)
+    return following
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` sketch, a single loop through S and junk pipes around and
+    inside it."""
+    assert size >= 3
+    rng = random.Random(seed)
+    following = grow_loop(rng, size)
+    previous = {b: a for a, b in following.items()}
+
+    grid = [[rng.choice("|-LJ7F...") for _ in range(size)] for _ in range(size)]
+    for tile, nxt in following.items():
+        ends = frozenset([delta(tile, nxt), delta(tile, previous[tile])])
+        grid[tile[0]][tile[1]] = PIPES[ends]
+
+    def points_to(tile: Coord, target: Coord) -> bool:
+        pipe = grid[tile[0]][tile[1]]
+        return pipe in CONNECTS and delta(tile, target) in CONNECTS[pipe]
+
+    # S must only connect to the two pipes of the loop next to it
+    candidates = sorted(following)
+    rng.shuffle(candidates)
+    for start in candidates:
+        loop_neighbours = {following[start], previous[start]}
+        others = [
+            n
+            for d in [UP, RIGHT, DOWN, LEFT]
+            if (n := (start[0] + d[0], start[1] + d[1])) not in loop_neighbours
+            and 0 <= n[0] < size
+            and 0 <= n[1] < size
+        ]
+        if not any(n in following and points_to(n, start) for n in others):
+            break
+    else:
+        raise ValueError("No tile of the loop can be S")
+
+    for n in others:
+        if n not in following:
+            grid[n[0]][n[1]] = "."
+    grid[start[0]][start[1]] = "S"
+    return grid_to_string(grid)
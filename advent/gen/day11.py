@@ -0,0 +1,23 @@
+import math
+import random
+
+from advent.gen.utils import grid_to_string
+
+# Tiles per galaxy, about the same as the real input
+DENSITY = 45
+EMPTY_FRACTION = 0.05
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """An image with `size` galaxies, and about 5% of rows and columns empty."""
+    rng = random.Random(seed)
+    side = max(2, math.isqrt(size * DENSITY) + 1)
+    empty = max(1, int(side * EMPTY_FRACTION))
+    rows = sorted(rng.sample(range(side), side - empty))
+    columns = sorted(rng.sample(range(side), side - empty))
+
+    grid = [["."] * side for _ in range(side)]
+    for i in rng.sample(range(len(rows) * len(columns)), size):
+        r, c = divmod(i, len(columns))
+        grid[rows[r]][columns[c]] = "#"
+    return grid_to_string(grid)
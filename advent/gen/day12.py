@@ -0,0 +1,26 @@
+import random
+
+ROWS = 1000
+UNKNOWN_FRACTION = 0.5
+
+
+def row(rng: random.Random, size: int) -> str:
+    while True:
+        springs = rng.choices("#.", weights=[0.45, 0.55], k=size)
+        groups = [len(g) for g in "".join(springs).split(".") if g]
+        if groups:
+            break
+    for i in range(size):
+        if rng.random() < UNKNOWN_FRACTION:
+            springs[i] = "?"
+    return "".join(springs) + " " + ",".join(map(str, groups))
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """1000 rows of `size` springs, each with at least one arrangement (the one it
+    was made from) and at least one damaged group.
+
+    Part 2 unfolds them 5 times, so the rows it works on are 5 x `size` + 4 long.
+    """
+    rng = random.Random(seed)
+    return "".join(row(rng, size) + "\n" for _ in range(ROWS))
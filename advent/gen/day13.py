@@ -0,0 +1,68 @@
+import random
+
+from advent.days.day13 import has_one_bit_different, parse_pattern
+
+MIN_SIDE, MAX_SIDE = 5, 17
+
+
+def reflections(values: list[int], smudge: bool) -> list[int]:
+    """Every line the values reflect on, where day13 only looks for the first one."""
+    found = []
+    for i in range(1, len(values)):
+        size = min(i, len(values) - i)
+        pairs = list(zip(values[i - size : i], reversed(values[i : i + size])))
+        different = [(a, b) for a, b in pairs if a != b]
+        if not smudge and not different:
+            found.append(i)
+        elif smudge and len(different) == 1 and has_one_bit_different(*different[0]):
+            found.append(i)
+    return found
+
+
+def mirrored(i: int, length: int) -> list[int]:
+    """For each index, the one it reflects to across i, or itself if it has none."""
+    size = min(i, length - i)
+    return [2 * i - 1 - k if i - size <= k < i + size else k for k in range(length)]
+
+
+def candidate(rng: random.Random) -> list[list[str]]:
+    """A pattern with a row reflection, and a column reflection with one smudge.
+
+    Start from a pattern symmetric on both axes, and flip a tile that's on a row with no
+    reflection (the row reflection stays) but on a column with one (it becomes a smudge).
+    """
+    height = rng.randint(MIN_SIDE, MAX_SIDE)
+    width = rng.randint(MIN_SIDE, MAX_SIDE)
+    i = rng.choice([k for k in range(1, height) if 2 * k != height])
+    j = rng.randint(1, width - 1)
+    row_mirror, col_mirror = mirrored(i, height), mirrored(j, width)
+
+    grid = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+    for r in range(height):
+        for c in range(width):
+            grid[r][c] = grid[min(r, row_mirror[r])][min(c, col_mirror[c])]
+
+    r = rng.choice([k for k in range(height) if row_mirror[k] == k])
+    c = rng.choice([k for k in range(width) if col_mirror[k] != k])
+    grid[r][c] = "." if grid[r][c] == "#" else "#"
+
+    if rng.random() < 0.5:
+        grid = [list(col) for col in zip(*grid)]
+    return grid
+
+
+def pattern(rng: random.Random) -> str:
+    """A pattern with exactly one perfect reflection and one reflection with a smudge."""
+    while True:
+        s = "\n".join("".join(row) for row in candidate(rng))
+        rows, cols = parse_pattern(s)
+        perfect = reflections(rows, False) + reflections(cols, False)
+        smudged = reflections(rows, True) + reflections(cols, True)
+        if len(perfect) == 1 and len(smudged) == 1:
+            return s
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` patterns between 5x5 and 17x17."""
+    rng = random.Random(seed)
+    return "\n\n".join(pattern(rng) for _ in range(size)) + "\n"
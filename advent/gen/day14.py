@@ -0,0 +1,14 @@
+import random
+
+from advent.gen.utils import grid_to_string
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` platform, about 20% round rocks and 15% cube rocks.
+
+    day14.spin_cycle skips ahead with the cycle found in the real input, so part 2 only
+    gives the right answer for that input.
+    """
+    rng = random.Random(seed)
+    rows = [rng.choices("O#.", weights=[20, 15, 65], k=size) for _ in range(size)]
+    return grid_to_string(rows)
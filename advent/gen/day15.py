@@ -0,0 +1,18 @@
+import random
+import string
+
+from advent.gen.utils import unique_names
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` steps on about size / 4 lenses, a third of them removals."""
+    rng = random.Random(seed)
+    labels = unique_names(rng, max(1, size // 4), 2, string.ascii_lowercase)
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 1 / 3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
@@ -0,0 +1,12 @@
+import random
+
+from advent.gen.utils import grid_to_string
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` contraption, about 10% mirrors and splitters."""
+    rng = random.Random(seed)
+    rows = [
+        rng.choices("./\\|-", weights=[90, 3, 3, 2, 2], k=size) for _ in range(size)
+    ]
+    return grid_to_string(rows)
@@ -0,0 +1,10 @@
+import random
+
+from advent.gen.utils import grid_to_string
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` map of heat losses, from 1 to 9."""
+    rng = random.Random(seed)
+    rows = [rng.choices("123456789", k=size) for _ in range(size)]
+    return grid_to_string(rows)
@@ -0,0 +1,57 @@
+import random
+
+# Part 2 reads the direction as the last digit of the color
+DIRECTIONS = "RDLU"
+
+
+def profile(rng: random.Random, n: int, low: int, high: int) -> list[int]:
+    """n values, two consecutive ones are never the same."""
+    values = [rng.randint(low, high)]
+    while len(values) < n:
+        v = rng.randint(low, high)
+        if v != values[-1]:
+            values.append(v)
+    return values
+
+
+def polygon(rng: random.Random, n: int, low: int, high: int) -> list[tuple[str, int]]:
+    """A polygon made of n columns, each going from -top[i] to bottom[i].
+
+    It starts at the bottom left corner, goes right along the top and back left along
+    the bottom. Corners alternate between horizontal and vertical edges, and the
+    polygon never touches itself since every top is above every bottom.
+    """
+    widths = [rng.randint(low, high) for _ in range(n)]
+    tops = profile(rng, n, low, high)
+    bottoms = profile(rng, n, low, high)
+
+    def vertical(start: int, end: int) -> tuple[str, int]:
+        return ("D" if end > start else "U"), abs(end - start)
+
+    edges = [vertical(bottoms[0], -tops[0])]
+    for i in range(n):
+        edges.append(("R", widths[i]))
+        if i < n - 1:
+            edges.append(vertical(-tops[i], -tops[i + 1]))
+    edges.append(vertical(-tops[-1], bottoms[-1]))
+    for i in reversed(range(n)):
+        edges.append(("L", widths[i]))
+        if i > 0:
+            edges.append(vertical(bottoms[i], bottoms[i - 1]))
+    return edges
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A dig plan of 4 x `size` instructions.
+
+    The colors hold a much bigger polygon with as many edges, for part 2.
+    """
+    rng = random.Random(seed)
+    small = polygon(rng, size, 1, 10)
+    big = polygon(rng, size, 1, 0xFFFFF // 2)
+
+    lines = []
+    for (direction, count), (big_direction, big_count) in zip(small, big):
+        color = f"#{big_count:05x}{DIRECTIONS.index(big_direction)}"
+        lines.append(f"{direction} {count} ({color})\n")
+    return "".join(lines)
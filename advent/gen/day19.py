@@ -0,0 +1,79 @@
+import random
+
+from advent.gen.utils import unique_names
+
+PARTS = 200
+MAX_RULES = 4
+
+
+Interval = tuple[int, int]
+
+
+def rule(rng: random.Random, ranges: dict[str, Interval]) -> tuple[str, dict, dict]:
+    """A rule some of the ranges pass and some fail, day19 expects both to be non empty.
+
+    Returns the condition, and the ranges that pass and fail it.
+    """
+    category = rng.choice([c for c, (lo, hi) in ranges.items() if hi > lo])
+    lo, hi = ranges[category]
+    # Split around the middle so the ranges last down the tree
+    middle = round(rng.triangular(lo, hi))
+    if rng.random() < 0.5:
+        value = min(max(middle, lo + 1), hi)
+        passed, failed = (lo, value - 1), (value, hi)
+        condition = f"{category}<{value}"
+    else:
+        value = min(max(middle, lo), hi - 1)
+        passed, failed = (value + 1, hi), (lo, value)
+        condition = f"{category}>{value}"
+    return condition, {**ranges, category: passed}, {**ranges, category: failed}
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` workflows and 200 parts.
+
+    Like in the real input the workflows form a tree from "in": each one is sent to by
+    exactly one rule, so there are no loops and every part ends up accepted or rejected.
+    No rule is always or never passed by what reaches it.
+    """
+    rng = random.Random(seed)
+    names = ["in"] + unique_names(rng, size - 1, 2, exclude=["in"])
+    rule_counts = [rng.randint(1, MAX_RULES) for _ in names]
+
+    # One outcome per rule and one for the default, each workflow is the outcome of a
+    # slot of one before it. Take one of the oldest free slots, every rule splits the
+    # ranges so a deep tree would run out of them.
+    outcomes: list[list] = [[None] * (n + 1) for n in rule_counts]
+    free = [(0, k) for k in range(len(outcomes[0]))]
+    for i, name in enumerate(names[1:], 1):
+        w, k = free.pop(rng.randrange(min(len(free), 4)))
+        outcomes[w][k] = i
+        free += [(i, k) for k in range(len(outcomes[i]))]
+
+    lines = []
+    reaching = {0: {c: (1, 4000) for c in "xmas"}}
+    for i, slots in enumerate(outcomes):
+        ranges = reaching.pop(i)
+        results = []
+        for slot in slots:
+            if slot is not None:
+                results.append(names[slot])
+            else:
+                results.append(rng.choice("AR"))
+
+        rules = []
+        for slot, result in zip(slots, results[:-1]):
+            condition, passed, ranges = rule(rng, ranges)
+            rules.append(f"{condition}:{result}")
+            if slot is not None:
+                reaching[slot] = passed
+        if slots[-1] is not None:
+            reaching[slots[-1]] = ranges
+        lines.append(f"{names[i]}{{{','.join(rules)},{results[-1]}}}")
+    rng.shuffle(lines)
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(PARTS)
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
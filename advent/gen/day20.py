@@ -0,0 +1,52 @@
+import random
+
+from advent.gen.utils import unique_names
+
+# day20.second_parsed looks for these 4 conjunctions, feeding &cl -> rx
+INVERTERS = ["js", "qs", "dt", "ts"]
+
+
+def counter(
+    rng: random.Random, bits: int, names: list[str], inverter: str
+) -> list[str]:
+    """A chain of flip-flops counting button presses, and a hub resetting it at N.
+
+    The flip-flops are the bits of the counter, lowest first. The hub listens to the
+    bits set in N: when they are all on it sends a low pulse to the bits not set in N
+    and to the first one, which brings the counter back to 0, and to the inverter.
+    """
+    period = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+    *flip_flops, hub = names
+
+    lines = []
+    for i, name in enumerate(flip_flops):
+        dests = flip_flops[i + 1 : i + 2]
+        if period >> i & 1:
+            dests.append(hub)
+        lines.append(f"%{name} -> {', '.join(dests)}")
+
+    resets = [f for i, f in enumerate(flip_flops) if i == 0 or not period >> i & 1]
+    lines.append(f"&{hub} -> {', '.join(resets + [inverter])}")
+    lines.append(f"&{inverter} -> cl")
+    return lines
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """4 counters of `size` bits, part 2 is the product of their periods.
+
+    Their periods are odd and at least 2^(size - 1), so part 2 presses the button
+    up to 2^size times per counter.
+    """
+    assert size >= 2
+    rng = random.Random(seed)
+    names = unique_names(rng, 4 * (size + 1), 2, exclude=INVERTERS + ["cl", "rx"])
+
+    lines = []
+    starts = []
+    for i, inverter in enumerate(INVERTERS):
+        chain = names[i * (size + 1) : (i + 1) * (size + 1)]
+        starts.append(chain[0])
+        lines += counter(rng, size, chain, inverter)
+    lines += [f"broadcaster -> {', '.join(starts)}", "&cl -> rx"]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
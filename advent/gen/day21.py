@@ -0,0 +1,49 @@
+import random
+from collections import deque
+
+from advent.gen.utils import grid_to_string
+
+ROCKS = 0.12
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size`x`size` garden with S in the middle, `size` is made odd if needed.
+
+    Like the real input, the middle row and column, the edges and the diamond halfway
+    to them are free of rocks, and every plot can be reached from S. day21.second only
+    handles a 131x131 garden, the size of the real one.
+    """
+    rng = random.Random(seed)
+    side = size | 1
+    middle = side // 2
+
+    def clear(r: int, c: int) -> bool:
+        return (
+            middle in (r, c)
+            or r in (0, side - 1)
+            or c in (0, side - 1)
+            or abs(r - middle) + abs(c - middle) == middle
+        )
+
+    grid = [
+        ["." if clear(r, c) or rng.random() >= ROCKS else "#" for c in range(side)]
+        for r in range(side)
+    ]
+
+    # Fill the plots S can't get to
+    seen = {(middle, middle)}
+    queue = deque(seen)
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in [(r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)]:
+            if 0 <= nr < side and 0 <= nc < side and grid[nr][nc] == ".":
+                if (nr, nc) not in seen:
+                    seen.add((nr, nc))
+                    queue.append((nr, nc))
+    for r in range(side):
+        for c in range(side):
+            if grid[r][c] == "." and (r, c) not in seen:
+                grid[r][c] = "#"
+
+    grid[middle][middle] = "S"
+    return grid_to_string(grid)
@@ -0,0 +1,30 @@
+import random
+import string
+from typing import Iterable
+
+
+def grid_to_string(rows: Iterable[Iterable[str]]) -> str:
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def unique_names(
+    rng: random.Random,
+    count: int,
+    length: int = 2,
+    alphabet: str = string.ascii_lowercase,
+    exclude: Iterable[str] = (),
+) -> list[str]:
+    """`count` distinct random names, longer than `length` if there aren't enough."""
+    excluded = set(exclude)
+    while len(alphabet) ** length < count + len(excluded):
+        length += 1
+
+    names: set[str] = set()
+    while len(names) < count:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in excluded:
+            names.add(name)
+    # Sets aren't ordered, sort before shuffling to stay deterministic
+    result = sorted(names)
+    rng.shuffle(result)
+    return result
@@ -0,0 +1,63 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# import time: self [us] | cumulative | imported package
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    # 0 for the modules imported directly, +1 for every level of nesting
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parse the stderr of `python -X importtime`."""
+    times = []
+    for line in output.splitlines():
+        m = LINE_RE.match(line)
+        if m is None:
+            continue
+        s_self, s_cumulative, indent, module = m.groups()
+        times.append(
+            ImportTime(module, int(s_self), int(s_cumulative), (len(indent) - 1) // 2)
+        )
+    return times
+
+
+def measure_imports(modules: list[str]) -> list[ImportTime]:
+    """Import the modules in a fresh interpreter, in order, and time every import."""
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def format_import_times(times: list[ImportTime], top: int = 15) -> str:
+    lines = [f"{'self':>9} {'cumulative':>11}  module"]
+
+    def fmt(t: ImportTime) -> str:
+        return (
+            f"{t.self_us / 1000:>7.1f}ms {t.cumulative_us / 1000:>9.1f}ms  {t.module}"
+        )
+
+    lines.append("advent modules:")
+    advent = [t for t in times if t.module.split(".")[0] == "advent"]
+    lines += [fmt(t) for t in sorted(advent, key=lambda t: -t.cumulative_us)]
+
+    lines.append(f"Top {top} other imports by self time:")
+    others = [t for t in times if t not in advent]
+    lines += [fmt(t) for t in sorted(others, key=lambda t: -t.self_us)[:top]]
+
+    total = sum(t.self_us for t in times)
+    lines.append(f"Total: {total / 1000:.1f}ms for {len(times)} modules")
+    return "\n".join(lines)
@@ -1,5 +1,21 @@
-import itertools as it
-from typing import Callable, Generic, Iterator, List, Literal, Optional, Tuple, TypeVar
+import mmap as mmap_module
+import os
+import struct
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from advent.utils import tadd
 
@@ -77,16 +93,196 @@ def is_clockwise(vertices: list[Coord]) -> bool:
     return det < 0
 
 
+# Neighbor flat indexes of every cell, by flat index
+Adjacency = tuple[tuple[int, ...], ...]
+
+
+# A few shapes are enough, advent scale goes through a lot of them
+@lru_cache(maxsize=8)
+def adjacency(
+    width: int, height: int, include_diagonals: bool = False, pad: int = 0
+) -> Adjacency:
+    """Computed once per grid shape, same order as Matrix.neighbor_coords. With padding,
+    the sentinel cells have no neighbors and are nobody's neighbor."""
+    deltas = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if include_diagonals:
+        deltas += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+    stride = width + 2 * pad
+    return tuple(
+        (
+            tuple(
+                (row + dr) * stride + col + dc
+                for dr, dc in deltas
+                if pad <= row + dr < height + pad and pad <= col + dc < width + pad
+            )
+            if pad <= row < height + pad and pad <= col < width + pad
+            else ()
+        )
+        for row in range(height + 2 * pad)
+        for col in range(stride)
+    )
+
+
+@dataclass
+class Components:
+    """Connected regions of a Matrix, see Matrix.label_components."""
+
+    # Component of every cell by flat index (Matrix.idx), -1 outside of any component
+    labels: List[int]
+    # Number of cells of each component
+    sizes: List[int]
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def cells(self, label: int) -> Iterator[int]:
+        """Flat indexes of the cells of the component."""
+        return (i for i, v in enumerate(self.labels) if v == label)
+
+
+class ByteChars:
+    """One character cells over a bytes-like buffer (bytearray, memoryview of an mmap),
+    reads like a list of 1-char str. Slices are lists."""
+
+    __slots__ = ("buffer",)
+
+    def __init__(self, buffer: Any):
+        self.buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return list(bytes(self.buffer[i]).decode("latin-1"))
+        return chr(self.buffer[i])
+
+    def __setitem__(self, i: Union[int, slice], value: Any) -> None:
+        if isinstance(i, slice):
+            self.buffer[i] = "".join(value).encode("latin-1")
+        else:
+            self.buffer[i] = ord(value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(bytes(self.buffer).decode("latin-1"))
+
+
+# Cells kept in a buffer instead of a list, Matrix doesn't copy them
+BUFFER_TYPES = (ByteChars, memoryview, array)
+
+# How Matrix.from_string keeps the cells:
+#  - list: a list of 1-char str, or of whatever fn returns
+#  - bytes: 1-char str cells, stored one byte each in a bytearray (ByteChars)
+#  - digits: int cells 0-9, stored one byte each in an array("b")
+CellStorage = Literal["list", "bytes", "digits"]
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def pad_cells(cells: Any, width: int, height: int, pad: int, fill: Any) -> Any:
+    """Rows of cells with pad cells all around, fill is a single cell of the same type
+    as cells ([value] for a list, a 1-byte bytearray for bytes)."""
+    stride = width + 2 * pad
+    padded = fill * (stride * pad)
+    for row in range(height):
+        padded += fill * pad
+        padded += cells[row * width : (row + 1) * width]
+        padded += fill * pad
+    padded += fill * (stride * pad)
+    return padded
+
+
+def read_cells(data: Any, cells: slice) -> list:
+    """data[cells] as a list, whatever the storage."""
+    values = data[cells]
+    return values if isinstance(values, list) else values.tolist()
+
+
+def write_cells(data: Any, cells: slice, values: list) -> None:
+    """data[cells] = values, converted for the compact storages."""
+    if isinstance(data, array):
+        data[cells] = array(data.typecode, values)
+    elif isinstance(data, memoryview):
+        # Int cells of a loaded matrix, the array has the same format
+        data[cells] = array(data.format, values)
+    else:
+        data[cells] = values
+
+
+# Matrix.save format: magic, width, height, pad, cell type then the cells row by row,
+# padding included. "c" is one latin-1 byte per str cell, otherwise an array typecode
+# for int cells in native byte order. 24 bytes, the cells stay 8 bytes aligned.
+MAGIC = b"AOCM"
+HEADER = struct.Struct("<4sIIIc7x")
+INT_TYPECODES = "bhiq"
+
+
+def encode_cells(data: Any) -> tuple[str, bytes]:
+    """Cell type and raw bytes of the cells, str cells must be 1 character."""
+    if isinstance(data, ByteChars):
+        return "c", bytes(data.buffer)
+    if isinstance(data, memoryview):
+        return data.format, data.tobytes()
+    if isinstance(data, array):
+        return data.typecode, data.tobytes()
+
+    if all(isinstance(v, str) and len(v) == 1 for v in data):
+        return "c", "".join(data).encode("latin-1")
+    if not all(isinstance(v, int) for v in data):
+        raise ValueError("Only 1-character str or int cells can be saved")
+
+    low, high = min(data, default=0), max(data, default=0)
+    for typecode in INT_TYPECODES:
+        bits = 8 * array(typecode).itemsize - 1
+        if -(1 << bits) <= low and high < 1 << bits:
+            return typecode, array(typecode, data).tobytes()
+    raise ValueError(f"Cells don't fit in 64 bits: {low}..{high}")
+
+
 class Matrix(Generic[T]):
+    """A grid of width x height cells, stored row by row.
+
+    With pad=k, data also holds k rows and columns of sentinel cells all around the
+    grid: loops on flat indexes can stop on the sentinel value instead of checking the
+    bounds. Coords, width and height don't include the padding, a padded Matrix reads
+    the same as the original one.
+
+    Cells are a list by default, see CellStorage for the compact ones.
+    """
+
+    __slots__ = ("data", "width", "height", "pad", "stride", "offset")
+
     data: List[T]
     width: int
     height: int
-
-    def __init__(self, data: List[T], width: int, height: int):
-        self.data = list(data)
-        assert len(self.data) == width * height
+    pad: int
+    # Length of a row in data, width + 2 * pad
+    stride: int
+    # Flat index of (0, 0)
+    offset: int
+
+    def __init__(self, data: List[T], width: int, height: int, pad: int = 0):
+        self.data = data if isinstance(data, BUFFER_TYPES) else list(data)
         self.width = width
         self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+        self.offset = pad * self.stride + pad
+        assert len(self.data) == self.stride * (height + 2 * pad)
+
+    def copy(self) -> "Matrix[T]":
+        # Compact cells stay compact, the copy of a loaded matrix is in memory
+        data: Any = self.data
+        if isinstance(data, array):
+            data = data[:]
+        elif isinstance(data, ByteChars):
+            data = ByteChars(bytearray(data.buffer))
+        elif isinstance(data, memoryview):
+            data = array(data.format, data.tobytes())
+        if self.pad:
+            return type(self)(data, self.width, self.height, pad=self.pad)
+        return type(self)(data, self.width, self.height)
 
     def is_valid_coord(self, coord: Coord):
         return 0 <= coord[0] < self.height and 0 <= coord[1] < self.width
@@ -95,7 +291,7 @@ class Matrix(Generic[T]):
         row, col = coord
         if not self.is_valid_coord(coord):
             raise IndexError(f"Coord out of range {coord}")
-        return row * self.width + col
+        return row * self.stride + col + self.offset
 
     def __getitem__(self, coord: Coord) -> T:
         return self.data[self.__get_index(coord)]
@@ -103,15 +299,231 @@ class Matrix(Generic[T]):
     def __setitem__(self, coord: Coord, value: T) -> None:
         self.data[self.__get_index(coord)] = value
 
+    # Flat indexes, for the hot loops: plain ints, no tuples and no bounds checks.
+    # i = row * width + col without padding, use at(i) instead of self[coord] and
+    # nb4_idx(i) instead of nbc4(coord).
+
+    def idx(self, row: int, col: int) -> int:
+        return row * self.stride + col + self.offset
+
+    def coord(self, i: int) -> Coord:
+        row, col = divmod(i, self.stride)
+        return row - self.pad, col - self.pad
+
+    def at(self, i: int) -> T:
+        return self.data[i]
+
+    def delta_idx(self, d_row: int, d_col: int) -> int:
+        """What to add to a flat index to move by (d_row, d_col)."""
+        return d_row * self.stride + d_col
+
+    def nb4_idx(self, i: int) -> tuple[int, ...]:
+        return adjacency(self.width, self.height, False, self.pad)[i]
+
+    def nb8_idx(self, i: int) -> tuple[int, ...]:
+        return adjacency(self.width, self.height, True, self.pad)[i]
+
+    # Regions, cells are connected to their 4 neighbors when passable(value) is true.
+    # Both work on runs of passable cells within a row rather than cell by cell.
+
+    def passable_runs(self, row: int, passable: Callable[[T], bool]) -> List[Coord]:
+        """[start, end) columns of the runs of passable cells in the row."""
+        runs = []
+        start = None
+        for col, v in enumerate(self.get_row(row)):
+            if passable(v):
+                if start is None:
+                    start = col
+            elif start is not None:
+                runs.append((start, col))
+                start = None
+        if start is not None:
+            runs.append((start, self.width))
+        return runs
+
+    def flood_fill(self, start: Coord, passable: Callable[[T], bool]) -> Components:
+        """The region of start as component 0, no component if start isn't passable."""
+        labels = [-1] * len(self.data)
+        if not passable(self[start]):
+            return Components(labels, [])
+
+        data, width, size = self.data, self.width, 0
+        seeds = [start]
+        while seeds:
+            row, col = seeds.pop()
+            row_start = self.idx(row, 0)
+            if labels[row_start + col] == 0:
+                continue
+            # Widen the seed to its whole span, [left, right)
+            left = right = col
+            while left > 0 and passable(data[row_start + left - 1]):
+                left -= 1
+            while right < width and passable(data[row_start + right]):
+                right += 1
+            labels[row_start + left : row_start + right] = [0] * (right - left)
+            size += right - left
+
+            # One seed per run of unfilled passable cells above and below the span
+            for next_row in (row - 1, row + 1):
+                if not 0 <= next_row < self.height:
+                    continue
+                next_start = self.idx(next_row, 0)
+                in_run = False
+                for c in range(left, right):
+                    i = next_start + c
+                    fillable = labels[i] != 0 and passable(data[i])
+                    if fillable and not in_run:
+                        seeds.append((next_row, c))
+                    in_run = fillable
+
+        return Components(labels, [size])
+
+    def label_components(self, passable: Callable[[T], bool]) -> Components:
+        """Every region, labeled 0, 1... in the order of their first cell. Runs that
+        overlap the runs of the row above are merged with a union-find."""
+        parent: List[int] = []
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        # (row, start, end, provisional label) of every run
+        runs: List[tuple[int, int, int, int]] = []
+        above: List[tuple[int, int, int, int]] = []
+        for row in range(self.height):
+            current = []
+            j = 0
+            for start, end in self.passable_runs(row, passable):
+                label = len(parent)
+                parent.append(label)
+                # Both lists are sorted, the runs above that end before start are done
+                while j < len(above) and above[j][2] <= start:
+                    j += 1
+                k = j
+                while k < len(above) and above[k][1] < end:
+                    root, other = find(label), find(above[k][3])
+                    parent[max(root, other)] = min(root, other)
+                    k += 1
+                current.append((row, start, end, label))
+            runs += current
+            above = current
+
+        labels = [-1] * len(self.data)
+        sizes: List[int] = []
+        final: dict[int, int] = {}
+        for row, start, end, label in runs:
+            root = find(label)
+            if root not in final:
+                final[root] = len(sizes)
+                sizes.append(0)
+            label = final[root]
+            i = self.idx(row, start)
+            labels[i : i + end - start] = [label] * (end - start)
+            sizes[label] += end - start
+
+        return Components(labels, sizes)
+
     @classmethod
     def from_string(
-        cls, data: str, fn: Optional[Callable[[str], T]] = None
+        cls,
+        data: str,
+        fn: Optional[Callable[[str], T]] = None,
+        pad: int = 0,
+        pad_value: Optional[T] = None,
+        storage: CellStorage = "list",
     ) -> "Matrix[T]":
+        """pad adds that many rows and columns of pad_value around the grid. The bytes
+        and digits storages don't take fn, they convert all the cells at once."""
         rows = data.splitlines()
         height = len(rows)
         width = len(rows[0])
-        data_as_array = [fn(v) if fn else v for v in it.chain(*rows)]
-        return cls(data_as_array, width, height)
+        if any(len(row) != width for row in rows):
+            raise ValueError("All the lines must have the same width")
+
+        if storage == "list":
+            joined = "".join(rows)
+            cells: Any = [fn(v) for v in joined] if fn else list(joined)
+            fill: Any = [pad_value]
+        else:
+            assert fn is None, f"No fn with the {storage} storage"
+            cells = bytearray("".join(rows).encode("latin-1"))
+            if storage == "digits":
+                if cells.translate(None, b"0123456789"):
+                    raise ValueError("Only digits in a digits matrix")
+                cells = cells.translate(DIGITS)
+                fill = bytearray([pad_value or 0])
+            else:
+                fill = bytearray((pad_value or " ").encode("latin-1"))
+
+        if pad:
+            cells = pad_cells(cells, width, height, pad, fill)
+        if storage == "bytes":
+            cells = ByteChars(cells)
+        elif storage == "digits":
+            cells = array("b", cells)
+        return cls(cells, width, height, pad=pad)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Header and raw cells, see HEADER. Cells must be 1-character str or ints."""
+        typecode, cells = encode_cells(self.data)
+        with open(path, "wb") as f:
+            f.write(
+                HEADER.pack(MAGIC, self.width, self.height, self.pad, typecode.encode())
+            )
+            f.write(cells)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap: bool = True) -> "Matrix[T]":
+        """A matrix written by save. With mmap the cells are read straight from the
+        mapped file, opening is instant and processes loading the same file share its
+        pages. Writes stay private to the matrix, the file doesn't change. Without mmap
+        the cells are read into a list like from_string.
+
+        The file stays mapped until close(), or the end of a with block:
+
+            with Matrix.load(path) as m:
+                ...
+        """
+        with open(path, "rb") as f:
+            if mmap:
+                buffer: Any = memoryview(
+                    mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_COPY)
+                )
+            else:
+                buffer = memoryview(f.read())
+
+        magic, width, height, pad, typecode = HEADER.unpack(buffer[: HEADER.size])
+        if magic != MAGIC:
+            raise ValueError(f"{path} isn't a saved Matrix")
+        typecode = typecode.decode()
+
+        cells = buffer[HEADER.size :]
+        if typecode == "c":
+            data: Any = ByteChars(cells)
+        else:
+            data = cells.cast(typecode)
+        if not mmap:
+            data = list(data)
+        return cls(data, width, height, pad=pad)
+
+    def close(self) -> None:
+        """Unmap the file of a matrix loaded with mmap, the cells can't be read after
+        that. Nothing to do for the other matrices."""
+        buffer = self.data.buffer if isinstance(self.data, ByteChars) else self.data
+        if not isinstance(buffer, memoryview):
+            return
+        mapped = buffer.obj
+        buffer.release()
+        if isinstance(mapped, mmap_module.mmap):
+            mapped.close()
+
+    def __enter__(self) -> "Matrix[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def all_coords(self) -> Iterator[Coord]:
         for x in range(self.height):
@@ -150,15 +562,38 @@ class Matrix(Generic[T]):
         return self.neighbor_coords(coord, include_diagonals=True)
 
     def get_row(self, row: int) -> List[T]:
-        row_start = row * self.width
-        return self.data[row_start : row_start + self.width]
+        row_start = self.idx(row, 0)
+        return read_cells(self.data, slice(row_start, row_start + self.width))
 
     def get_col(self, col: int) -> List[T]:
-        return self.data[col :: self.width]
+        start = self.idx(0, col)
+        return read_cells(
+            self.data, slice(start, start + self.height * self.stride, self.stride)
+        )
 
     def get_row_coords(self, row: int) -> List[T]:
         return []
 
+    # Views share the data of the matrix, see MatrixView
+
+    def view(self) -> "MatrixView[T]":
+        return MatrixView(self, self.offset, self.stride, 1, self.width, self.height)
+
+    def transpose(self) -> "MatrixView[T]":
+        return self.view().transpose()
+
+    def rot90(self, k: int = 1) -> "MatrixView[T]":
+        return self.view().rot90(k)
+
+    def subgrid(self, row: int, col: int, height: int, width: int) -> "MatrixView[T]":
+        return self.view().subgrid(row, col, height, width)
+
+    def row_view(self, row: int) -> "MatrixView[T]":
+        return self.view().subgrid(row, 0, 1, self.width)
+
+    def col_view(self, col: int) -> "MatrixView[T]":
+        return self.view().subgrid(0, col, self.height, 1)
+
     def items(self) -> Iterator[tuple[Coord, T]]:
         for c in self.all_coords():
             yield c, self[c]
@@ -170,3 +605,234 @@ class Matrix(Generic[T]):
                 out += str(self[row, col])
             out += "\n"
         return out[:-1]
+
+
+class MatrixView(Generic[T]):
+    """Transposed, rotated, flipped or cropped window on a Matrix, nothing is copied.
+
+    Cell (row, col) of the view is base.data[start + row * row_step + col * col_step],
+    reads and writes go to the base matrix. Whole lines are read and written with a
+    single (extended) slice:
+
+        north = reflector.transpose()   # rows of the view are the columns of the base
+        for row in range(north.height):
+            north.set_line(row, tilt(north.line(row)))
+    """
+
+    __slots__ = ("base", "start", "row_step", "col_step", "width", "height")
+
+    base: Matrix[T]
+    start: int
+    row_step: int
+    col_step: int
+    width: int
+    height: int
+
+    def __init__(
+        self,
+        base: Matrix[T],
+        start: int,
+        row_step: int,
+        col_step: int,
+        width: int,
+        height: int,
+    ):
+        self.base = base
+        self.start = start
+        self.row_step = row_step
+        self.col_step = col_step
+        self.width = width
+        self.height = height
+
+    def transpose(self) -> "MatrixView[T]":
+        return MatrixView(
+            self.base,
+            self.start,
+            self.col_step,
+            self.row_step,
+            self.height,
+            self.width,
+        )
+
+    def flip_rows(self) -> "MatrixView[T]":
+        """Upside down."""
+        return MatrixView(
+            self.base,
+            self.start + (self.height - 1) * self.row_step,
+            -self.row_step,
+            self.col_step,
+            self.width,
+            self.height,
+        )
+
+    def flip_cols(self) -> "MatrixView[T]":
+        """Mirrored left to right."""
+        return MatrixView(
+            self.base,
+            self.start + (self.width - 1) * self.col_step,
+            self.row_step,
+            -self.col_step,
+            self.width,
+            self.height,
+        )
+
+    def rot90(self, k: int = 1) -> "MatrixView[T]":
+        """Rotated clockwise k times."""
+        view = self
+        for _ in range(k % 4):
+            view = view.transpose().flip_cols()
+        return view
+
+    def subgrid(self, row: int, col: int, height: int, width: int) -> "MatrixView[T]":
+        assert 0 <= row and row + height <= self.height
+        assert 0 <= col and col + width <= self.width
+        return MatrixView(
+            self.base,
+            self.start + row * self.row_step + col * self.col_step,
+            self.row_step,
+            self.col_step,
+            width,
+            height,
+        )
+
+    def is_valid_coord(self, coord: Coord) -> bool:
+        return 0 <= coord[0] < self.height and 0 <= coord[1] < self.width
+
+    def idx(self, row: int, col: int) -> int:
+        """Flat index in base.data."""
+        return self.start + row * self.row_step + col * self.col_step
+
+    def __getitem__(self, coord: Coord) -> T:
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        return self.base.data[self.idx(*coord)]
+
+    def __setitem__(self, coord: Coord, value: T) -> None:
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        self.base.data[self.idx(*coord)] = value
+
+    def line_slice(self, row: int) -> slice:
+        """Where the row is in base.data, a plain slice when the columns are contiguous."""
+        first = self.idx(row, 0)
+        last = first + (self.width - 1) * self.col_step
+        if self.col_step == 1:
+            return slice(first, last + 1)
+        # The stop is exclusive, and -1 would mean the end of the list
+        stop = last + (1 if self.col_step > 0 else -1)
+        return slice(first, stop if stop >= 0 else None, self.col_step)
+
+    def line(self, row: int) -> List[T]:
+        return read_cells(self.base.data, self.line_slice(row))
+
+    def set_line(self, row: int, values: List[T]) -> None:
+        assert len(values) == self.width
+        write_cells(self.base.data, self.line_slice(row), values)
+
+    def lines(self) -> Iterator[List[T]]:
+        for row in range(self.height):
+            yield self.line(row)
+
+    def all_coords(self) -> Iterator[Coord]:
+        for x in range(self.height):
+            for y in range(self.width):
+                yield x, y
+
+    def items(self) -> Iterator[tuple[Coord, T]]:
+        for row in range(self.height):
+            for col, v in enumerate(self.line(row)):
+                yield (row, col), v
+
+    def to_matrix(self) -> Matrix[T]:
+        """A copy, as a regular Matrix."""
+        return Matrix(
+            [v for line in self.lines() for v in line], self.width, self.height
+        )
+
+    def __str__(self):
+        return "\n".join("".join(str(v) for v in line) for line in self.lines())
+
+
+class ChunkedGrid(Generic[T]):
+    """Unbounded grid, stored in tiles of tile_height x tile_width cells in a dict keyed by
+    the (row, col) of the tile. Negative coords are fine.
+
+    A tile is allocated on the first write to one of its cells, until then its cells
+    read as the default, or as the cells of the repeated pattern:
+
+        trench = ChunkedGrid(None)        # sparse, memory grows with the tiles written
+        garden = ChunkedGrid.repeat(m)    # m repeated forever, m.data isn't copied
+    """
+
+    tiles: dict[Coord, List[T]]
+    default: T
+    tile_height: int
+    tile_width: int
+    # Row by row cells of an unallocated tile, None to read the default
+    pattern: Optional[List[T]]
+
+    def __init__(
+        self,
+        default: T,
+        tile_height: int = 64,
+        tile_width: int = 64,
+        pattern: Optional[List[T]] = None,
+    ):
+        assert pattern is None or len(pattern) == tile_height * tile_width
+        self.tiles = {}
+        self.default = default
+        self.tile_height = tile_height
+        self.tile_width = tile_width
+        self.pattern = pattern
+
+    @classmethod
+    def repeat(cls, matrix: Matrix[T]) -> "ChunkedGrid[T]":
+        """The matrix tiled in every direction, (row, col) reads
+        matrix[row % height, col % width] until it's written."""
+        if matrix.pad:
+            pattern = [v for row in range(matrix.height) for v in matrix.get_row(row)]
+        else:
+            pattern = matrix.data
+        return cls(None, matrix.height, matrix.width, pattern)
+
+    def locate(self, coord: Coord) -> tuple[Coord, int]:
+        """Key of the tile and index of the cell in the tile."""
+        tile_row, row = divmod(coord[0], self.tile_height)
+        tile_col, col = divmod(coord[1], self.tile_width)
+        return (tile_row, tile_col), row * self.tile_width + col
+
+    def __getitem__(self, coord: Coord) -> T:
+        key, i = self.locate(coord)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            return tile[i]
+        return self.default if self.pattern is None else self.pattern[i]
+
+    def __setitem__(self, coord: Coord, value: T) -> None:
+        key, i = self.locate(coord)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if self.pattern is None:
+                tile = [self.default] * (self.tile_height * self.tile_width)
+            else:
+                tile = list(self.pattern)
+            self.tiles[key] = tile
+        tile[i] = value
+
+    def items(self) -> Iterator[tuple[Coord, T]]:
+        """The cells of the allocated tiles that aren't the default."""
+        default = self.default
+        for (tile_row, tile_col), tile in self.tiles.items():
+            row0, col0 = tile_row * self.tile_height, tile_col * self.tile_width
+            for i, v in enumerate(tile):
+                if v != default:
+                    row, col = divmod(i, self.tile_width)
+                    yield (row0 + row, col0 + col), v
+
+    def bounds(self) -> tuple[Coord, Coord]:
+        """Top left and bottom right (included) of what items() yields."""
+        coords = [c for c, _ in self.items()]
+        assert coords, "Nothing was written"
+        rows = [row for row, _ in coords]
+        cols = [col for _, col in coords]
+        return (min(rows), min(cols)), (max(rows), max(cols))
@@ -0,0 +1,133 @@
+import multiprocessing
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from advent.runner import Part, load_day, parse, quiet, solve
+
+# How often the peak watcher looks at the traced memory, in seconds
+POLL_INTERVAL = 0.02
+
+# (file:line, size in bytes, number of blocks)
+AllocationSite = tuple[str, int, int]
+
+
+@dataclass
+class MemoryReport:
+    day: int
+    part: Part
+    answer: Any
+    # Peak of the memory allocated by Python while running the part, parsing excluded
+    peak_traced: int
+    # Max resident set size of the whole process, None where the OS doesn't tell
+    max_rss: Optional[int]
+    top: list[AllocationSite] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        d = asdict(self)
+        if not isinstance(self.answer, (int, float)):
+            d["answer"] = str(self.answer)
+        return d
+
+
+def format_bytes(n: Optional[float]) -> str:
+    if n is None:
+        return "n/a"
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(n) < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}GiB"
+
+
+def max_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes on Linux
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class PeakSnapshots:
+    """Take a tracemalloc snapshot every time traced memory reaches a new high.
+
+    tracemalloc only remembers the peak size, not what was allocated at that point, and
+    a snapshot taken once the part returned only shows what survived it.
+    """
+
+    def __init__(self):
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+
+    def watch(self) -> None:
+        while not self.done.wait(POLL_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * 1.1:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def __enter__(self) -> "PeakSnapshots":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.done.set()
+        self.thread.join()
+
+    def top(self, limit: int) -> list[AllocationSite]:
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, threading.__file__),
+            ]
+        )
+        return [
+            (str(stat.traceback[0]), stat.size, stat.count)
+            for stat in snapshot.statistics("lineno")[:limit]
+        ]
+
+
+def measure_in_process(day_num: int, part: Part, text: str, top: int) -> MemoryReport:
+    day_module = load_day(day_num)
+    parsed = parse(day_module, text)
+
+    with quiet():
+        tracemalloc.start()
+        try:
+            with PeakSnapshots() as peaks:
+                answer = solve(day_module, part, parsed)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return MemoryReport(day_num, part, answer, peak, max_rss(), peaks.top(top))
+
+
+def measure_part(day_num: int, part: Part, text: str, top: int = 10) -> MemoryReport:
+    """Measure a part in a fresh process, so its max RSS isn't polluted by anything else."""
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(measure_in_process, day_num, part, text, top).result()
+
+
+def format_report(report: MemoryReport) -> str:
+    lines = [
+        f"{report.part.capitalize()}: {report.answer} "
+        f"(peak traced {format_bytes(report.peak_traced)}, "
+        f"max RSS {format_bytes(report.max_rss)})"
+    ]
+    for location, size, count in report.top:
+        lines.append(f"  {format_bytes(size):>10} {count:>8} blocks  {location}")
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""
+Counters of the work done by the solutions, off unless collecting (advent DAY --stats,
+advent bench).
+
+While off every call returns right away, still, in hot loops count in a local variable
+and record it once the loop is done:
+
+    metrics.incr("day17.queue_pushes", pushes)
+    metrics.gauge("day12.solve_rec.cache_size", info.currsize)
+    metrics.observe("day21.frontier", len(frontier))
+"""
+
+import statistics
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+enabled = False
+
+counters: dict[str, int] = {}
+# Last value wins
+gauges: dict[str, float] = {}
+# Every value observed, summarized when read
+histograms: dict[str, list[float]] = {}
+
+
+def incr(name: str, n: int = 1) -> None:
+    if not enabled:
+        return
+    counters[name] = counters.get(name, 0) + n
+
+
+def gauge(name: str, value: float) -> None:
+    if not enabled:
+        return
+    gauges[name] = value
+
+
+def observe(name: str, value: float) -> None:
+    if not enabled:
+        return
+    histograms.setdefault(name, []).append(value)
+
+
+def reset() -> None:
+    counters.clear()
+    gauges.clear()
+    histograms.clear()
+
+
+def summarize_histogram(values: list[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "min": min(values),
+        "max": max(values),
+        "mean": statistics.fmean(values),
+        "total": sum(values),
+    }
+
+
+def snapshot() -> dict[str, Any]:
+    """What was recorded so far, as plain JSON-able values."""
+    return {
+        "counters": dict(counters),
+        "gauges": dict(gauges),
+        "histograms": {k: summarize_histogram(v) for k, v in histograms.items()},
+    }
+
+
+@contextmanager
+def collecting() -> Iterator[dict[str, Any]]:
+    """Record from a clean slate, the dict yielded is filled with the snapshot on exit."""
+    global enabled
+    reset()
+    enabled = True
+    result: dict[str, Any] = {}
+    try:
+        yield result
+    finally:
+        enabled = False
+        result.update(snapshot())
+        reset()
+
+
+def format_metrics(snap: dict[str, Any]) -> str:
+    lines = []
+    for name, value in sorted({**snap["counters"], **snap["gauges"]}.items()):
+        lines.append(f"  {name:<32} {value:>14,}")
+    for name, h in sorted(snap["histograms"].items()):
+        lines.append(
+            f"  {name:<32} n={h['count']:,} min={h['min']:,} "
+            f"mean={h['mean']:,.1f} max={h['max']:,} total={h['total']:,}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,173 @@
+"""
+Matrix backed by a 2D numpy array, for the days that scan whole grids.
+
+numpy is optional (pip install advent[numpy]), only import this module when it's there.
+It has the same coordinate API as Matrix, plus the array operations:
+
+    grid = NumpyMatrix.from_string(text)
+    rocks = grid == "#"                     # bool array
+    empty_rows = ~rocks.any(axis=1)
+    coords = grid.argwhere(rocks)           # [(row, col), ...]
+    below = grid.shift(1, 0, fill=".")      # below[r, c] == grid[r + 1, c]
+"""
+
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from advent.matrix import Coord
+
+
+class NumpyMatrix:
+    """Characters are stored as "<U1", digits (fn=int) as int64."""
+
+    array: np.ndarray
+
+    def __init__(self, array: np.ndarray):
+        assert array.ndim == 2
+        self.array = array
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    @property
+    def data(self) -> List[Any]:
+        """Flat list like Matrix.data, it's a copy."""
+        return self.array.ravel().tolist()
+
+    @classmethod
+    def from_string(
+        cls, data: str, fn: Optional[Callable[[str], Any]] = None
+    ) -> "NumpyMatrix":
+        """All the lines must have the same width. fn=int is vectorized, any other fn is
+        called once per cell."""
+        data = data.replace("\r\n", "\n")
+        if not data.endswith("\n"):
+            data += "\n"
+        # One code point per character, so the buffer indexes are the string ones
+        raw = np.frombuffer(data.encode("utf-32-le"), dtype="<u4")
+        width = data.index("\n")
+        # Every line must end exactly where the first one does
+        if len(raw) % (width + 1) != 0 or (raw[width :: width + 1] != 10).any():
+            raise ValueError("All the lines must have the same width")
+        lines = raw.reshape(-1, width + 1)
+        # Drop the newlines column
+        cells = lines[:, :width]
+
+        if fn is int:
+            return cls(cells.astype(np.int64) - ord("0"))
+        chars = cells.copy().view("<U1")
+        if fn is None:
+            return cls(chars)
+        return cls(np.vectorize(fn)(chars))
+
+    @classmethod
+    def from_matrix(cls, matrix) -> "NumpyMatrix":
+        return cls(np.array(matrix.data).reshape(matrix.height, matrix.width))
+
+    def copy(self) -> "NumpyMatrix":
+        return type(self)(self.array.copy())
+
+    def is_valid_coord(self, coord: Coord) -> bool:
+        return 0 <= coord[0] < self.height and 0 <= coord[1] < self.width
+
+    def __getitem__(self, coord: Coord) -> Any:
+        # numpy would wrap negative indexes around
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        return self.array[coord].item()
+
+    def __setitem__(self, coord: Coord, value: Any) -> None:
+        if not self.is_valid_coord(coord):
+            raise IndexError(f"Coord out of range {coord}")
+        self.array[coord] = value
+
+    def __eq__(self, value: Any) -> np.ndarray:  # type: ignore[override]
+        """Mask of the cells equal to value."""
+        return self.array == value
+
+    def __ne__(self, value: Any) -> np.ndarray:  # type: ignore[override]
+        return self.array != value
+
+    # Masks aren't hashable either
+    __hash__ = None  # type: ignore[assignment]
+
+    def argwhere(self, mask: Union[np.ndarray, Any]) -> List[Coord]:
+        """Coords where the mask is True, mask can also be a value to look for."""
+        if not isinstance(mask, np.ndarray):
+            mask = self.array == mask
+        return [(int(r), int(c)) for r, c in np.argwhere(mask)]
+
+    def shift(self, d_row: int, d_col: int, fill: Any) -> np.ndarray:
+        """Array of the neighbors in the (d_row, d_col) direction: out[r, c] is the
+        cell at (r + d_row, c + d_col), fill when that's out of the grid."""
+        out = np.full_like(self.array, fill)
+        h, w = self.height, self.width
+        src_rows = slice(max(d_row, 0), h + min(d_row, 0))
+        src_cols = slice(max(d_col, 0), w + min(d_col, 0))
+        dst_rows = slice(max(-d_row, 0), h + min(-d_row, 0))
+        dst_cols = slice(max(-d_col, 0), w + min(-d_col, 0))
+        out[dst_rows, dst_cols] = self.array[src_rows, src_cols]
+        return out
+
+    def count_neighbors(
+        self, mask: np.ndarray, include_diagonals: bool = False
+    ) -> np.ndarray:
+        """For every cell, how many of its neighbors are True in the mask."""
+        deltas = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if include_diagonals:
+            deltas += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        counts = np.zeros(mask.shape, dtype=np.int64)
+        as_grid = type(self)(mask)
+        for d_row, d_col in deltas:
+            counts += as_grid.shift(d_row, d_col, False)
+        return counts
+
+    def all_coords(self) -> Iterator[Coord]:
+        for x in range(self.height):
+            for y in range(self.width):
+                yield x, y
+
+    def neighbor_coords(
+        self, coord: Coord, include_diagonals: bool = False
+    ) -> List[Coord]:
+        row, col = coord
+        coords = [(row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)]
+        if include_diagonals:
+            coords += [
+                (row - 1, col - 1),
+                (row - 1, col + 1),
+                (row + 1, col - 1),
+                (row + 1, col + 1),
+            ]
+        return [c for c in coords if self.is_valid_coord(c)]
+
+    def neighbors(self, coord: Coord, include_diagonals: bool = False) -> List[Any]:
+        return [self[c] for c in self.neighbor_coords(coord, include_diagonals)]
+
+    def nbc4(self, coord: Coord) -> List[Coord]:
+        return self.neighbor_coords(coord)
+
+    def nb8(self, coord: Coord) -> List[Any]:
+        return self.neighbors(coord, include_diagonals=True)
+
+    def nbc8(self, coord: Coord) -> List[Coord]:
+        return self.neighbor_coords(coord, include_diagonals=True)
+
+    def get_row(self, row: int) -> List[Any]:
+        return self.array[row].tolist()
+
+    def get_col(self, col: int) -> List[Any]:
+        return self.array[:, col].tolist()
+
+    def items(self) -> Iterator[tuple[Coord, Any]]:
+        for c, v in zip(self.all_coords(), self.array.ravel().tolist()):
+            yield c, v
+
+    def __str__(self):
+        return "\n".join("".join(str(v) for v in row) for row in self.array.tolist())
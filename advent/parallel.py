@@ -0,0 +1,129 @@
+import json
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator, Optional
+
+from advent.runner import (
+    PARTS,
+    STATE_DIR,
+    Part,
+    available_days,
+    load_day,
+    quiet,
+    run_part,
+)
+from advent.utils import get_input_filename_for_day
+
+HISTORY_FILE = STATE_DIR / "timings.json"
+
+Task = tuple[int, Part]
+
+
+@dataclass
+class TaskResult:
+    day: int
+    part: Part
+    answer: Any
+    elapsed: float
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        d = asdict(self)
+        # Keep the JSON valid for answers that aren't plain numbers
+        if not isinstance(self.answer, (int, float, type(None))):
+            d["answer"] = str(self.answer)
+        return d
+
+
+def read_input(day_num: int) -> str:
+    with open(get_input_filename_for_day(day_num)) as reader:
+        return reader.read()
+
+
+def solve_task(day_num: int, part: Part) -> TaskResult:
+    """Worker entry point, runs in the pool process."""
+    return solve_text(day_num, part, read_input(day_num))
+
+
+def solve_text(day_num: int, part: Part, text: str) -> TaskResult:
+    day_module = load_day(day_num)
+    start_t = time.perf_counter()
+    try:
+        with quiet():
+            answer = run_part(day_module, part, text)
+    except Exception as e:
+        return TaskResult(day_num, part, None, time.perf_counter() - start_t, repr(e))
+    return TaskResult(day_num, part, answer, time.perf_counter() - start_t)
+
+
+def history_key(task: Task) -> str:
+    day_num, part = task
+    return f"day{day_num:02}.{part}"
+
+
+def load_history() -> dict[str, float]:
+    if not HISTORY_FILE.is_file():
+        return {}
+    return json.loads(HISTORY_FILE.read_text())
+
+
+def save_history(results: list[TaskResult]) -> None:
+    history = load_history()
+    for r in results:
+        if r.error is None:
+            history[history_key((r.day, r.part))] = r.elapsed
+    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    HISTORY_FILE.write_text(json.dumps(history, indent=2, sort_keys=True))
+
+
+def schedule(tasks: list[Task], history: dict[str, float]) -> list[Task]:
+    """Longest first, tasks we have never timed are assumed to be slow."""
+    return sorted(tasks, key=lambda t: -history.get(history_key(t), float("inf")))
+
+
+def supervised_task(
+    day_num: int, part: Part, timeout: Optional[float], max_mem: Optional[int]
+) -> TaskResult:
+    """Worker entry point with limits, runs in a thread waiting on its own process."""
+    from advent.supervisor import run_supervised
+
+    return run_supervised(day_num, part, read_input(day_num), timeout, max_mem)
+
+
+def run_all(
+    jobs: Optional[int] = None,
+    days: Optional[list[int]] = None,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> Iterator[TaskResult]:
+    """Run every part of every day on a process pool.
+
+    Results are yielded in day order, as soon as they (and the ones before them) are done.
+    With a timeout or a memory limit every part gets its own supervised process, a part
+    going over them is stopped and the others keep going.
+    """
+    days = days if days is not None else available_days()
+    tasks = [(d, p) for d in days for p in PARTS]
+
+    pool: Executor
+    if timeout is None and max_mem is None:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        fn, args = solve_task, ()
+    else:
+        pool = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        fn, args = supervised_task, (timeout, max_mem)
+
+    results: list[TaskResult] = []
+    with pool:
+        futures: dict[Task, Future[TaskResult]] = {
+            task: pool.submit(fn, *task, *args)
+            for task in schedule(tasks, load_history())
+        }
+        for task in tasks:
+            result = futures[task].result()
+            results.append(result)
+            yield result
+
+    save_history(results)
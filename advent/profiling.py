@@ -0,0 +1,99 @@
+import cProfile
+import io
+import os
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from advent.runner import STATE_DIR, Part, solve
+
+PROFILE_DIR = STATE_DIR / "profiles"
+
+# pstats function key: filename, line number, function name
+Func = tuple[str, int, str]
+
+# Don't follow call paths deeper than this or that account for less than a microsecond
+MAX_DEPTH = 128
+MIN_WEIGHT = 1e-6
+
+
+def profile_part(
+    day_module: ModuleType, part: Part, parsed: Any
+) -> tuple[Any, pstats.Stats]:
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(solve, day_module, part, parsed)
+    return answer, pstats.Stats(profiler)
+
+
+def report(stats: pstats.Stats, top: int = 15) -> str:
+    """Top functions by cumulative time, then by self time."""
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats("cumulative").print_stats(top)
+    stats.sort_stats("tottime").print_stats(top)
+    return out.getvalue()
+
+
+def func_label(func: Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        # Builtins, name is something like <built-in method builtins.len>
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    # ; separates frames in the collapsed format
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> list[str]:
+    """Approximate collapsed stacks ("a;b;c <microseconds>") from the cProfile call graph.
+
+    cProfile only records caller -> callee edges, so a function's time is split between its
+    call paths in proportion to the time spent through each edge.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+
+    children: dict[Func, list[tuple[Func, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            children[caller].append((func, edge_ct))
+
+    totals: dict[str, float] = defaultdict(float)
+
+    def walk(func: Func, stack: list[Func], weight: float) -> None:
+        _, _, tt, ct, _ = raw[func]
+        share = weight / ct if ct else 0.0
+        stack = stack + [func]
+        totals[";".join(func_label(f) for f in stack)] += tt * share
+
+        if len(stack) >= MAX_DEPTH:
+            return
+        for child, edge_ct in children[func]:
+            if child in stack or edge_ct * share < MIN_WEIGHT:
+                continue
+            walk(child, stack, edge_ct * share)
+
+    for func, (_, _, _, ct, callers) in raw.items():
+        if not callers:
+            walk(func, [], ct)
+
+    return [
+        f"{stack} {round(t * 1e6)}"
+        for stack, t in sorted(totals.items())
+        if round(t * 1e6) > 0
+    ]
+
+
+def write_profile(stats: pstats.Stats, directory: Path, name: str) -> list[Path]:
+    """Write the raw .prof (for snakeviz, pstats...) and the collapsed stacks (for flamegraph.pl, speedscope...)."""
+    directory.mkdir(parents=True, exist_ok=True)
+
+    prof_path = directory / f"{name}.prof"
+    stats.dump_stats(prof_path)
+
+    collapsed_path = directory / f"{name}.collapsed.txt"
+    collapsed_path.write_text("\n".join(collapsed_stacks(stats)) + "\n")
+
+    return [prof_path, collapsed_path]
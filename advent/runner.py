@@ -0,0 +1,68 @@
+import contextlib
+import importlib
+import io
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator, Literal
+
+Part = Literal["first", "second"]
+PARTS: tuple[Part, ...] = ("first", "second")
+
+DAYS_DIR = Path(Path(__file__).parent.absolute(), "days")
+
+# Timings, caches and other files the CLI keeps between runs
+STATE_DIR = Path(Path(__file__).parent.parent.absolute(), ".advent")
+
+# Package to load the days from instead of advent.days, the tests use stub days. It's
+# an environment variable so that the processes of the supervisor and the server see it.
+DAYS_PACKAGE_ENV = "ADVENT_DAYS_PACKAGE"
+
+
+def days_package() -> str:
+    return os.environ.get(DAYS_PACKAGE_ENV, "advent.days")
+
+
+def available_days() -> list[int]:
+    """Day numbers that have a module in advent/days/."""
+    days_dir = DAYS_DIR
+    if days_package() != "advent.days":
+        days_dir = Path(importlib.import_module(days_package()).__path__[0])
+    return sorted(int(p.stem[3:]) for p in days_dir.glob("day[0-9][0-9].py"))
+
+
+def load_day(day_num: int) -> ModuleType:
+    return importlib.import_module(f"{days_package()}.day{day_num:02}")
+
+
+def input_hash(text: str) -> str:
+    # hashlib loads OpenSSL, only pay for it when hashing
+    import hashlib
+
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def parse(day_module: ModuleType, text: str) -> Any:
+    """Parse the input once for both parts, days without a parse() hook get the raw text."""
+    if hasattr(day_module, "parse"):
+        return day_module.parse(text)
+    return text
+
+
+def solve(day_module: ModuleType, part: Part, parsed: Any) -> Any:
+    """Run a part on the output of parse(), the parsed object must not be mutated."""
+    if hasattr(day_module, "parse"):
+        return getattr(day_module, f"{part}_parsed")(parsed)
+    return getattr(day_module, part)(io.StringIO(parsed))
+
+
+def run_part(day_module: ModuleType, part: Part, text: str) -> Any:
+    """Run first() or second() of a day module on the given input text."""
+    return solve(day_module, part, parse(day_module, text))
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Silence whatever the day modules print, so it doesn't end up in timings or reports."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
@@ -0,0 +1,147 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from advent.gen import generate, load_generator
+from advent.memory import format_bytes, measure_part
+from advent.runner import Part, load_day, quiet, run_part
+
+# First size to try, what it means depends on the generator (lines, grid side...)
+START_SIZES = {
+    3: 32,
+    5: 8,
+    6: 1,
+    8: 8,
+    10: 16,
+    11: 64,
+    12: 8,
+    13: 32,
+    14: 16,
+    16: 16,
+    17: 16,
+    18: 16,
+    19: 64,
+    20: 4,
+    21: 16,
+}
+DEFAULT_START = 256
+
+# Runs faster than this are repeated, the fastest one is kept
+REPEAT_UNDER = 0.1
+REPEATS = 5
+
+# Below this the timer and the interpreter noise are about the same size as the run, so
+# these points are left out of the fit
+MIN_FIT_TIME = 1e-3
+
+
+@dataclass
+class ScalePoint:
+    size: int
+    input_bytes: int
+    time: float
+    # Peak traced memory, None if not measured
+    peak: Optional[int] = None
+
+
+def fit_exponent(sizes: list[float], values: list[float]) -> Optional[float]:
+    """Least squares slope of log(value) against log(size): value ~ size^slope."""
+    points = [
+        (math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def time_exponent(points: list[ScalePoint]) -> Optional[float]:
+    timed = [p for p in points if p.time >= MIN_FIT_TIME]
+    return fit_exponent([p.size for p in timed], [p.time for p in timed])
+
+
+def memory_exponent(points: list[ScalePoint]) -> Optional[float]:
+    measured = [p for p in points if p.peak is not None]
+    return fit_exponent([p.size for p in measured], [p.peak for p in measured])
+
+
+def time_part(day_num: int, part: Part, text: str) -> float:
+    day_module = load_day(day_num)
+    times = []
+    with quiet():
+        while len(times) < REPEATS:
+            start_t = time.perf_counter()
+            run_part(day_module, part, text)
+            times.append(time.perf_counter() - start_t)
+            if times[0] >= REPEAT_UNDER:
+                break
+    return min(times)
+
+
+def scale_part(
+    day_num: int,
+    part: Part,
+    start: Optional[int] = None,
+    max_time: float = 10.0,
+    factor: int = 2,
+    seed: int = 0,
+    mem: bool = True,
+) -> Iterator[ScalePoint]:
+    """Run the part on generated inputs of growing size, until a run would be too long.
+
+    The sizes are start, start x factor, start x factor^2... The next size is skipped when
+    the exponent fitted so far says it would take longer than max_time.
+    """
+    size = start or START_SIZES.get(day_num, DEFAULT_START)
+    points: list[ScalePoint] = []
+    while True:
+        text = generate(day_num, size, seed)
+        point = ScalePoint(size, len(text), time_part(day_num, part, text))
+        if mem:
+            point.peak = measure_part(day_num, part, text, top=0).peak_traced
+        points.append(point)
+        yield point
+
+        exponent = max(time_exponent(points) or 1.0, 1.0)
+        if point.time * factor**exponent > max_time:
+            return
+        size *= factor
+
+
+def size_meaning(day_num: int) -> str:
+    """First line of the generator's docstring."""
+    doc = load_generator(day_num).generate.__doc__ or ""
+    return doc.strip().splitlines()[0] if doc.strip() else ""
+
+
+def format_exponent(exponent: Optional[float]) -> str:
+    return "n/a" if exponent is None else f"{exponent:.2f}"
+
+
+def format_point(point: ScalePoint, previous: Optional[ScalePoint]) -> str:
+    """One row of the table, with the exponent since the previous size."""
+    local_time = local_mem = None
+    if previous is not None:
+        if previous.time >= MIN_FIT_TIME:
+            local_time = fit_exponent(
+                [previous.size, point.size], [previous.time, point.time]
+            )
+        if point.peak is not None and previous.peak is not None:
+            local_mem = fit_exponent(
+                [previous.size, point.size], [previous.peak, point.peak]
+            )
+    return (
+        f"{point.size:>10} {format_bytes(point.input_bytes):>10} "
+        f"{point.time:>10.4f}s {format_bytes(point.peak):>10} "
+        f"{format_exponent(local_time):>8} {format_exponent(local_mem):>8}"
+    )
+
+
+TABLE_HEADER = (
+    f"{'size':>10} {'input':>10} {'time':>11} {'peak':>10} {'~time':>8} {'~mem':>8}"
+)
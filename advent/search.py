@@ -0,0 +1,236 @@
+"""
+Graph searches for the grid days: BFS by layers, Dijkstra, Dial and A*.
+
+The graph is a neighbors callback, states can be anything hashable. When they are ints
+in range(size), pass size and the distances and visited states are kept in lists
+instead of dicts and sets, which is a lot faster:
+
+    def neighbors(i: int) -> Iterable[tuple[int, int]]:
+        return [(n, grid.at(n)) for n in grid.nb4_idx(i)]
+
+    result = dijkstra([start], neighbors, is_goal=lambda i: i == end, size=len(grid.data))
+    result.cost, result.path()
+"""
+
+import heapq
+import itertools as it
+import math
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+S = TypeVar("S", bound=Hashable)
+
+# Neighbors of a state, with the cost of moving there
+WeightedNeighbors = Callable[[S], Iterable[tuple[S, int]]]
+
+INF = math.inf
+
+
+@dataclass
+class SearchResult(Generic[S]):
+    # Best known cost for every state reached, a list when the states are dense ints
+    dist: Union[dict[S, float], list[float]]
+    # First state for which is_goal was true, None without is_goal or if none was found
+    goal: Optional[S] = None
+    # Where the best path to each state comes from, only with_path=True
+    parents: Optional[Union[dict[S, S], list[Any]]] = None
+    # States taken out of the queue and expanded, states pushed to the queue
+    expanded: int = 0
+    pushed: int = 0
+
+    @property
+    def cost(self) -> float:
+        if self.goal is None:
+            return INF
+        return self.dist[self.goal]
+
+    def path(self, to: Optional[S] = None) -> list[S]:
+        """States from a start to `to` (the goal by default), both included."""
+        assert self.parents is not None, "Run the search with_path=True"
+        curr = self.goal if to is None else to
+        assert curr is not None
+        # The starts have no parent, they're not in the dict or None in the list
+        parents = self.parents
+        parent = parents.get if isinstance(parents, dict) else parents.__getitem__
+        path = [curr]
+        while (curr := parent(curr)) is not None:
+            path.append(curr)
+        return path[::-1]
+
+
+class Storage(Generic[S]):
+    """Distances and parents, in lists for dense int states, dicts otherwise."""
+
+    def __init__(self, size: Optional[int], with_path: bool):
+        if size is not None:
+            self.dist: Any = [INF] * size
+            self.parents: Any = [None] * size if with_path else None
+            self.get = self.dist.__getitem__
+        else:
+            self.dist = {}
+            self.parents = {} if with_path else None
+            self.get = lambda s: self.dist.get(s, INF)
+
+
+def bfs_layers(
+    starts: Iterable[S],
+    neighbors: Callable[[S], Iterable[S]],
+    max_depth: Optional[int] = None,
+    size: Optional[int] = None,
+) -> Iterator[list[S]]:
+    """The starts, then the states first reached in 1 step, 2 steps... until there's
+    nothing new or max_depth steps."""
+    layer = list(dict.fromkeys(starts))
+    if size is not None:
+        seen: Any = bytearray(size)
+        for s in layer:
+            seen[s] = 1
+    else:
+        seen = set(layer)
+
+    depth = 0
+    while layer:
+        yield layer
+        if max_depth is not None and depth >= max_depth:
+            return
+        depth += 1
+        new_layer = []
+        if size is not None:
+            for s in layer:
+                for n in neighbors(s):
+                    if not seen[n]:
+                        seen[n] = 1
+                        new_layer.append(n)
+        else:
+            for s in layer:
+                for n in neighbors(s):
+                    if n not in seen:
+                        seen.add(n)
+                        new_layer.append(n)
+        layer = new_layer
+
+
+def dijkstra(
+    starts: Iterable[S],
+    neighbors: WeightedNeighbors,
+    is_goal: Optional[Callable[[S], bool]] = None,
+    size: Optional[int] = None,
+    with_path: bool = False,
+) -> SearchResult[S]:
+    """Cheapest cost to every state, or until the cheapest goal with is_goal."""
+    return astar(starts, neighbors, None, is_goal, size, with_path)
+
+
+def astar(
+    starts: Iterable[S],
+    neighbors: WeightedNeighbors,
+    heuristic: Optional[Callable[[S], float]],
+    is_goal: Optional[Callable[[S], bool]] = None,
+    size: Optional[int] = None,
+    with_path: bool = False,
+) -> SearchResult[S]:
+    """Dijkstra guided by a heuristic that never overestimates the cost to the goal (and
+    doesn't decrease by more than the cost of a move), plain Dijkstra without one."""
+    storage: Storage[S] = Storage(size, with_path)
+    dist, parents, get = storage.dist, storage.parents, storage.get
+    h = heuristic or (lambda s: 0)
+
+    # (estimate, cost, state), dense int states compare fine but anything else gets a
+    # counter before the state so that states are never compared
+    counter = None if size is not None else it.count()
+
+    def item(cost: float, s: S) -> tuple:
+        if counter is None:
+            return cost + h(s), cost, s
+        return cost + h(s), next(counter), cost, s
+
+    heap = []
+    for s in starts:
+        dist[s] = 0
+        heap.append(item(0, s))
+    heapq.heapify(heap)
+
+    result = SearchResult(dist, parents=parents, pushed=len(heap))
+    while heap:
+        entry = heapq.heappop(heap)
+        cost, s = entry[-2], entry[-1]
+        # Stale entry, s was pushed again with a lower cost since
+        if cost > dist[s]:
+            continue
+        result.expanded += 1
+
+        if is_goal is not None and is_goal(s):
+            result.goal = s
+            return result
+
+        for n, weight in neighbors(s):
+            new_cost = cost + weight
+            if new_cost < get(n):
+                dist[n] = new_cost
+                if parents is not None:
+                    parents[n] = s
+                heapq.heappush(heap, item(new_cost, n))
+                result.pushed += 1
+
+    return result
+
+
+def dial(
+    starts: Iterable[S],
+    neighbors: WeightedNeighbors,
+    max_weight: int,
+    is_goal: Optional[Callable[[S], bool]] = None,
+    size: Optional[int] = None,
+    with_path: bool = False,
+) -> SearchResult[S]:
+    """Dijkstra for small int weights in [0, max_weight]: the queue is a ring of
+    max_weight + 1 buckets, one per cost, no heap."""
+    storage: Storage[S] = Storage(size, with_path)
+    dist, parents, get = storage.dist, storage.parents, storage.get
+
+    n_buckets = max_weight + 1
+    buckets: list[list[S]] = [[] for _ in range(n_buckets)]
+    for s in starts:
+        dist[s] = 0
+        buckets[0].append(s)
+    pending = len(buckets[0])
+
+    result = SearchResult(dist, parents=parents, pushed=pending)
+    cost = 0
+    while pending:
+        bucket = buckets[cost % n_buckets]
+        while bucket:
+            s = bucket.pop()
+            pending -= 1
+            # Stale entry, s was pushed again with a lower cost since
+            if dist[s] != cost:
+                continue
+            result.expanded += 1
+
+            if is_goal is not None and is_goal(s):
+                result.goal = s
+                return result
+
+            for n, weight in neighbors(s):
+                new_cost = cost + weight
+                if new_cost < get(n):
+                    assert weight <= max_weight
+                    dist[n] = new_cost
+                    if parents is not None:
+                        parents[n] = s
+                    buckets[new_cost % n_buckets].append(n)
+                    pending += 1
+                    result.pushed += 1
+        cost += 1
+
+    return result
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Optional
+
+from advent.client import SOCKET_PATH
+from advent.parallel import TaskResult
+from advent.runner import PARTS, available_days, load_day, quiet, run_part
+
+# Inputs come on a single line, asyncio's default of 64KiB is way too small
+MAX_LINE = 512 * 1024 * 1024
+
+
+def worker_main(conn: Connection, max_mem: Optional[int]) -> None:
+    """Worker process: import every day once, then solve jobs until the pipe closes."""
+    for day_num in available_days():
+        load_day(day_num)
+    if max_mem is not None:
+        from advent.supervisor import limit_memory
+
+        limit_memory(max_mem)
+    conn.send("ready")
+
+    while True:
+        try:
+            day_num, part, text = conn.recv()
+        except EOFError:
+            return
+        start_t = time.perf_counter()
+        try:
+            with quiet():
+                answer = run_part(load_day(day_num), part, text)
+        except MemoryError:
+            conn.send(("memory", None, time.perf_counter() - start_t))
+        except Exception as e:
+            conn.send(("error", repr(e), time.perf_counter() - start_t))
+        else:
+            conn.send(("ok", answer, time.perf_counter() - start_t))
+
+
+class Worker:
+    """A warm process, running one job at a time."""
+
+    def __init__(self, max_mem: Optional[int]):
+        ctx = multiprocessing.get_context("spawn")
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=worker_main, args=(child_conn, max_mem), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        # Blocks until every day is imported
+        self.conn.recv()
+
+    def run(self, day_num: int, part: str, text: str) -> tuple[str, Any, float]:
+        """Blocking, call it from a thread."""
+        self.conn.send((day_num, part, text))
+        return self.conn.recv()
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class Server:
+    """Solve jobs sent as JSON lines over a Unix socket, on a pool of warm workers.
+
+    A job is {"id": ..., "day": 5, "part": "first", "input": "..."}, without a part both
+    are solved. Each part gets a line back as soon as it's done, with the job id, the
+    answer, how long it took and the error if any. A connection can send many jobs,
+    their results come back in the order they finish.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        timeout: Optional[float] = None,
+        max_mem: Optional[int] = None,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_mem = max_mem
+        self.idle: asyncio.Queue[Worker] = asyncio.Queue()
+        self.all: set[Worker] = set()
+
+    async def start_worker(self) -> None:
+        worker = await asyncio.to_thread(Worker, self.max_mem)
+        self.all.add(worker)
+        self.idle.put_nowait(worker)
+
+    async def replace(self, worker: Worker) -> None:
+        """Stop a worker whose state can't be trusted anymore, and start a new one."""
+        self.all.discard(worker)
+        await asyncio.to_thread(worker.stop)
+        await self.start_worker()
+
+    async def solve(self, day_num: int, part: str, text: str) -> TaskResult:
+        worker = await self.idle.get()
+        start_t = time.perf_counter()
+        try:
+            outcome, value, elapsed = await asyncio.wait_for(
+                asyncio.to_thread(worker.run, day_num, part, text), self.timeout
+            )
+        except asyncio.TimeoutError:
+            elapsed = time.perf_counter() - start_t
+            asyncio.create_task(self.replace(worker))
+            return TaskResult(day_num, part, None, elapsed, "timeout")
+        except (EOFError, OSError):
+            elapsed = time.perf_counter() - start_t
+            asyncio.create_task(self.replace(worker))
+            return TaskResult(day_num, part, None, elapsed, "crashed")
+
+        if outcome == "memory":
+            asyncio.create_task(self.replace(worker))
+            return TaskResult(day_num, part, None, elapsed, "memory limit")
+        self.idle.put_nowait(worker)
+        if outcome == "error":
+            return TaskResult(day_num, part, None, elapsed, value)
+        return TaskResult(day_num, part, value, elapsed)
+
+    async def job(self, request: dict, part: str, respond) -> None:
+        result = await self.solve(request["day"], part, request["input"])
+        await respond({"id": request.get("id"), **result.to_dict()})
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        lock = asyncio.Lock()
+
+        async def respond(message: dict) -> None:
+            async with lock:
+                writer.write(json.dumps(message).encode() + b"\n")
+                await writer.drain()
+
+        jobs = []
+        while line := await reader.readline():
+            try:
+                request = parse_request(line)
+            except ValueError as e:
+                await respond({"error": f"invalid request: {e}"})
+                continue
+            for part in [request["part"]] if request.get("part") else PARTS:
+                jobs.append(asyncio.create_task(self.job(request, part, respond)))
+
+        await asyncio.gather(*jobs)
+        writer.close()
+        await writer.wait_closed()
+
+    async def serve(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+
+        await asyncio.gather(*(self.start_worker() for _ in range(self.workers)))
+        server = await asyncio.start_unix_server(self.handle, path, limit=MAX_LINE)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for worker in self.all:
+                worker.stop()
+            if path.exists():
+                path.unlink()
+
+
+def parse_request(line: bytes) -> dict:
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(str(e))
+    if not isinstance(request, dict):
+        raise ValueError("expected an object")
+    if not isinstance(request.get("day"), int):
+        raise ValueError("day must be an integer")
+    if request.get("part") not in (None, *PARTS):
+        raise ValueError(f"part must be one of {', '.join(PARTS)}")
+    if not isinstance(request.get("input"), str):
+        raise ValueError("input must be a string")
+    return request
+
+
+def serve(
+    path: Path = SOCKET_PATH,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> None:
+    """Serve until interrupted, SIGTERM is handled like Ctrl-C so the workers and the
+    socket are cleaned up."""
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    server = Server(workers or os.cpu_count() or 1, timeout, max_mem)
+    asyncio.run(server.serve(path))
@@ -0,0 +1,125 @@
+import multiprocessing
+import re
+import time
+from multiprocessing.connection import Connection
+from typing import Optional
+
+from advent.parallel import TaskResult
+from advent.runner import Part, load_day, quiet, run_part
+
+# How long a part gets to exit once terminated, before it's killed
+GRACE_PERIOD = 1.0
+
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_duration(s: str) -> float:
+    """'500ms', '30s', '2m', '1h' or a number of seconds."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*(ms|s|m|h)?\s*", s)
+    if m is None:
+        raise ValueError(f"Invalid duration {s!r}")
+    value, unit = m.groups()
+    return float(value) * DURATION_UNITS[unit or "s"]
+
+
+def parse_size(s: str) -> int:
+    """'512M', '2G', '2GB', '2GiB' or a number of bytes, units are powers of 1024."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*(?:([KMGT])(?:i?B)?|B)?\s*", s, re.I)
+    if m is None:
+        raise ValueError(f"Invalid size {s!r}")
+    value, unit = m.groups()
+    return int(float(value) * SIZE_UNITS[(unit or "").upper()])
+
+
+def limit_memory(max_mem: int) -> None:
+    """Cap the address space of the current process, allocations past it raise
+    MemoryError. Not available on Windows, and not enforced by macOS."""
+    import resource
+
+    resource.setrlimit(resource.RLIMIT_AS, (max_mem, max_mem))
+
+
+def child(
+    conn: Connection, day_num: int, part: Part, text: str, max_mem: Optional[int]
+) -> None:
+    """Entry point of the supervised process, sends back (outcome, value, elapsed)."""
+    day_module = load_day(day_num)
+    if max_mem is not None:
+        limit_memory(max_mem)
+    # Starting the process and importing the day don't count against the timeout
+    conn.send(("started", None, 0.0))
+
+    start_t = time.perf_counter()
+    try:
+        with quiet():
+            answer = run_part(day_module, part, text)
+    except MemoryError:
+        conn.send(("memory", None, time.perf_counter() - start_t))
+    except Exception as e:
+        conn.send(("error", repr(e), time.perf_counter() - start_t))
+    else:
+        conn.send(("ok", answer, time.perf_counter() - start_t))
+    finally:
+        conn.close()
+
+
+def stop(process: multiprocessing.process.BaseProcess) -> None:
+    process.terminate()
+    process.join(GRACE_PERIOD)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def run_supervised(
+    day_num: int,
+    part: Part,
+    text: str,
+    timeout: Optional[float] = None,
+    max_mem: Optional[int] = None,
+) -> TaskResult:
+    """Run a part in its own process, stopped if it runs for longer than `timeout`
+    seconds or uses more than `max_mem` bytes.
+
+    The result always comes back: when the part was stopped the error says why, and
+    elapsed is how long it ran for.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    reader, writer = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=child, args=(writer, day_num, part, text, max_mem), daemon=True
+    )
+    process.start()
+    # Only the child writes, closing our end lets us see it dying
+    writer.close()
+
+    try:
+        started, start_t = False, time.perf_counter()
+        try:
+            reader.recv()
+            started, start_t = True, time.perf_counter()
+            if not reader.poll(timeout):
+                stop(process)
+                elapsed = time.perf_counter() - start_t
+                return TaskResult(day_num, part, None, elapsed, "timeout")
+            outcome, value, elapsed = reader.recv()
+        except EOFError:
+            process.join()
+            where = "" if started else " before starting"
+            return TaskResult(
+                day_num,
+                part,
+                None,
+                time.perf_counter() - start_t,
+                f"crashed{where} (exit code {process.exitcode})",
+            )
+    finally:
+        reader.close()
+
+    process.join()
+    if outcome == "ok":
+        return TaskResult(day_num, part, value, elapsed)
+    if outcome == "memory":
+        return TaskResult(day_num, part, None, elapsed, "memory limit")
+    return TaskResult(day_num, part, None, elapsed, value)
@@ -0,0 +1,95 @@
+import json
+import platform
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from advent.runner import DAYS_PACKAGE_ENV
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "performance regression gate")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmark tests against the real inputs.",
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="Record the medians as this machine's baseline instead of checking them.",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="How much slower than the baseline a part can get, 0.25 = 25%% (default).",
+    )
+    group.addoption(
+        "--bench-runs",
+        type=int,
+        default=5,
+        help="Timed runs per part, parts slower than a second only run once (default 5).",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing test, only runs with --benchmark"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark") or config.getoption("--update-baselines"):
+        return
+    skip = pytest.mark.skip(reason="needs --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def machine_id() -> str:
+    """Baselines are only comparable on the same machine and interpreter."""
+    node = re.sub(r"[^\w.-]", "_", platform.node().split(".")[0]) or "unknown"
+    return f"{node}-{platform.machine()}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+class Baselines:
+    path: Path
+    medians: dict[str, float]
+    updated: bool
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.medians = json.loads(path.read_text()) if path.is_file() else {}
+        self.updated = False
+
+    def get(self, key: str) -> Optional[float]:
+        return self.medians.get(key)
+
+    def set(self, key: str, median: float) -> None:
+        self.medians[key] = median
+        self.updated = True
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.medians, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    b = Baselines(BASELINES_DIR / f"{machine_id()}.json")
+    yield b
+    if b.updated:
+        b.save()
+
+
+@pytest.fixture
+def stub_days(monkeypatch):
+    """Load the days from tests/stub_days, in this process and the ones it starts."""
+    monkeypatch.setenv(DAYS_PACKAGE_ENV, "stub_days")
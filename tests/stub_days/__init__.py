@@ -0,0 +1,4 @@
+"""
+Days with a known cost, independent of how fast the real solutions are. Set
+ADVENT_DAYS_PACKAGE=stub_days to load them instead of advent.days.
+"""
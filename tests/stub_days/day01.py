@@ -0,0 +1,9 @@
+from typing import TextIO
+
+
+def first(input: TextIO) -> int:
+    return len(input.read().splitlines())
+
+
+def second(input: TextIO) -> int:
+    return len(input.read())
@@ -0,0 +1,12 @@
+import threading
+from typing import TextIO
+
+
+def first(input: TextIO) -> int:
+    return len(input.read().splitlines())
+
+
+def second(input: TextIO) -> int:
+    # Never returns, it has to be stopped
+    threading.Event().wait()
+    return 0
@@ -0,0 +1,12 @@
+from typing import TextIO
+
+# More than any memory limit of the tests
+ALLOCATION = 1024**3
+
+
+def first(input: TextIO) -> int:
+    return len(input.read().splitlines())
+
+
+def second(input: TextIO) -> int:
+    return len(bytearray(ALLOCATION))
@@ -0,0 +1,50 @@
+import pytest
+
+import advent.days.day03
+from advent.batch import input_files, run_batch, solve_file
+from advent.utils import get_data_for_day
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    (tmp_path / "real.txt").write_text(get_data_for_day(2).read())
+    (tmp_path / "small.txt").write_text("Game 1: 3 blue, 4 red; 1 red, 2 green\n")
+    (tmp_path / "bad.txt").write_text("not a game\n")
+    (tmp_path / ".hidden").write_text("")
+    return tmp_path
+
+
+def test_input_files(inputs):
+    assert [p.name for p in input_files(inputs)] == ["bad.txt", "real.txt", "small.txt"]
+
+
+@pytest.mark.parametrize("timeout", [None, 30.0])
+def test_run_batch(inputs, timeout):
+    lines = list(run_batch(2, input_files(inputs), jobs=2, timeout=timeout))
+    by_name = {line["input"].rsplit("/", 1)[-1]: line for line in lines}
+    assert sorted(by_name) == ["bad.txt", "real.txt", "small.txt"]
+
+    assert by_name["real.txt"]["first"]["answer"] == 2476
+    assert by_name["real.txt"]["second"]["answer"] == 54911
+    assert by_name["small.txt"]["first"] == {
+        "answer": 1,
+        "elapsed": by_name["small.txt"]["first"]["elapsed"],
+        "error": None,
+    }
+    assert by_name["bad.txt"]["first"]["answer"] is None
+    assert "ValueError" in by_name["bad.txt"]["first"]["error"]
+
+
+def test_solve_file_parses_once(tmp_path, monkeypatch):
+    path = tmp_path / "day03.txt"
+    path.write_text("467..114..\n...*......\n..35..633.\n")
+    calls = []
+    parse = advent.days.day03.parse
+    monkeypatch.setattr(
+        advent.days.day03, "parse", lambda text: calls.append(text) or parse(text)
+    )
+
+    line = solve_file(3, path, None, None)
+    assert len(calls) == 1
+    assert line["first"]["answer"] == 467 + 35
+    assert line["second"]["answer"] == 467 * 35
@@ -0,0 +1,24 @@
+from advent.bench import bench_part, percentile, summarize
+from advent.utils import get_data_for_day
+
+
+def test_percentile():
+    times = [float(i) for i in range(1, 101)]
+    assert percentile(times, 95) == 95.0
+    assert percentile(times, 100) == 100.0
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_summarize():
+    stats = summarize([1.0, 2.0, 3.0, 4.0])
+    assert stats["min"] == 1.0
+    assert stats["median"] == 2.5
+    assert stats["p95"] == 4.0
+    assert stats["ops_per_sec"] == 0.4
+
+
+def test_bench_part():
+    result = bench_part(6, "first", get_data_for_day(6).read(), runs=3, warmup=0)
+    assert result.answer == 2612736
+    assert len(result.times) == 3
+    assert result.to_dict()["stats"]["min"] == min(result.times)
@@ -0,0 +1,86 @@
+import statistics
+
+import pytest
+
+from advent.bench import bench_part
+from advent.runner import PARTS, Part, available_days, load_day
+from advent.utils import get_data_for_day
+
+# Hard per-part limits in seconds, on top of the baseline comparison. They are meant to
+# catch complexity regressions (a print in a hot loop, a quadratic scan...), not noise
+# or a slower machine: each one is 5x the part's median in
+# tests/baselines/vm-x86_64-py311.json, rounded up to the next 0.1s, 0.1s at least.
+BUDGETS: dict[tuple[int, Part], float] = {
+    (3, "first"): 0.2,
+    (3, "second"): 0.1,
+    (7, "second"): 1.5,
+    (10, "second"): 0.7,
+    (11, "first"): 1.3,
+    (11, "second"): 1.4,
+    (12, "second"): 5.1,
+    (14, "second"): 9.4,
+    (16, "first"): 0.1,
+    (16, "second"): 6.1,
+    (17, "first"): 0.9,
+    (17, "second"): 1.8,
+    (20, "second"): 3.4,
+    (21, "second"): 1.0,
+}
+
+# Parts slower than this are only timed once
+SLOW = 1.0
+
+# Timer and scheduling noise, sub-millisecond parts can easily double from one run to the next
+NOISE = 0.002
+
+
+def clear_caches(day_num: int) -> None:
+    """Forget what the day memoized (day 12's solve_rec), so every run starts cold."""
+    for value in vars(load_day(day_num)).values():
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+
+
+def median_time(day_num: int, part: Part, runs: int) -> float:
+    text = get_data_for_day(day_num).read()
+    clear_caches(day_num)
+    times = bench_part(day_num, part, text, runs=1, warmup=0).times
+    while times[0] < SLOW and len(times) < runs:
+        clear_caches(day_num)
+        times += bench_part(day_num, part, text, runs=1, warmup=0).times
+    return statistics.median(times)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "day_num, part",
+    [(d, p) for d in available_days() for p in PARTS],
+    ids=lambda v: f"day{v:02}" if isinstance(v, int) else v,
+)
+def test_benchmark(day_num: int, part: Part, baselines, pytestconfig):
+    key = f"day{day_num:02}.{part}"
+    median = median_time(day_num, part, pytestconfig.getoption("--bench-runs"))
+
+    updating = pytestconfig.getoption("--update-baselines")
+    if updating:
+        baselines.set(key, median)
+
+    budget = BUDGETS.get((day_num, part))
+    if budget is not None:
+        assert median <= budget, f"{key} took {median:.3f}s, budget is {budget}s"
+
+    if updating:
+        return
+
+    baseline = baselines.get(key)
+    if baseline is None:
+        # On a new machine the budget is the whole gate
+        if budget is None:
+            pytest.skip(f"No baseline nor budget for {key}, run --update-baselines")
+        return
+
+    tolerance = pytestconfig.getoption("--bench-tolerance")
+    limit = baseline * (1 + tolerance) + NOISE
+    assert (
+        median <= limit
+    ), f"{key} took {median:.3f}s, baseline is {baseline:.3f}s (+{tolerance:.0%})"
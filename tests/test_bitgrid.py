@@ -0,0 +1,61 @@
+import pytest
+
+from advent.bitgrid import BitGrid
+from advent.matrix import Matrix
+
+data = """#..#.
+.#...
+...##"""
+
+
+def set_coords(matrix: Matrix) -> set:
+    return {c for c, v in matrix.items() if v == "#"}
+
+
+def test_from_string():
+    grid = BitGrid.from_string(data)
+    assert str(grid) == data
+    assert grid.rows() == [0b01001, 0b00010, 0b11000]
+    assert grid.cols() == [1, 2, 0, 5, 4]
+    assert grid.popcount() == 5
+    assert grid[0, 3] and not grid[1, 3]
+    assert BitGrid.from_string(data, ".") == ~grid
+
+
+def test_transpose():
+    grid = BitGrid.from_string(data)
+    assert (grid.transpose().width, grid.transpose().height) == (3, 5)
+    assert grid.transpose().transpose() == grid
+    assert set(grid.transpose().coords()) == {(c, r) for r, c in grid.coords()}
+
+
+@pytest.mark.parametrize("d_row", [-2, -1, 0, 1, 2])
+@pytest.mark.parametrize("d_col", [-4, -1, 0, 1, 4])
+def test_shift(d_row, d_col):
+    matrix = Matrix.from_string(data)
+    moved = {(r + d_row, c + d_col) for r, c in set_coords(matrix)}
+    expected = {c for c in moved if matrix.is_valid_coord(c)}
+    assert set(BitGrid.from_string(data).shift(d_row, d_col).coords()) == expected
+
+
+def test_dilate():
+    matrix = Matrix.from_string(data)
+    grid = BitGrid.from_string(data)
+    cells = set_coords(matrix)
+    assert set(grid.dilate().coords()) == cells | {
+        n for c in cells for n in matrix.nbc4(c)
+    }
+    assert set(grid.dilate(include_diagonals=True).coords()) == cells | {
+        n for c in cells for n in matrix.nbc8(c)
+    }
+
+
+def test_set_and_ops():
+    grid = BitGrid.from_coords([(0, 0)], 5, 3)
+    grid[2, 2] = True
+    other = BitGrid.from_string(data)
+    assert set((grid & other).coords()) == {(0, 0)}
+    assert (grid | other).popcount() == 6
+    assert set((grid ^ other).coords()) == set(other.coords()) - {(0, 0)} | {(2, 2)}
+    grid[0, 0] = False
+    assert list(grid.coords()) == [(2, 2)]
@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+import advent
+from advent.cache import Cache, source_files
+from advent.runner import load_day
+
+
+def test_get_set(tmp_path):
+    cache = Cache(tmp_path)
+    key = cache.answer_key(1, "first", "input", "source")
+    assert cache.get(key) == (False, None)
+
+    cache.set(key, 42)
+    assert cache.get(key) == (True, 42)
+
+    # Another input or another version of the module is another entry
+    assert cache.get(cache.answer_key(1, "first", "input", "other")) == (False, None)
+    assert cache.get(cache.answer_key(1, "second", "input", "source")) == (False, None)
+
+
+def test_corrupted_entry(tmp_path):
+    cache = Cache(tmp_path)
+    key = cache.parsed_key(1, "input", "source")
+    cache.path(key).write_bytes(b"not a pickle")
+    assert cache.get(key) == (False, None)
+    assert not cache.path(key).exists()
+
+
+def test_lru_eviction(tmp_path):
+    cache = Cache(tmp_path, max_size=13_000)
+    keys = [cache.parsed_key(i, "input", "source") for i in range(1, 4)]
+    for i, key in enumerate(keys):
+        cache.set(key, "x" * 4000)
+        os.utime(cache.path(key), (i, i))
+
+    # Touch the oldest, the second one is now the least recently used
+    cache.get(keys[0])
+    cache.set(cache.parsed_key(4, "input", "source"), "x" * 4000)
+
+    assert cache.get(keys[0])[0]
+    assert not cache.get(keys[1])[0]
+    assert cache.size() <= 13_000
+
+
+def test_source_files():
+    package = Path(advent.__file__).parent
+    files = source_files(load_day(21))
+    assert package / "days" / "day21.py" in files
+    for name in ["matrix.py", "bitgrid.py", "utils.py", "search.py"]:
+        assert package / name in files
+    assert len(files) == len(set(files))
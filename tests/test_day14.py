@@ -1,6 +1,13 @@
 import io
 
-from advent.days.day14 import Reflector, first, second
+from advent.days.day14 import (
+    Reflector,
+    first,
+    first_parsed,
+    parse,
+    second,
+    second_parsed,
+)
 from advent.utils import get_data_for_day
 
 data = """O....#....
@@ -58,6 +65,13 @@ def test_second():
     assert second(io.StringIO(data)) == 64
 
 
+def test_parsed_is_shared():
+    reflector = parse(data)
+    assert first_parsed(reflector) == 136
+    assert second_parsed(reflector) == 64
+    assert str(reflector) == str(Reflector.from_string(data))
+
+
 def test_second_data():
     for i in [1000000000]:
         print(second(get_data_for_day(14), i))
@@ -1,6 +1,6 @@
 import io
 
-from advent.days.day20 import Modules, first, parse_input, second
+from advent.days.day20 import Modules, first, first_parsed, parse, parse_input, second
 from advent.utils import get_data_for_day
 
 data11 = """broadcaster -> a, b, c
@@ -27,6 +27,12 @@ def test_first():
     assert first(io.StringIO(data12)) == 11687500
 
 
+def test_parsed_is_shared():
+    modules = parse(data12)
+    assert first_parsed(modules) == 11687500
+    assert first_parsed(modules) == 11687500
+
+
 def test_second():
     assert second(io.StringIO(data12)) == 0
 
@@ -60,6 +60,11 @@ def test_how_many_visitable():
         print(e, count_reachable(g, 260, ec))
 
 
+def test_how_many_visitable_blocked_corner():
+    assert how_many_visitable(Garden.from_string("#..\n.S#\n#.#")) == 5
+    assert how_many_visitable(Garden.from_string("#.#\n#S#\n###")) == 2
+
+
 def test_first():
     assert first(io.StringIO(data), 6) == 16
 
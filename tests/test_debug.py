@@ -0,0 +1,31 @@
+import pytest
+
+from advent import debug as debug_module
+from advent.debug import debug, enabled, set_verbosity
+
+
+@pytest.fixture(autouse=True)
+def reset_verbosity():
+    yield
+    set_verbosity(0)
+
+
+def test_debug_disabled(capsys):
+    calls = []
+    debug(lambda: calls.append(1) or "rendered")
+    debug("%d", 1, level=1)
+
+    assert calls == []
+    assert capsys.readouterr() == ("", "")
+    assert not enabled()
+
+
+def test_debug_levels(capsys):
+    set_verbosity(1)
+    debug("found %d", 42)
+    debug(lambda: "rendered")
+    debug("every step", level=2)
+
+    assert capsys.readouterr() == ("", "found 42\nrendered\n")
+    assert enabled(1) and not enabled(2)
+    assert debug_module.verbosity == 1
@@ -0,0 +1,414 @@
+import io
+import itertools
+import math
+import random
+import re
+from collections import deque
+
+import pytest
+
+from advent.days import day13, day18
+from advent.days.day03 import SYMBOLS
+from advent.days.day07 import CARDS
+from advent.gen import generate
+from advent.gen.day10 import grow_loop
+from advent.gen.day13 import reflections
+from advent.matrix import get_delta_dir
+from advent.runner import PARTS, available_days, load_day, quiet, run_part
+
+# Small sizes, so every generator runs quickly
+SIZES = {10: 12, 12: 10, 20: 6, 21: 21}
+
+# day14 second relies on the cycle of the real input and day21 second only supports
+# the real garden
+UNSUPPORTED = {(14, "second"), (21, "second")}
+
+
+@pytest.mark.parametrize("day_num", available_days())
+def test_generate_deterministic(day_num):
+    size = SIZES.get(day_num, 20)
+    assert generate(day_num, size, seed=1) == generate(day_num, size, seed=1)
+    assert generate(day_num, size, seed=1) != generate(day_num, size, seed=2)
+
+
+@pytest.mark.parametrize(
+    "day_num, part",
+    [(d, p) for d in available_days() for p in PARTS if (d, p) not in UNSUPPORTED],
+)
+def test_generated_input_solves(day_num, part):
+    text = generate(day_num, SIZES.get(day_num, 20))
+    with quiet():
+        answer = run_part(load_day(day_num), part, text)
+    assert answer is not None
+
+
+def test_day08_loops():
+    from advent.days import day08
+
+    text = generate(8, 5)
+    # The first loop is a multiple of the instructions length
+    assert day08.first(io.StringIO(text)) % 5 == 0
+
+
+@pytest.mark.parametrize("size", [3, 12, 41])
+def test_day10_loop_encloses_tiles(size):
+    for seed in range(5):
+        following = grow_loop(random.Random(seed), size)
+        loop = [next(iter(following))]
+        while len(loop) < len(following):
+            loop.append(following[loop[-1]])
+        assert following[loop[-1]] == loop[0]
+        assert all(0 <= x < size for tile in loop for x in tile)
+
+        # Shoelace formula then Pick's theorem for the tiles inside
+        area = sum(a[0] * b[1] - b[0] * a[1] for a, b in zip(loop, loop[1:] + loop[:1]))
+        inside = abs(area) // 2 - len(loop) // 2 + 1
+        assert inside > 0
+
+
+def test_day13_one_reflection_each():
+    for rows, cols in day13.parse(generate(13, 50)):
+        assert len(reflections(rows, False) + reflections(cols, False)) == 1
+        assert len(reflections(rows, True) + reflections(cols, True)) == 1
+
+
+@pytest.mark.parametrize("part_2", [False, True])
+def test_day18_simple_polygon(part_2):
+    text = generate(18, 30)
+    plan = day18.parse_input(io.StringIO(text), part_2)
+
+    # Shoelace formula + the half of the trench outside of it
+    row = col = area = perimeter = 0
+    for instruction in plan:
+        dr, dc = get_delta_dir(instruction.direction)
+        new_row = row + dr * instruction.count
+        new_col = col + dc * instruction.count
+        area += row * new_col - new_row * col
+        perimeter += instruction.count
+        row, col = new_row, new_col
+    assert (row, col) == (0, 0)
+
+    expected = abs(area) // 2 + perimeter // 2 + 1
+    _, hsegs, _ = day18.instruction_to_vertices(plan)
+    with quiet():
+        assert day18.count(hsegs) == expected
+
+
+def test_day01_digits():
+    from advent.days import day01
+
+    text = generate(1, 50)
+    digits = [re.findall(r"\d", line) for line in text.splitlines()]
+    assert all(digits)
+    expected = sum(int(d[0] + d[-1]) for d in digits)
+    assert day01.first(io.StringIO(text)) == expected
+
+
+def test_day02_minimum_bags():
+    from advent.days import day02
+
+    text = generate(2, 30)
+    expected = 0
+    for i, line in enumerate(text.splitlines(), 1):
+        assert line.startswith(f"Game {i}: ")
+        cubes = re.findall(r"(\d+) (\w+)", line)
+        expected += math.prod(
+            max((int(n) for n, c in cubes if c == color), default=0)
+            for color in ["red", "green", "blue"]
+        )
+    assert day02.second(io.StringIO(text)) == expected
+
+
+def test_day03_part_numbers():
+    from advent.days import day03
+
+    text = generate(3, 30)
+    rows = text.splitlines()
+
+    def is_symbol(r, c):
+        return 0 <= r < len(rows) and 0 <= c < len(rows[r]) and rows[r][c] in SYMBOLS
+
+    expected = 0
+    for r, row in enumerate(rows):
+        for m in re.finditer(r"\d+", row):
+            assert not m.group().startswith("0")
+            around = [
+                (r + dr, c)
+                for dr in (-1, 0, 1)
+                for c in range(m.start() - 1, m.end() + 1)
+            ]
+            if any(is_symbol(*rc) for rc in around):
+                expected += int(m.group())
+    assert day03.first(io.StringIO(text)) == expected
+
+
+def test_day04_wins_within_table():
+    from advent.days import day04
+
+    text = generate(4, 30)
+    lines = text.splitlines()
+    copies = [1] * len(lines)
+    for i, line in enumerate(lines):
+        winning, numbers = (set(s.split()) for s in line.split(": ")[1].split(" | "))
+        matches = len(winning & numbers)
+        assert i + matches < len(lines)
+        for j in range(i + 1, i + 1 + matches):
+            copies[j] += copies[i]
+    assert day04.second(io.StringIO(text)) == sum(copies)
+
+
+def test_day05_maps_one_to_one():
+    from advent.days import day05
+
+    text = generate(5, 10)
+    blocks = text.strip().split("\n\n")
+    seeds = [int(n) for n in blocks[0].split(": ")[1].split()]
+    maps = [
+        [tuple(map(int, l.split())) for l in b.splitlines()[1:]] for b in blocks[1:]
+    ]
+
+    for entries in maps:
+        sources = sorted((s, s + n) for _, s, n in entries)
+        destinations = sorted((d, d + n) for d, _, n in entries)
+        assert all(a[1] == b[0] for a, b in zip(sources, sources[1:]))
+        assert (sources[0][0], sources[-1][1]) == (
+            destinations[0][0],
+            destinations[-1][1],
+        )
+
+    def location(n):
+        for entries in maps:
+            n = next((d + n - s for d, s, k in entries if s <= n < s + k), n)
+        return n
+
+    assert day05.first(io.StringIO(text)) == min(map(location, seeds))
+
+
+def test_day06_races_can_be_won():
+    from advent.days import day06
+
+    text = generate(6, 2)
+    times, distances = ([int(n) for n in l.split()[1:]] for l in text.splitlines())
+    races = list(zip(times, distances))
+    races.append((int("".join(map(str, times))), int("".join(map(str, distances)))))
+    for time, distance in races:
+        ways = sum(1 for hold in range(time + 1) if hold * (time - hold) > distance)
+        assert ways > 0
+        assert day06.how_many_ways((time, distance)) == ways
+
+
+def test_day07_unique_hands():
+    text = generate(7, 200)
+    hands = [line.split()[0] for line in text.splitlines()]
+    assert len(set(hands)) == len(hands)
+    assert all(len(h) == 5 and set(h) <= set(CARDS) for h in hands)
+
+
+def test_day09_extrapolates():
+    from advent.days import day09
+
+    text = generate(9, 30)
+    sequences = [list(map(int, line.split())) for line in text.splitlines()]
+
+    # Lagrange interpolation of the polynomial through the points, at len(s) and -1
+    def after(s):
+        n = len(s)
+        return sum((-1) ** (n - 1 - k) * math.comb(n, k) * v for k, v in enumerate(s))
+
+    def before(s):
+        n = len(s)
+        return sum((-1) ** k * math.comb(n, k + 1) * v for k, v in enumerate(s))
+
+    assert day09.first(io.StringIO(text)) == sum(map(after, sequences))
+    assert day09.second(io.StringIO(text)) == sum(map(before, sequences))
+
+
+def test_day11_expanded_distances():
+    from advent.days import day11
+
+    text = generate(11, 20)
+    rows = text.splitlines()
+    galaxies = [
+        (r, c) for r, row in enumerate(rows) for c, x in enumerate(row) if x == "#"
+    ]
+    assert len(galaxies) == 20
+    empty_rows = [r for r, row in enumerate(rows) if "#" not in row]
+    empty_cols = [c for c in range(len(rows[0])) if all(row[c] == "." for row in rows)]
+    assert empty_rows and empty_cols
+
+    def distance(a, b, expansion):
+        extra = sum(min(a[0], b[0]) < r < max(a[0], b[0]) for r in empty_rows)
+        extra += sum(min(a[1], b[1]) < c < max(a[1], b[1]) for c in empty_cols)
+        return abs(a[0] - b[0]) + abs(a[1] - b[1]) + extra * (expansion - 1)
+
+    pairs = list(itertools.combinations(galaxies, 2))
+    assert day11.first(io.StringIO(text)) == sum(distance(a, b, 2) for a, b in pairs)
+    assert day11.second(io.StringIO(text), 10) == sum(
+        distance(a, b, 10) for a, b in pairs
+    )
+
+
+def test_day12_arrangements():
+    from advent.days import day12
+
+    text = generate(12, 6)
+    expected = 0
+    for line in text.splitlines():
+        springs, s_groups = line.split()
+        groups = list(map(int, s_groups.split(",")))
+        unknowns = [i for i, s in enumerate(springs) if s == "?"]
+        count = 0
+        for values in itertools.product("#.", repeat=len(unknowns)):
+            filled = list(springs)
+            for i, v in zip(unknowns, values):
+                filled[i] = v
+            count += [len(g) for g in "".join(filled).split(".") if g] == groups
+        assert count > 0
+        expected += count
+    assert day12.first(io.StringIO(text)) == expected
+
+
+def test_day14_north_load():
+    from advent.days import day14
+
+    text = generate(14, 20)
+    rows = text.splitlines()
+    expected = 0
+    for c in range(len(rows[0])):
+        top = 0
+        for r, row in enumerate(rows):
+            if row[c] == "#":
+                top = r + 1
+            elif row[c] == "O":
+                expected += len(rows) - top
+                top += 1
+    assert day14.first(io.StringIO(text)) == expected
+
+
+def test_day15_boxes():
+    from advent.days import day15
+
+    text = generate(15, 100)
+
+    def hhash(s):
+        h = 0
+        for char in s:
+            h = (h + ord(char)) * 17 % 256
+        return h
+
+    boxes: list[dict[str, int]] = [{} for _ in range(256)]
+    for step in text.strip().split(","):
+        label, focal = re.fullmatch(r"(\w+)[-=](\d?)", step).groups()
+        if focal:
+            boxes[hhash(label)][label] = int(focal)
+        else:
+            boxes[hhash(label)].pop(label, None)
+    expected = sum(
+        (b + 1) * (slot + 1) * focal
+        for b, box in enumerate(boxes)
+        for slot, focal in enumerate(box.values())
+    )
+    assert day15.first(io.StringIO(text)) == sum(map(hhash, text.strip().split(",")))
+    assert day15.second(io.StringIO(text)) == expected
+
+
+def test_day16_energized_bounds():
+    text = generate(16, 20)
+    contraption = load_day(16).parse(text)
+    first = load_day(16).first_parsed(contraption)
+    assert 1 <= first <= load_day(16).second_parsed(contraption) <= 20 * 20
+
+
+@pytest.mark.parametrize("part", PARTS)
+def test_day17_heat_loss_bounds(part):
+    text = generate(17, 20)
+    with quiet():
+        loss = run_part(load_day(17), part, text)
+    # At least 1 per block of a shortest path, at most 9 per block of a staircase one
+    assert 2 * 19 <= loss <= 9 * 2 * 19
+
+
+def test_day19_workflow_tree():
+    from advent.days import day19
+
+    text = generate(19, 30)
+    s_workflows, s_parts = text.strip().split("\n\n")
+    workflows = {}
+    for line in s_workflows.splitlines():
+        name, rules = re.fullmatch(r"(\w+)\{(.*)\}", line).groups()
+        workflows[name] = rules.split(",")
+
+    targets = [r.split(":")[-1] for rules in workflows.values() for r in rules]
+    assert sorted(t for t in targets if t not in "AR") == sorted(
+        set(workflows) - {"in"}
+    )
+
+    def accepted(part):
+        name = "in"
+        while name not in "AR":
+            for r in workflows[name]:
+                if ":" not in r:
+                    name = r
+                    break
+                condition, target = r.split(":")
+                value = part[condition[0]]
+                limit = int(condition[2:])
+                if value < limit if condition[1] == "<" else value > limit:
+                    name = target
+                    break
+        return name == "A"
+
+    parts = [
+        {k: int(v) for k, v in re.findall(r"(\w)=(\d+)", line)}
+        for line in s_parts.splitlines()
+    ]
+    expected = sum(sum(p.values()) for p in parts if accepted(p))
+    assert day19.first(io.StringIO(text)) == expected
+    assert 0 < day19.second(io.StringIO(text)) < 4000**4
+
+
+def test_day20_counter_periods():
+    from advent.days import day20
+    from advent.gen.day20 import INVERTERS
+
+    text = generate(20, 4)
+    destinations = {}
+    for line in text.splitlines():
+        name, s_dests = line.split(" -> ")
+        destinations[name.lstrip("%&")] = s_dests.split(", ")
+
+    flip_flops = {l[1:].split(" -> ")[0] for l in text.splitlines() if l[0] == "%"}
+
+    expected = 1
+    for start in destinations["broadcaster"]:
+        chain = [start]
+        while following := [d for d in destinations[chain[-1]] if d in flip_flops]:
+            chain += following
+        (hub,) = {d for f in chain for d in destinations[f]} - flip_flops
+        assert set(destinations[hub]) & set(INVERTERS)
+        expected *= sum(2**i for i, f in enumerate(chain) if hub in destinations[f])
+    assert day20.second(io.StringIO(text)) == expected
+
+
+def test_day21_reachable():
+    from advent.days import day21
+
+    text = generate(21, 21)
+    rows = text.splitlines()
+    middle = len(rows) // 2
+    assert rows[middle][middle] == "S"
+
+    distances = {(middle, middle): 0}
+    queue = deque(distances)
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in [(r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)]:
+            if 0 <= nr < len(rows) and 0 <= nc < len(rows) and rows[nr][nc] != "#":
+                if (nr, nc) not in distances:
+                    distances[nr, nc] = distances[r, c] + 1
+                    queue.append((nr, nc))
+    assert len(distances) == text.count(".") + 1
+
+    steps = middle - 1
+    expected = sum(d <= steps and d % 2 == steps % 2 for d in distances.values())
+    assert day21.first(io.StringIO(text), steps) == expected
@@ -0,0 +1,19 @@
+from advent.importtime import ImportTime, measure_imports, parse_importtime
+
+output = """import time: self [us] | cumulative | imported package
+import time:       389 |       3812 |   advent.runner
+import time:       457 |      25513 |   click
+import time:      1239 |      52849 | advent.cli"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(output) == [
+        ImportTime("advent.runner", 389, 3812, 1),
+        ImportTime("click", 457, 25513, 1),
+        ImportTime("advent.cli", 1239, 52849, 0),
+    ]
+
+
+def test_measure_imports():
+    times = measure_imports(["advent.days.day01"])
+    assert [t.module for t in times if t.depth == 0][-1] == "advent.days.day01"
@@ -0,0 +1,291 @@
+import pickle
+from array import array
+
+import pytest
+
+from advent.matrix import ChunkedGrid, Matrix
+from advent.runner import load_day
+
+data = """abcd
+efgh
+ijkl"""
+
+
+def test_flat_index():
+    m = Matrix.from_string(data)
+    for coord in m.all_coords():
+        i = m.idx(*coord)
+        assert m.coord(i) == coord
+        assert m.at(i) == m[coord]
+        assert [m.coord(n) for n in m.nb4_idx(i)] == m.nbc4(coord)
+        assert [m.coord(n) for n in m.nb8_idx(i)] == m.nbc8(coord)
+
+
+def test_adjacency_shared_by_shape():
+    m1, m2 = Matrix.from_string(data), Matrix.from_string(data.upper())
+    assert m1.nb4_idx(5) is m2.nb4_idx(5)
+    assert [m1.at(n) for n in m1.nb4_idx(0)] == ["e", "b"]
+
+
+def test_padding():
+    m = Matrix.from_string(data)
+    padded = Matrix.from_string(data, pad=2, pad_value="#")
+    assert (padded.width, padded.height) == (m.width, m.height)
+    assert str(padded) == str(padded.copy()) == str(m)
+    assert list(padded.items()) == list(m.items())
+    assert padded.get_row(1) == m.get_row(1)
+    assert padded.get_col(3) == m.get_col(3)
+
+    for coord in m.all_coords():
+        i = padded.idx(*coord)
+        assert padded.coord(i) == coord
+        assert padded.at(i) == m[coord]
+        assert [padded.coord(n) for n in padded.nb8_idx(i)] == m.nbc8(coord)
+
+    # Walking right from the last column hits the sentinels
+    i = padded.idx(0, 3) + padded.delta_idx(0, 1)
+    assert padded.at(i) == padded.at(i + 1) == "#"
+    assert padded.nb4_idx(i) == ()
+
+
+def test_views():
+    m = Matrix.from_string(data)
+    assert str(m.view()) == data
+    assert str(m.transpose()) == "aei\nbfj\ncgk\ndhl"
+    assert str(m.rot90()) == "iea\njfb\nkgc\nlhd"
+    assert str(m.rot90(2)) == "lkji\nhgfe\ndcba"
+    assert str(m.rot90(-1)) == str(m.rot90(3)) == "dhl\ncgk\nbfj\naei"
+    assert str(m.view().flip_rows()) == "ijkl\nefgh\nabcd"
+    assert str(m.subgrid(1, 1, 2, 2).transpose()) == "fj\ngk"
+    assert m.row_view(1).line(0) == m.get_row(1)
+    assert m.col_view(2).transpose().line(0) == m.get_col(2)
+    assert str(m.rot90().to_matrix()) == str(m.rot90())
+
+
+def test_views_write_through():
+    m = Matrix.from_string(data, pad=1, pad_value="#")
+    view = m.rot90()
+    view[0, 0] = "X"
+    assert m[2, 0] == "X"
+
+    # Reversed column, down to the first cell of the data
+    column = m.transpose().flip_cols()
+    assert column.line(0) == ["X", "e", "a"]
+    column.set_line(0, ["1", "2", "3"])
+    assert m.get_col(0) == ["3", "2", "1"]
+    assert str(m).splitlines()[0] == "3bcd"
+    assert m.data[0] == "#"
+
+
+regions = """..#..
+.##.#
+#..#.
+..##."""
+
+
+def test_label_components():
+    m = Matrix.from_string(regions, pad=1, pad_value="#")
+    components = m.label_components(lambda v: v == ".")
+    assert len(components) == 4
+    assert components.sizes == [3, 3, 4, 2]
+    assert components.labels[m.idx(0, 3)] == components.labels[m.idx(1, 3)] == 1
+    assert components.labels[m.idx(0, 2)] == components.labels[0] == -1
+    assert sorted(m.coord(i) for i in components.cells(3)) == [(2, 4), (3, 4)]
+
+
+def test_flood_fill():
+    m = Matrix.from_string(regions)
+    components = m.label_components(lambda v: v == ".")
+    for coord in m.all_coords():
+        fill = m.flood_fill(coord, lambda v: v == ".")
+        if m[coord] == "#":
+            assert len(fill) == 0
+            continue
+        label = components.labels[m.idx(*coord)]
+        assert fill.sizes == [components.sizes[label]]
+        assert list(fill.cells(0)) == list(components.cells(label))
+
+
+def test_label_components_merges_late():
+    # The two arms only meet on the last row
+    m = Matrix.from_string("#.#.#\n#.#.#\n#...#")
+    components = m.label_components(lambda v: v == ".")
+    assert components.sizes == [7]
+    assert m.flood_fill((0, 3), lambda v: v == ".").sizes == [7]
+
+
+def test_chunked_grid():
+    grid = ChunkedGrid(".", tile_height=4, tile_width=4)
+    assert grid[-1000, 1000] == "."
+    assert grid.tiles == {}
+
+    grid[-1, -1] = "#"
+    grid[5, 2] = "#"
+    grid[6, 3] = "#"
+    assert grid[-1, -1] == grid[5, 2] == "#"
+    assert grid[-1, 0] == "."
+    assert sorted(grid.tiles) == [(-1, -1), (1, 0)]
+    assert sorted(grid.items()) == [((-1, -1), "#"), ((5, 2), "#"), ((6, 3), "#")]
+    assert grid.bounds() == ((-1, -1), (6, 3))
+
+
+def test_chunked_grid_repeat():
+    m = Matrix.from_string(data)
+    grid = ChunkedGrid.repeat(m)
+    assert grid[0, 0] == grid[3, 4] == grid[-3, -4] == "a"
+    assert grid[-1, -1] == "l"
+    assert "".join(grid[-2, col] for col in range(-2, 6)) == "ghefghef"
+
+    # Written tiles are copies, the matrix and the other tiles don't change
+    grid[4, 5] = "X"
+    assert grid[4, 5] == "X"
+    assert grid[1, 1] == grid[1, 5] == m[1, 1] == "f"
+    assert list(grid.tiles) == [(1, 1)]
+
+    padded = ChunkedGrid.repeat(Matrix.from_string(data, pad=1, pad_value="#"))
+    assert padded[-1, -1] == "l"
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, mmap):
+    path = tmp_path / "grid.bin"
+    m = Matrix.from_string(data, pad=1, pad_value="#")
+    m.save(path)
+
+    loaded = Matrix.load(path, mmap=mmap)
+    assert (loaded.width, loaded.height, loaded.pad) == (4, 3, 1)
+    assert str(loaded) == data
+    assert loaded.get_col(1) == ["b", "f", "j"]
+    assert loaded.at(0) == "#"
+    assert str(loaded.transpose()) == str(m.transpose())
+
+    assert str(loaded.copy()) == data
+    loaded[1, 1] = "X"
+    assert loaded[1, 1] == "X"
+    # Writes don't go to the file
+    assert str(Matrix.load(path)) == data
+
+
+def test_save_load_ints(tmp_path):
+    for cells, itemsize in [([0, 9, -3, 5], 1), ([1, 2, 3, 70000], 4)]:
+        path = tmp_path / "ints.bin"
+        Matrix(cells, 2, 2).save(path)
+        assert path.stat().st_size == 24 + 4 * itemsize
+
+        with Matrix.load(path) as loaded:
+            assert [loaded[c] for c in loaded.all_coords()] == cells
+        assert Matrix.load(path, mmap=False).data == cells
+
+
+def test_load_ints_views(tmp_path):
+    path = tmp_path / "ints.bin"
+    m = Matrix.from_string("123\n456", int, pad=1, pad_value=0)
+    m.save(path)
+
+    with Matrix.load(path) as loaded:
+        assert loaded.get_row(1) == [4, 5, 6]
+        assert loaded.get_col(2) == [3, 6]
+        assert type(loaded.get_row(0)) is list
+        assert list(loaded.rot90().lines()) == [[4, 1], [5, 2], [6, 3]]
+
+        view = loaded.transpose()
+        view.set_line(0, [7, 8])
+        view.flip_cols().set_line(2, [9, 10])
+        assert str(loaded) == "7210\n859"
+        assert loaded.at(0) == 0
+    # The file didn't change, and the closed matrix can't be read
+    with pytest.raises(ValueError):
+        loaded.at(0)
+    assert str(Matrix.load(path)) == str(m)
+
+
+def test_save_errors(tmp_path):
+    with pytest.raises(ValueError):
+        Matrix(["ab", "c"], 2, 1).save(tmp_path / "bad.bin")
+
+    path = tmp_path / "not_a_matrix.bin"
+    path.write_bytes(b"x" * 32)
+    with pytest.raises(ValueError):
+        Matrix.load(path)
+
+
+def test_storage():
+    as_list = Matrix.from_string(data, pad=1, pad_value="#")
+    as_bytes = Matrix.from_string(data, pad=1, pad_value="#", storage="bytes")
+    assert list(as_bytes.data) == as_list.data
+    assert str(as_bytes) == data
+    assert as_bytes.get_row(1) == ["e", "f", "g", "h"]
+    copy = as_bytes.copy()
+    as_bytes[0, 0] = "X"
+    assert str(copy) == data
+    assert as_bytes.at(as_bytes.idx(0, 0)) == "X"
+    assert as_bytes.label_components(lambda v: v != "#").sizes == [12]
+
+
+def test_storage_digits(tmp_path):
+    text = "1234\n5678\n9012"
+    m = Matrix.from_string(text, storage="digits")
+    assert m.data == array("b", [1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 1, 2])
+    assert m.data.itemsize == 1
+    assert m[1, 2] == 7
+    assert sum(m.at(n) for n in m.nb4_idx(m.idx(1, 1))) == 2 + 5 + 7 + 0
+
+    padded = Matrix.from_string(text, pad=1, pad_value=9, storage="digits")
+    assert padded.at(0) == 9
+    assert padded.copy().data == padded.data
+    assert padded.copy().data is not padded.data
+    assert [padded[c] for c in padded.all_coords()] == list(m.data)
+
+    m.save(tmp_path / "digits.bin")
+    assert Matrix.load(tmp_path / "digits.bin")[2, 0] == 9
+
+    with pytest.raises(ValueError):
+        Matrix.from_string("12\n3a", storage="digits")
+    with pytest.raises(ValueError):
+        Matrix.from_string("12\n345")
+
+
+def test_slots():
+    m = Matrix.from_string(data)
+    assert not hasattr(m, "__dict__")
+    assert not hasattr(m.view(), "__dict__")
+
+
+@pytest.mark.parametrize("day_num", [3, 14, 16, 17, 21])
+def test_day_matrices_slots(day_num):
+    day = load_day(day_num)
+    grid = day.parse("1234\n5S78\n9012" if day_num != 17 else "1234\n5678")
+    assert isinstance(grid, Matrix)
+    assert not hasattr(grid, "__dict__")
+    copy = pickle.loads(pickle.dumps(grid))
+    assert str(copy) == str(grid)
+
+
+@pytest.mark.parametrize(
+    "storage, fn, pad_value",
+    [("list", int, 0), ("bytes", None, "0"), ("digits", None, 0)],
+)
+def test_storage_views(storage, fn, pad_value):
+    text = "1234\n5678\n9012"
+    # Same cells in a plain list
+    m = Matrix.from_string(text, int if pad_value == 0 else None, 1, pad_value)
+    compact = Matrix.from_string(text, fn, 1, pad_value, storage=storage)
+
+    assert compact.get_row(1) == m.get_row(1)
+    assert compact.get_col(2) == m.get_col(2)
+    assert type(compact.get_row(1)) is list
+    for view, expected in [
+        (compact.rot90(), m.rot90()),
+        (compact.transpose(), m.transpose()),
+    ]:
+        assert list(view.lines()) == list(expected.lines())
+        assert all(type(line) is list for line in view.lines())
+
+    # Write every line back reversed through a flipped view
+    for matrix in (m, compact):
+        view = matrix.transpose().flip_cols()
+        for row in range(view.height):
+            view.set_line(row, view.line(row)[::-1])
+    # Reversing the columns turned the grid upside down
+    assert [str(v) for v in compact.get_col(0)] == ["9", "5", "1"]
+    assert str(compact) == str(m) == "9012\n5678\n1234"
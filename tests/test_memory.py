@@ -0,0 +1,17 @@
+from advent.memory import format_bytes, measure_part
+from advent.utils import get_data_for_day
+
+
+def test_format_bytes():
+    assert format_bytes(None) == "n/a"
+    assert format_bytes(512) == "512.0B"
+    assert format_bytes(3 * 1024 * 1024) == "3.0MiB"
+    assert format_bytes(5 * 1024**3) == "5.0GiB"
+
+
+def test_measure_part():
+    report = measure_part(11, "first", get_data_for_day(11).read())
+    assert report.answer == 9599070
+    assert report.peak_traced > 0
+    assert report.max_rss is None or report.max_rss > report.peak_traced
+    assert report.to_dict()["part"] == "first"
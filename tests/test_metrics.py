@@ -0,0 +1,47 @@
+import io
+
+from advent import metrics
+from advent.days import day12, day17
+
+
+def test_disabled_records_nothing():
+    metrics.incr("a")
+    metrics.gauge("b", 1)
+    metrics.observe("c", 1)
+    assert metrics.snapshot() == {"counters": {}, "gauges": {}, "histograms": {}}
+
+
+def test_collecting():
+    with metrics.collecting() as recorded:
+        metrics.incr("a")
+        metrics.incr("a", 2)
+        metrics.gauge("b", 1)
+        metrics.gauge("b", 5)
+        metrics.observe("c", 1)
+        metrics.observe("c", 3)
+        assert recorded == {}
+
+    assert recorded["counters"] == {"a": 3}
+    assert recorded["gauges"] == {"b": 5}
+    assert recorded["histograms"]["c"] == {
+        "count": 2,
+        "min": 1,
+        "max": 3,
+        "mean": 2.0,
+        "total": 4,
+    }
+    assert not metrics.enabled
+    assert metrics.snapshot()["counters"] == {}
+    assert "a" in metrics.format_metrics(recorded)
+
+
+def test_day_metrics():
+    with metrics.collecting() as recorded:
+        day12.first(io.StringIO("???.### 1,1,3\n.??..??...?##. 1,1,3"))
+    assert recorded["counters"]["day12.rows_solved"] == 2
+
+    city = day17.parse("2413\n3215\n3255")
+    with metrics.collecting() as recorded:
+        day17.first_parsed(city)
+    counters = recorded["counters"]
+    assert counters["day17.queue_pushes"] >= counters["day17.nodes_expanded"] > 0
@@ -0,0 +1,73 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from advent.matrix import Matrix
+from advent.npmatrix import NumpyMatrix
+
+data = """#.#
+..#
+.##"""
+
+
+def test_from_string_like_matrix():
+    grid = NumpyMatrix.from_string(data)
+    matrix = Matrix.from_string(data)
+    assert (grid.width, grid.height) == (3, 3)
+    assert grid.data == matrix.data
+    assert list(grid.items()) == list(matrix.items())
+    assert grid.nbc8((0, 0)) == matrix.nbc8((0, 0))
+    assert grid.get_col(2) == matrix.get_col(2)
+    assert str(grid) == str(matrix)
+    with pytest.raises(IndexError):
+        grid[-1, 0]
+
+
+def test_from_string_digits():
+    grid = NumpyMatrix.from_string("123\n456\n", int)
+    assert grid[1, 2] == 6
+    assert grid.array.sum(axis=0).tolist() == [5, 7, 9]
+
+
+def test_masks():
+    grid = NumpyMatrix.from_string(data)
+    rocks = grid == "#"
+    assert rocks.sum() == 5
+    assert (
+        grid.argwhere("#")
+        == grid.argwhere(rocks)
+        == [
+            (0, 0),
+            (0, 2),
+            (1, 2),
+            (2, 1),
+            (2, 2),
+        ]
+    )
+    assert grid.count_neighbors(rocks)[1, 1] == 2
+    assert grid.count_neighbors(rocks, include_diagonals=True)[1, 1] == 5
+
+
+def test_shift():
+    grid = NumpyMatrix.from_string("12\n34", int)
+    assert grid.shift(1, 0, 0).tolist() == [[3, 4], [0, 0]]
+    assert grid.shift(0, -1, 0).tolist() == [[0, 1], [0, 3]]
+
+
+def test_from_string_ragged():
+    with pytest.raises(ValueError):
+        NumpyMatrix.from_string("##\n#\n")
+
+
+def test_from_string_crlf():
+    grid = NumpyMatrix.from_string("#.\r\n.#\r\n")
+    assert (grid.width, grid.height) == (2, 2)
+    assert grid.data == Matrix.from_string("#.\r\n.#\r\n").data
+    assert NumpyMatrix.from_string("12\r\n34", int).data == [1, 2, 3, 4]
+
+
+def test_from_string_non_ascii():
+    grid = NumpyMatrix.from_string("é.\n.█\n")
+    assert (grid.width, grid.height) == (2, 2)
+    assert grid.data == ["é", ".", ".", "█"]
+    assert grid.argwhere("█") == [(1, 1)]
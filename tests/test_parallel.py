@@ -0,0 +1,39 @@
+from advent.parallel import run_all, schedule
+from advent.utils import get_data_for_day
+
+
+def test_schedule():
+    tasks = [(1, "first"), (3, "first"), (3, "second"), (5, "first")]
+    history = {"day01.first": 0.1, "day03.first": 2.0, "day03.second": 0.5}
+    assert schedule(tasks, history) == [
+        (5, "first"),
+        (3, "first"),
+        (3, "second"),
+        (1, "first"),
+    ]
+
+
+def test_run_all_in_day_order(monkeypatch, tmp_path):
+    monkeypatch.setattr("advent.parallel.HISTORY_FILE", tmp_path / "timings.json")
+    results = list(run_all(2, [6, 1]))
+    assert [(r.day, r.part) for r in results] == [
+        (6, "first"),
+        (6, "second"),
+        (1, "first"),
+        (1, "second"),
+    ]
+    assert results[0].answer == 2612736
+    assert (tmp_path / "timings.json").is_file()
+
+
+def test_run_all_keeps_going_after_timeout(monkeypatch, tmp_path, stub_days):
+    monkeypatch.setattr("advent.parallel.HISTORY_FILE", tmp_path / "timings.json")
+    # Stub day 2 part 2 never returns
+    results = list(run_all(2, [2, 1], timeout=1))
+    assert [(r.day, r.part, r.error) for r in results] == [
+        (2, "first", None),
+        (2, "second", "timeout"),
+        (1, "first", None),
+        (1, "second", None),
+    ]
+    assert results[3].answer == len(get_data_for_day(1).read())
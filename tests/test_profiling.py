@@ -0,0 +1,34 @@
+from advent.profiling import collapsed_stacks, profile_part, report, write_profile
+from advent.runner import load_day, parse
+
+data = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598.."""
+
+
+def test_profile_part(tmp_path):
+    day_module = load_day(3)
+    answer, stats = profile_part(day_module, "first", parse(day_module, data))
+    assert answer == 4361
+    # Ordered by cumulative time, the part itself is always at the top
+    top = report(stats, 5).splitlines()
+    assert any("day03.py" in line and "(first_parsed)" in line for line in top)
+
+    stacks = collapsed_stacks(stats)
+    assert any(
+        "first_parsed (day03.py" in s and s.split(";")[-1].startswith("expand_part")
+        for s in stacks
+    )
+    # Every sample is "frame;frame;... <microseconds>"
+    assert all(int(s.rsplit(" ", 1)[1]) > 0 for s in stacks)
+
+    paths = write_profile(stats, tmp_path, "day03.first")
+    assert [p.name for p in paths] == ["day03.first.prof", "day03.first.collapsed.txt"]
+    assert all(p.is_file() for p in paths)
@@ -0,0 +1,31 @@
+import pytest
+
+from advent.scale import ScalePoint, fit_exponent, scale_part, time_exponent
+
+
+def test_fit_exponent():
+    sizes = [10, 20, 40, 80]
+    assert fit_exponent(sizes, [3 * s**2 for s in sizes]) == pytest.approx(2)
+    assert fit_exponent(sizes, [5.0] * 4) == pytest.approx(0)
+    assert fit_exponent([10], [1.0]) is None
+    assert fit_exponent([10, 10], [1.0, 2.0]) is None
+
+
+def test_time_exponent_skips_noise():
+    points = [
+        ScalePoint(10, 0, 1e-5),
+        ScalePoint(20, 0, 0.01),
+        ScalePoint(40, 0, 0.02),
+        ScalePoint(80, 0, 0.04),
+    ]
+    assert time_exponent(points) == pytest.approx(1)
+
+
+def test_scale_part():
+    points = list(scale_part(2, "first", start=10, max_time=0.01, mem=False))
+    assert [p.size for p in points] == [10 * 2**i for i in range(len(points))]
+    assert all(p.peak is None for p in points)
+    # It stops once the next size would take too long, going by the fitted exponent
+    exponent = max(time_exponent(points) or 1.0, 1.0)
+    assert points[-1].time * 2**exponent > 0.01
+    assert all(p.time * 2 <= 0.01 for p in points[:-1])
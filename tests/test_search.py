@@ -0,0 +1,89 @@
+import pytest
+
+from advent.matrix import Coord, Matrix, manhattan_distance
+from advent.search import astar, bfs_layers, dial, dijkstra
+
+data = """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+
+grid = Matrix.from_string(data, int)
+start, end = 0, grid.idx(grid.height - 1, grid.width - 1)
+
+
+def neighbors(i: int) -> list[tuple[int, int]]:
+    return [(n, grid.at(n)) for n in grid.nb4_idx(i)]
+
+
+def coord_neighbors(c: Coord) -> list[tuple[Coord, int]]:
+    return [(n, grid[n]) for n in grid.nbc4(c)]
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        lambda **kw: dijkstra([start], neighbors, **kw),
+        lambda **kw: dial([start], neighbors, 9, **kw),
+        lambda **kw: astar(
+            [start],
+            neighbors,
+            lambda i: manhattan_distance(grid.coord(i), grid.coord(end)),
+            **kw,
+        ),
+    ],
+    ids=["dijkstra", "dial", "astar"],
+)
+@pytest.mark.parametrize("size", [None, len(grid.data)], ids=["dict", "list"])
+def test_cheapest_path(search, size):
+    result = search(is_goal=lambda i: i == end, size=size, with_path=True)
+    assert result.cost == 40
+    path = result.path()
+    assert path[0] == start and path[-1] == end
+    assert sum(grid.at(i) for i in path[1:]) == 40
+    assert result.expanded <= result.pushed
+
+
+def test_dijkstra_all_states():
+    result = dijkstra([(0, 0)], coord_neighbors)
+    assert result.goal is None
+    assert len(result.dist) == len(grid.data)
+    assert result.dist[grid.height - 1, grid.width - 1] == 40
+
+
+def test_astar_expands_less():
+    goal = lambda i: i == end
+    plain = dijkstra([start], neighbors, goal, size=len(grid.data))
+    guided = astar(
+        [start],
+        neighbors,
+        lambda i: manhattan_distance(grid.coord(i), grid.coord(end)),
+        goal,
+        size=len(grid.data),
+    )
+    assert guided.cost == plain.cost
+    assert guided.expanded <= plain.expanded
+
+
+def test_not_found():
+    result = dial([start], neighbors, 9, is_goal=lambda i: False)
+    assert result.goal is None
+    assert result.cost == float("inf")
+
+
+@pytest.mark.parametrize("size", [None, len(grid.data)])
+def test_bfs_layers(size):
+    def nb(i: int) -> tuple[int, ...]:
+        return grid.nb4_idx(i)
+
+    layers = list(bfs_layers([start], nb, size=size))
+    assert [len(layer) for layer in layers[:3]] == [1, 2, 3]
+    assert len(layers) == grid.width + grid.height - 1
+    assert sum(len(layer) for layer in layers) == len(grid.data)
+    assert len(list(bfs_layers([start], nb, max_depth=2, size=size))) == 3
@@ -0,0 +1,78 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pytest
+
+from advent.client import submit
+from advent.runner import DAYS_PACKAGE_ENV
+from advent.utils import get_data_for_day
+
+
+def serve(path: Path, env: Optional[dict[str, str]] = None) -> Iterator[Path]:
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "from advent.cli import cli; cli()"]
+        + ["serve", "--socket", str(path), "--workers", "2", "--timeout", "1s"],
+        stdout=subprocess.DEVNULL,
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while not path.exists():
+        assert proc.poll() is None and time.monotonic() < deadline
+        time.sleep(0.05)
+
+    yield path
+
+    proc.terminate()
+    assert proc.wait(10) is not None
+    assert not path.exists()
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    yield from serve(tmp_path_factory.mktemp("serve") / "advent.sock")
+
+
+@pytest.fixture(scope="module")
+def stub_server(tmp_path_factory):
+    """Serving the days of tests/stub_days."""
+    tests_dir = str(Path(__file__).parent)
+    pythonpath = os.pathsep.join(
+        filter(None, [tests_dir, os.environ.get("PYTHONPATH")])
+    )
+    env = {**os.environ, DAYS_PACKAGE_ENV: "stub_days", "PYTHONPATH": pythonpath}
+    yield from serve(tmp_path_factory.mktemp("serve") / "advent.sock", env)
+
+
+def test_solve(server):
+    results = list(submit(server, 2, get_data_for_day(2).read(), job_id=1))
+    assert sorted((r["part"], r["answer"], r["id"]) for r in results) == [
+        ("first", 2476, 1),
+        ("second", 54911, 1),
+    ]
+
+
+def test_timeout_and_recover(stub_server):
+    # Stub day 2 part 2 never returns
+    [result] = submit(stub_server, 2, "", "second")
+    assert result["error"] == "timeout"
+    assert result["elapsed"] >= 1
+
+    # The worker stuck on day 2 gets replaced
+    for _ in range(3):
+        [result] = submit(stub_server, 1, "a\nb\nc", "first")
+        assert result["answer"] == 3
+
+
+def test_invalid_request(server):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server))
+        sock.sendall(b'{"day": "five"}\n')
+        sock.shutdown(socket.SHUT_WR)
+        response = json.loads(sock.makefile("rb").readline())
+    assert response["error"].startswith("invalid request")
@@ -0,0 +1,50 @@
+import pytest
+
+from advent.supervisor import parse_duration, parse_size, run_supervised
+from advent.utils import get_data_for_day
+
+
+def test_parse_duration():
+    assert parse_duration("30s") == 30
+    assert parse_duration("2m") == 120
+    assert parse_duration("500ms") == 0.5
+    assert parse_duration("1.5") == 1.5
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+
+
+def test_parse_size():
+    assert parse_size("2G") == 2 * 1024**3
+    assert parse_size("512M") == 512 * 1024**2
+    assert parse_size("1gib") == 1024**3
+    assert parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_run_supervised():
+    result = run_supervised(2, "first", get_data_for_day(2).read(), timeout=30)
+    assert result.answer == 2476
+    assert result.error is None
+
+
+def test_run_supervised_error():
+    result = run_supervised(2, "first", "not a game\n")
+    assert result.answer is None
+    assert "ValueError" in result.error
+
+
+def test_run_supervised_timeout(stub_days):
+    # Stub day 2 part 2 never returns
+    result = run_supervised(2, "second", "", timeout=0.2)
+    assert result.error == "timeout"
+    assert 0.2 <= result.elapsed < 2
+
+
+def test_run_supervised_memory_limit(stub_days):
+    # Stub day 3 part 2 allocates 1GiB at once
+    result = run_supervised(3, "second", "", timeout=60, max_mem=256 * 1024**2)
+    assert result.error == "memory limit"
+
+    result = run_supervised(3, "first", "a\nb", timeout=60, max_mem=256 * 1024**2)
+    assert result.answer == 2